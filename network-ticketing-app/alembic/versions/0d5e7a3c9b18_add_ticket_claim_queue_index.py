@@ -0,0 +1,32 @@
+"""Add the index the engineer claim queue walks
+
+Revision ID: 0d5e7a3c9b18
+Revises: f6b2c8d1a7e4
+Create Date: 2026-10-19 10:41:05.286913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d5e7a3c9b18'
+down_revision: Union[str, Sequence[str], None] = 'f6b2c8d1a7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # /tickets/tickets/next: status = new, unassigned, one priority, earliest due first
+    op.create_index(
+        'ix_tickets_status_assigned_to_priority_due_date', 'tickets',
+        ['status', 'assigned_to', 'priority', 'due_date'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_status_assigned_to_priority_due_date', table_name='tickets')
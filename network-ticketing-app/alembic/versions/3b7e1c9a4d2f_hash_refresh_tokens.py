@@ -0,0 +1,49 @@
+"""Store refresh tokens as SHA-256 digests
+
+Revision ID: 3b7e1c9a4d2f
+Revises: 644d586ea8dd
+Create Date: 2026-10-18 10:12:41.518230
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e1c9a4d2f'
+down_revision: Union[str, Sequence[str], None] = '644d586ea8dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.String(length=64), nullable=True))
+
+    # Backfill digests for tokens that are already stored in clear text
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, token FROM refresh_tokens")).fetchall()
+    for row in rows:
+        conn.execute(
+            sa.text("UPDATE refresh_tokens SET token_hash = :token_hash WHERE id = :id"),
+            {"token_hash": hashlib.sha256(row.token.encode("utf-8")).hexdigest(), "id": row.id}
+        )
+
+    op.alter_column('refresh_tokens', 'token_hash', existing_type=sa.String(length=64), nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_token_hash'), 'refresh_tokens', ['token_hash'], unique=True)
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+    op.drop_column('refresh_tokens', 'token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Digests cannot be turned back into tokens, so existing sessions are dropped
+    op.execute("DELETE FROM refresh_tokens")
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(length=512), nullable=False))
+    op.create_unique_constraint('token', 'refresh_tokens', ['token'])
+    op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens')
+    op.drop_index(op.f('ix_refresh_tokens_token_hash'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'token_hash')
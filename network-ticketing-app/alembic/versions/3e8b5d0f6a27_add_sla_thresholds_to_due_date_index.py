@@ -0,0 +1,34 @@
+"""Carry the SLA thresholds in the due_date index for the dashboard color filter
+
+Revision ID: 3e8b5d0f6a27
+Revises: 7a1f4c2e9d30
+Create Date: 2026-10-19 14:26:11.804952
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b5d0f6a27'
+down_revision: Union[str, Sequence[str], None] = '7a1f4c2e9d30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same (due_date, ticket_id) order as ix_tickets_due_date, which it replaces; ?color= is now checked on the index entry
+    op.create_index(
+        'ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at', 'tickets',
+        ['due_date', 'ticket_id', 'sla_critical_at', 'sla_warning_at'], unique=False
+    )
+    op.drop_index('ix_tickets_due_date', table_name='tickets')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_tickets_due_date', 'tickets', ['due_date'], unique=False)
+    op.drop_index('ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at', table_name='tickets')
@@ -0,0 +1,28 @@
+"""Add a version column to tickets for optimistic concurrency
+
+Revision ID: 5e92b7d4c1a8
+Revises: d41a7e0c5b92
+Create Date: 2026-10-18 16:02:09.274513
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e92b7d4c1a8'
+down_revision: Union[str, Sequence[str], None] = 'd41a7e0c5b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tickets', 'version')
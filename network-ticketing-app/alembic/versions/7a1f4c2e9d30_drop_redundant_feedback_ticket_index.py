@@ -0,0 +1,29 @@
+"""Drop the feedback ticket_id index the timeline index makes redundant
+
+Revision ID: 7a1f4c2e9d30
+Revises: 0d5e7a3c9b18
+Create Date: 2026-10-19 13:02:48.519664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1f4c2e9d30'
+down_revision: Union[str, Sequence[str], None] = '0d5e7a3c9b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ticket_id leads ix_feedback_ticket_id_feedback_time, which also backs the foreign key
+    op.drop_index(op.f('ix_feedback_ticket_id'), table_name='feedback')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_feedback_ticket_id'), 'feedback', ['ticket_id'], unique=False)
@@ -0,0 +1,44 @@
+"""Add indexes for the hot ticket, address and feedback queries
+
+Revision ID: 8c4f2a61d9e3
+Revises: 3b7e1c9a4d2f
+Create Date: 2026-10-18 11:03:17.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4f2a61d9e3'
+down_revision: Union[str, Sequence[str], None] = '3b7e1c9a4d2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # TicketRepository.get_tickets_by_assignee
+    op.create_index('ix_tickets_assigned_to_status', 'tickets', ['assigned_to', 'status'], unique=False)
+    # TicketRepository.list_by_user
+    op.create_index('ix_tickets_created_by_created_at', 'tickets', ['created_by', 'created_at'], unique=False)
+    # TicketRepository.get_classified_tickets
+    op.create_index('ix_tickets_status_assigned_to_priority_severity', 'tickets', ['status', 'assigned_to', 'priority', 'severity'], unique=False)
+    # TicketRepository.get_tickets_without_sla / SLARepository.get_tickets_with_sla_for_agent
+    op.create_index('ix_tickets_sla_id_due_date', 'tickets', ['sla_id', 'due_date'], unique=False)
+    op.create_index('ix_tickets_due_date', 'tickets', ['due_date'], unique=False)
+    op.create_index(op.f('ix_address_user_id'), 'address', ['user_id'], unique=False)
+    op.create_index(op.f('ix_feedback_ticket_id'), 'feedback', ['ticket_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_feedback_ticket_id'), table_name='feedback')
+    op.drop_index(op.f('ix_address_user_id'), table_name='address')
+    op.drop_index('ix_tickets_due_date', table_name='tickets')
+    op.drop_index('ix_tickets_sla_id_due_date', table_name='tickets')
+    op.drop_index('ix_tickets_status_assigned_to_priority_severity', table_name='tickets')
+    op.drop_index('ix_tickets_created_by_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_assigned_to_status', table_name='tickets')
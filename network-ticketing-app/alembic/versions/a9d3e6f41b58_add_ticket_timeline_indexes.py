@@ -0,0 +1,42 @@
+"""Add (ticket_id, time) indexes for the ticket timeline
+
+Revision ID: a9d3e6f41b58
+Revises: c4a81f5e2d97
+Create Date: 2026-10-18 21:40:52.318467
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e6f41b58'
+down_revision: Union[str, Sequence[str], None] = 'c4a81f5e2d97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_action_log_table() -> bool:
+    # ticket_action_logs is created by Base.metadata.create_all, not by an earlier revision
+    return sa.inspect(op.get_bind()).has_table('ticket_action_logs')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # TicketRepository.timeline_statement
+    op.create_index('ix_assignments_ticket_id_assigned_at', 'assignments', ['ticket_id', 'assigned_at'], unique=False)
+    op.create_index('ix_feedback_ticket_id_feedback_time', 'feedback', ['ticket_id', 'feedback_time'], unique=False)
+    if _has_action_log_table():
+        op.create_index(
+            'ix_ticket_action_logs_ticket_id_action_time', 'ticket_action_logs', ['ticket_id', 'action_time'], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_action_log_table():
+        op.drop_index('ix_ticket_action_logs_ticket_id_action_time', table_name='ticket_action_logs')
+    op.drop_index('ix_feedback_ticket_id_feedback_time', table_name='feedback')
+    op.drop_index('ix_assignments_ticket_id_assigned_at', table_name='assignments')
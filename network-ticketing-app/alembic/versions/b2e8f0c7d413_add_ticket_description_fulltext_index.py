@@ -0,0 +1,39 @@
+"""Add a FULLTEXT index on ticket descriptions for ticket search (MySQL only)
+
+Revision ID: b2e8f0c7d413
+Revises: a9d3e6f41b58
+Create Date: 2026-10-18 23:05:11.604928
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e8f0c7d413'
+down_revision: Union[str, Sequence[str], None] = 'a9d3e6f41b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _is_mysql() -> bool:
+    # Other databases search with the in-process index (app.utils.ticket_search)
+    return op.get_bind().dialect.name in ('mysql', 'mariadb')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _is_mysql():
+        # TicketRepository.fulltext_search_statement
+        op.create_index(
+            'ix_tickets_issue_description_fulltext', 'tickets', ['issue_description'], unique=False,
+            mysql_prefix='FULLTEXT'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _is_mysql():
+        op.drop_index('ix_tickets_issue_description_fulltext', table_name='tickets')
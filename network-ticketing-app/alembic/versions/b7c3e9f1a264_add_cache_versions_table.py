@@ -0,0 +1,34 @@
+"""Add cache_versions table for cross-worker cache invalidation
+
+Revision ID: b7c3e9f1a264
+Revises: 5e92b7d4c1a8
+Create Date: 2026-10-18 16:48:52.106733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c3e9f1a264'
+down_revision: Union[str, Sequence[str], None] = '5e92b7d4c1a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    cache_versions = op.create_table('cache_versions',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(cache_versions, [{'name': 'sla', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_versions')
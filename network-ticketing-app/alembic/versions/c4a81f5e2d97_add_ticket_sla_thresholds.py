@@ -0,0 +1,71 @@
+"""Add SLA warning/critical timestamps to tickets for the SLA status color filters
+
+Revision ID: c4a81f5e2d97
+Revises: e58a1d7c3f06
+Create Date: 2026-10-18 19:12:37.806214
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a81f5e2d97'
+down_revision: Union[str, Sequence[str], None] = 'e58a1d7c3f06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in step with app.utils.sla_thresholds at the time of this revision
+SLA_WARNING_FRACTION = 0.6
+SLA_CRITICAL_FRACTION = 0.9
+BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tickets', sa.Column('sla_warning_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('tickets', sa.Column('sla_critical_at', sa.TIMESTAMP(), nullable=True))
+    op.create_index('ix_tickets_sla_warning_at', 'tickets', ['sla_warning_at'], unique=False)
+    op.create_index('ix_tickets_sla_critical_at', 'tickets', ['sla_critical_at'], unique=False)
+
+    # Backfill classified tickets; computed in Python so the same revision runs on MySQL and SQLite
+    tickets = sa.table(
+        'tickets',
+        sa.column('ticket_id', sa.Integer),
+        sa.column('created_at', sa.TIMESTAMP),
+        sa.column('due_date', sa.TIMESTAMP),
+        sa.column('sla_warning_at', sa.TIMESTAMP),
+        sa.column('sla_critical_at', sa.TIMESTAMP),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(tickets.c.ticket_id, tickets.c.created_at, tickets.c.due_date)
+        .where(tickets.c.due_date.isnot(None))
+    ).all()
+
+    statement = (
+        tickets.update()
+        .where(tickets.c.ticket_id == sa.bindparam('b_ticket_id'))
+        .values(sla_warning_at=sa.bindparam('b_warning_at'), sla_critical_at=sa.bindparam('b_critical_at'))
+    )
+    params = []
+    for ticket_id, created_at, due_date in rows:
+        window = max((due_date - created_at).total_seconds(), 0)
+        params.append({
+            'b_ticket_id': ticket_id,
+            'b_warning_at': created_at + timedelta(seconds=int(window * SLA_WARNING_FRACTION)),
+            'b_critical_at': created_at + timedelta(seconds=int(window * SLA_CRITICAL_FRACTION)),
+        })
+    for start in range(0, len(params), BACKFILL_BATCH):
+        bind.execute(statement, params[start:start + BACKFILL_BATCH])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickets_sla_critical_at', table_name='tickets')
+    op.drop_index('ix_tickets_sla_warning_at', table_name='tickets')
+    op.drop_column('tickets', 'sla_critical_at')
+    op.drop_column('tickets', 'sla_warning_at')
@@ -0,0 +1,43 @@
+"""Add indexes backing the keyset pagination sort orders
+
+Revision ID: d41a7e0c5b92
+Revises: 8c4f2a61d9e3
+Create Date: 2026-10-18 14:26:41.518320
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a7e0c5b92'
+down_revision: Union[str, Sequence[str], None] = '8c4f2a61d9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # /tickets/agent/all?sort=created_at
+    op.create_index('ix_tickets_created_at', 'tickets', ['created_at'], unique=False)
+    # /tickets/tickets/unclassified
+    op.create_index('ix_tickets_sla_id_created_at', 'tickets', ['sla_id', 'created_at'], unique=False)
+    # /tickets/tickets/classified
+    op.create_index('ix_tickets_status_assigned_to_created_at', 'tickets', ['status', 'assigned_to', 'created_at'], unique=False)
+    # /tickets/tickets/assigned
+    op.create_index('ix_tickets_assigned_to_created_at', 'tickets', ['assigned_to', 'created_at'], unique=False)
+    op.create_index('ix_tickets_assigned_to_due_date', 'tickets', ['assigned_to', 'due_date'], unique=False)
+    # /user/users?sort=created_at
+    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_created_at'), table_name='users')
+    op.drop_index('ix_tickets_assigned_to_due_date', table_name='tickets')
+    op.drop_index('ix_tickets_assigned_to_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_status_assigned_to_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_sla_id_created_at', table_name='tickets')
+    op.drop_index('ix_tickets_created_at', table_name='tickets')
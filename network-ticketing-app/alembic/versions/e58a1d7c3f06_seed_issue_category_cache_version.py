@@ -0,0 +1,29 @@
+"""Seed the cache_versions row for the issue category catalog
+
+Revision ID: e58a1d7c3f06
+Revises: b7c3e9f1a264
+Create Date: 2026-10-18 17:20:14.842150
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e58a1d7c3f06'
+down_revision: Union[str, Sequence[str], None] = 'b7c3e9f1a264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    cache_versions = sa.table('cache_versions', sa.column('name', sa.String), sa.column('version', sa.Integer))
+    op.bulk_insert(cache_versions, [{'name': 'issue_categories', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM cache_versions WHERE name = 'issue_categories'")
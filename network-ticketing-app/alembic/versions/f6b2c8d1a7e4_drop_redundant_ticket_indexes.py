@@ -0,0 +1,48 @@
+"""Drop ticket indexes that no query needs
+
+Revision ID: f6b2c8d1a7e4
+Revises: b2e8f0c7d413
+Create Date: 2026-10-19 09:12:37.415206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2c8d1a7e4'
+down_revision: Union[str, Sequence[str], None] = 'b2e8f0c7d413'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# name -> columns; every one is covered by an index kept in app/models/ticket.py
+DROPPED_INDEXES = {
+    # assigned_to lookups use ix_tickets_assigned_to_created_at / _due_date, which also back the FK
+    'ix_tickets_assigned_to_status': ['assigned_to', 'status'],
+    # Same (status, assigned_to) prefix as ix_tickets_status_assigned_to_created_at; priority and severity only filter IS NOT NULL
+    'ix_tickets_status_assigned_to_priority_severity': ['status', 'assigned_to', 'priority', 'severity'],
+    # sla_id lookups use ix_tickets_sla_id_created_at; the SLA dashboard reads ix_tickets_due_date
+    'ix_tickets_sla_id_due_date': ['sla_id', 'due_date'],
+    # Color filters are checked while reading ix_tickets_due_date in order
+    'ix_tickets_sla_warning_at': ['sla_warning_at'],
+    'ix_tickets_sla_critical_at': ['sla_critical_at'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name in DROPPED_INDEXES:
+        op.drop_index(name, table_name='tickets')
+    # Duplicate of the primary key; only exists where the table came from Base.metadata.create_all
+    existing = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('tickets')}
+    if 'ix_tickets_ticket_id' in existing:
+        op.drop_index('ix_tickets_ticket_id', table_name='tickets')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, columns in DROPPED_INDEXES.items():
+        op.create_index(name, 'tickets', columns, unique=False)
@@ -1,28 +1,79 @@
 from fastapi import dependencies, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.utils.jwt_handler import JWTHandler
+from app.utils.jwt_handler import JWTHandler, JWT_STATELESS_PRINCIPAL
 from app.repositories.user_repository import UserRepository
 from app.database import get_db
+from app.utils.principal import Principal
+from app.utils.principal_cache import principal_cache
 
 security = HTTPBearer()
 
 class AuthMiddleware:
     @staticmethod
     def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db=Depends(get_db)):
-        token = credentials.credentials
-        payload, err = JWTHandler.decode_token(token)
+        principal, email, err = AuthMiddleware._resolve_token(credentials.credentials)
         if err:
-            return None, "Invalid or expired token"
-        email = payload.get("sub")
-        if not email:
-            return None, "Token missing subject"
-        
+            return None, err
+        if principal:
+            return principal, None
+
         user, err = UserRepository.get_user_by_email(email, db)
         if err or not user:
             return None, "User not found"
-        
-        return user, None
-    
 
+        return AuthMiddleware._remember(email, user), None
+
+    @staticmethod
+    async def get_current_user_async(credentials: HTTPAuthorizationCredentials, db):
+        principal, email, err = AuthMiddleware._resolve_token(credentials.credentials)
+        if err:
+            return None, err
+        if principal:
+            return principal, None
+
+        # ✅ Imported here so the sync-only deployment never loads the async path
+        from app.repositories.async_user_repository import AsyncUserRepository
+
+        user, err = await AsyncUserRepository.get_user_by_email(email, db)
+        if err or not user:
+            return None, "User not found"
+
+        return AuthMiddleware._remember(email, user), None
+
+    @staticmethod
+    def _resolve_token(token: str):
+        """Returns (principal, email, err); principal is set when no user lookup is needed."""
+        payload, err = JWTHandler.decode_token(token)
+        if err:
+            return None, None, "Invalid or expired token"
+        email = payload.get("sub")
+        if not email:
+            return None, None, "Token missing subject"
+
+        # ✅ Stateless mode: trust the signed user_id/role claims, no database round trip
+        if JWT_STATELESS_PRINCIPAL and "user_id" in payload and "role" in payload:
+            principal = Principal.from_claims(payload)
+            if not principal:
+                return None, None, "Invalid token claims"
+            return principal, email, None
+
+        # ✅ Serve repeat requests from the principal cache instead of the users table
+        return principal_cache.get(email), email, None
 
+    @staticmethod
+    def _remember(email: str, user):
+        if not principal_cache.enabled:
+            return user
+        principal = Principal.from_user(user)
+        principal_cache.put(email, principal)
+        return principal
 
+    @staticmethod
+    def get_user_profile(user, db):
+        """Load the full profile for handlers that render it; a no-op unless the principal came from token claims."""
+        if isinstance(user, Principal) and not user.has_profile:
+            profile = UserRepository.get_user_by_id(user.user_id, db)
+            if not profile:
+                return None, "User not found"
+            return profile, None
+        return user, None
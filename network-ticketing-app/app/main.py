@@ -1,4 +1,5 @@
 # app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.router import network_ticketing_router
 from app.database import Base, engine
@@ -9,9 +10,42 @@ from app.models.ticket import Ticket
 from app.models.feedback import Feedback
 from app.models.assignment import Assignment
 from app.models.ticket_action_log import TicketActionLog
+from app.models.cache_version import CacheVersion
+from app.tasks.token_sweeper import RefreshTokenSweeper
+from app.tasks.workload_refresher import WorkloadIndexRefresher
+from app.tasks.sla_breach_scheduler import sla_breach_scheduler
+from app.tasks.action_log_writer import action_log_writer
+from app.tasks.ticket_search_refresher import TicketSearchIndexRefresher
+from app.utils.ticket_events import ticket_event_bus
+from app.utils.sla_cache import sla_cache
+from app.utils.category_catalog import category_catalog
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    RefreshTokenSweeper.start()
+    action_log_writer.start()
+    await run_in_threadpool(sla_cache.warm)
+    await run_in_threadpool(category_catalog.warm)
+    await run_in_threadpool(WorkloadIndexRefresher.rebuild_once)
+    WorkloadIndexRefresher.start()
+    await run_in_threadpool(TicketSearchIndexRefresher.rebuild_once)
+    TicketSearchIndexRefresher.start()
+    sla_breach_scheduler.subscribe(ticket_event_bus.publish_sla_event)
+    await sla_breach_scheduler.start()
+    yield
+    await sla_breach_scheduler.stop()
+    sla_breach_scheduler.unsubscribe(ticket_event_bus.publish_sla_event)
+    await TicketSearchIndexRefresher.stop()
+    await WorkloadIndexRefresher.stop()
+    await RefreshTokenSweeper.stop()
+    # ✅ Last, so actions recorded while the other tasks wind down are written too
+    await action_log_writer.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -27,4 +61,4 @@ app.add_middleware(
 app.include_router(network_ticketing_router)
 # print("Creating tables now...")
 Base.metadata.create_all(bind=engine)
-# print("Tables created.")
\ No newline at end of file
+# print("Tables created.")
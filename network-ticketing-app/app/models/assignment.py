@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -11,3 +11,8 @@ class Assignment(Base):
     assigned_to = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     assigned_by = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     assigned_at = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        # Ticket timeline (TicketRepository.timeline_statement)
+        Index("ix_assignments_ticket_id_assigned_at", "ticket_id", "assigned_at"),
+    )
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from app.database import Base
+
+
+class CacheVersion(Base):
+    """One row per process-local cache; writers bump version so other workers know to reload."""
+
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(TIMESTAMP, nullable=True)
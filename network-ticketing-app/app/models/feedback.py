@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -13,3 +13,8 @@ class Feedback(Base):
     rating = Column(Integer, nullable=False)
     comment = Column(Text)
     feedback_time = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        # Ticket timeline (TicketRepository.timeline_statement); also serves ticket_id lookups and the FK
+        Index("ix_feedback_ticket_id_feedback_time", "ticket_id", "feedback_time"),
+    )
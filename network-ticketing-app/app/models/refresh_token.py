@@ -7,9 +7,10 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id = Column(Integer, primary_key=True, index=True)
-    token = Column(String, unique=True, nullable=False)
+    # SHA-256 hex digest of the refresh JWT; the raw token is never stored
+    token_hash = Column(String(64), unique=True, index=True, nullable=False)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(days=7))
+    expires_at = Column(DateTime, default=lambda: datetime.utcnow() + timedelta(days=7), index=True)
 
     user = relationship("User", back_populates="refresh_tokens")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -25,7 +25,7 @@ class Priority(enum.Enum):
 class Ticket(Base):
     __tablename__ = "tickets"
 
-    ticket_id = Column(Integer, primary_key=True, index=True)
+    ticket_id = Column(Integer, primary_key=True)
     created_by = Column(Integer, ForeignKey("users.user_id"))
     issue_description = Column(Text, nullable=False)
     status = Column(Enum(TicketStatus), default=TicketStatus.new)
@@ -38,6 +38,11 @@ class Ticket(Base):
     created_at = Column(TIMESTAMP, nullable=False)
     updated_at = Column(TIMESTAMP, nullable=False)
     due_date = Column(TIMESTAMP, nullable=True)
+    # ✅ Set with due_date at classification; the SLA color turns yellow / red at these instants
+    sla_warning_at = Column(TIMESTAMP, nullable=True)
+    sla_critical_at = Column(TIMESTAMP, nullable=True)
+    # ✅ Bumped on every write; ORM flushes check it, compare-and-set UPDATEs increment it explicitly
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
     creator = relationship("User", foreign_keys=[created_by])
@@ -45,3 +50,27 @@ class Ticket(Base):
     sla = relationship("SLA")
     issue_category = relationship("IssueCategory")
     address = relationship("Address")  # ✅ New relationship
+
+    # One index per access path; check_query_plans.py lists the query each one serves and fails on unused ones
+    __table_args__ = (
+        Index("ix_tickets_created_by_created_at", "created_by", "created_at"),
+        # SLA dashboard in (due_date, ticket_id) keyset order; the color thresholds ride along so ?color= is checked in the index
+        Index(
+            "ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at",
+            "due_date", "ticket_id", "sla_critical_at", "sla_warning_at"
+        ),
+        # Keyset pagination sort keys; the primary key is implicitly the trailing column
+        Index("ix_tickets_created_at", "created_at"),
+        Index("ix_tickets_sla_id_created_at", "sla_id", "created_at"),
+        Index("ix_tickets_status_assigned_to_created_at", "status", "assigned_to", "created_at"),
+        Index("ix_tickets_assigned_to_created_at", "assigned_to", "created_at"),
+        Index("ix_tickets_assigned_to_due_date", "assigned_to", "due_date"),
+        # Engineer claim queue (TicketRepository.claim_candidates_statement), one priority at a time
+        Index("ix_tickets_status_assigned_to_priority_due_date", "status", "assigned_to", "priority", "due_date"),
+        # Ticket search (TicketRepository.fulltext_search_statement); other databases use the in-process index
+        Index("ix_tickets_issue_description_fulltext", "issue_description", mysql_prefix="FULLTEXT")
+        .ddl_if(dialect=("mysql", "mariadb")),
+    )
+
+    # ✅ Optimistic concurrency: ORM UPDATE/DELETE add "AND version = :loaded" and raise StaleDataError on no match
+    __mapper_args__ = {"version_id_col": version}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Text, Enum, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -24,3 +24,8 @@ class TicketActionLog(Base):
     action_note = Column(Text)
     attachment_url = Column(String(255))
     action_time = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (
+        # Ticket timeline (TicketRepository.timeline_statement)
+        Index("ix_ticket_action_logs_ticket_id_action_time", "ticket_id", "action_time"),
+    )
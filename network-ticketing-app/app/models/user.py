@@ -20,7 +20,7 @@ class User(Base):
     contact_number = Column(String(15))
     location = Column(String(100))
     password_hash = Column(String(255), nullable=False)
-    created_at = Column(TIMESTAMP)
+    created_at = Column(TIMESTAMP, index=True)
 
     # 🔐 Relationship to refresh tokens
     refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
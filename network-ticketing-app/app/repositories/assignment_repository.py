@@ -1,20 +1,26 @@
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.assignment import Assignment
 
 class AssignmentRepository:
     @staticmethod
-    def log_assignment(ticket_id: int, assigned_to: int, assigned_by: int, db):
+    def new_assignment(ticket_id: int, assigned_to: int, assigned_by: int):
+        return Assignment(
+            ticket_id=ticket_id,
+            assigned_to=assigned_to,
+            assigned_by=assigned_by,
+            assigned_at=datetime.utcnow()
+        )
+
+    @staticmethod
+    def log_assignment(ticket_id: int, assigned_to: int, assigned_by: int, db, commit: bool = True):
         try:
-            assignment = Assignment(
-                ticket_id=ticket_id,
-                assigned_to=assigned_to,
-                assigned_by=assigned_by,
-                assigned_at=datetime.utcnow()
-            )
+            assignment = AssignmentRepository.new_assignment(ticket_id, assigned_to, assigned_by)
             db.add(assignment)
-            db.commit()
-            db.refresh(assignment)
+            if commit:
+                db.commit()
+                db.refresh(assignment)
             return assignment, None
         except SQLAlchemyError as e:
             db.rollback()
@@ -22,3 +28,22 @@ class AssignmentRepository:
         except Exception as e:
             db.rollback()
             return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    def log_assignments(ticket_ids, assigned_to: int, assigned_by: int, db, commit: bool = True):
+        """Writes one Assignment row per ticket with a single executemany INSERT."""
+        try:
+            now = datetime.utcnow()
+            db.execute(insert(Assignment), [
+                {"ticket_id": ticket_id, "assigned_to": assigned_to, "assigned_by": assigned_by, "assigned_at": now}
+                for ticket_id in ticket_ids
+            ])
+            if commit:
+                db.commit()
+            return len(ticket_ids), None
+        except SQLAlchemyError as e:
+            db.rollback()
+            return None, f"Database error while logging assignments: {str(e)}"
+        except Exception as e:
+            db.rollback()
+            return None, f"Unexpected error: {str(e)}"
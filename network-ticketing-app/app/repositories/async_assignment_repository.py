@@ -0,0 +1,19 @@
+from sqlalchemy.exc import SQLAlchemyError
+from app.repositories.assignment_repository import AssignmentRepository
+
+class AsyncAssignmentRepository:
+    @staticmethod
+    async def log_assignment(ticket_id: int, assigned_to: int, assigned_by: int, db, commit: bool = True):
+        try:
+            assignment = AssignmentRepository.new_assignment(ticket_id, assigned_to, assigned_by)
+            db.add(assignment)
+            if commit:
+                await db.commit()
+                await db.refresh(assignment)
+            return assignment, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"Database error while logging assignment: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error: {str(e)}"
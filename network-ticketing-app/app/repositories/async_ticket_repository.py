@@ -0,0 +1,299 @@
+from app.models.ticket import Ticket
+from app.repositories.ticket_repository import TicketRepository, TICKET_CLAIM_BATCH, TICKET_CLAIM_ROUNDS
+from app.utils.ticket_search import ticket_search_index, TicketSearchIndex
+from datetime import datetime
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.exc import SQLAlchemyError
+from app.utils.etag import VERSION_CONFLICT
+
+
+class AsyncTicketRepository:
+    """
+    AsyncSession counterpart of TicketRepository for the async ticket routes. Every query comes from
+    a TicketRepository statement builder; this class only awaits it and maps errors.
+    """
+
+    @staticmethod
+    async def create_ticket(user_id: int, ticket_data, db, created_at, updated_at, due_date, address_id: int, commit: bool = True):
+        try:
+            new_ticket = TicketRepository.new_ticket(user_id, ticket_data, created_at, updated_at, due_date, address_id)
+            db.add(new_ticket)
+            await db.flush()
+            ticket_search_index.stage(db, new_ticket.ticket_id, new_ticket.issue_description)
+            if commit:
+                await db.commit()
+                await db.refresh(new_ticket)
+            return new_ticket, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"DB error during ticket creation: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    async def get_tickets_without_sla(db, page=None):
+        try:
+            result = await db.execute(TicketRepository.unclassified_statement(page))
+            return result.scalars().all(), None
+        except SQLAlchemyError as e:
+            return None, f"DB error while fetching unclassified tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    async def get_ticket_by_id(ticket_id: int, db):
+        try:
+            result = await db.execute(TicketRepository.ticket_statement(ticket_id))
+            ticket = result.scalars().first()
+            if not ticket:
+                return None, "Ticket not found"
+            return ticket, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"Database error while fetching ticket: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error while fetching ticket: {str(e)}"
+
+    @staticmethod
+    async def classify_ticket(ticket_id: int, severity, priority, sla_id, due_date, db, commit: bool = True):
+        try:
+            ticket = await db.get(Ticket, ticket_id)
+            if not ticket:
+                return None, "Ticket not found"
+
+            TicketRepository.apply_classification(ticket, severity, priority, sla_id, due_date)
+
+            if commit:
+                await db.commit()
+                await db.refresh(ticket)
+            return ticket, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"DB error during classification: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    async def assign_ticket(ticket_id: int, assigned_to: int, db, commit: bool = True):
+        try:
+            ticket = await db.get(Ticket, ticket_id)
+            if not ticket:
+                return None, "Ticket not found"
+
+            TicketRepository.apply_assignment(ticket, assigned_to)
+
+            if commit:
+                await db.commit()
+                await db.refresh(ticket)
+            return ticket, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"DB error during assignment: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    async def transition_status(ticket_id: int, new_status, allowed_from, db, assigned_to: int = None,
+                                created_by: int = None, updated_since=None, updated_at=None, expected_versions=None):
+        try:
+            statement = TicketRepository.transition_statement(
+                ticket_id, new_status, allowed_from, assigned_to, created_by, updated_since, updated_at,
+                expected_versions
+            )
+            if TicketRepository.returns_updated_rows(db.get_bind().dialect):
+                row = (await db.execute(statement.returning(*TicketRepository.TRANSITION_RESULT))).first()
+            else:
+                row = None
+                if (await db.execute(statement)).rowcount == 1:
+                    row = (await db.execute(TicketRepository.transition_result_statement(ticket_id))).first()
+            await db.commit()
+            return row, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"DB error during status update: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error during status update: {str(e)}"
+
+    @staticmethod
+    async def claim_next_ticket(engineer_id: int, db, commit: bool = True):
+        try:
+            now = datetime.utcnow().replace(microsecond=0)
+            ticket_id = None
+            if TicketRepository.claim_uses_skip_locked(db.get_bind().dialect):
+                for priority in TicketRepository.CLAIM_PRIORITY_ORDER:
+                    result = await db.execute(TicketRepository.claim_candidates_statement(priority, 1, skip_locked=True))
+                    ticket_id = result.scalar()
+                    if ticket_id is not None:
+                        await db.execute(TicketRepository.claim_statement(ticket_id, engineer_id, now))
+                        break
+            else:
+                for _ in range(TICKET_CLAIM_ROUNDS):
+                    candidates = []
+                    for priority in TicketRepository.CLAIM_PRIORITY_ORDER:
+                        result = await db.execute(
+                            TicketRepository.claim_candidates_statement(priority, TICKET_CLAIM_BATCH, skip_locked=False)
+                        )
+                        candidates = result.scalars().all()
+                        if candidates:
+                            break
+                    if not candidates:
+                        break
+                    for candidate in candidates:
+                        claimed = await db.execute(TicketRepository.claim_statement(candidate, engineer_id, now))
+                        if claimed.rowcount == 1:
+                            ticket_id = candidate
+                            break
+                    if ticket_id is not None:
+                        break
+
+            if commit:
+                await db.commit()
+            return ticket_id, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"DB error while claiming a ticket: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error while claiming a ticket: {str(e)}"
+
+    @staticmethod
+    async def get_followup_state(ticket_id: int, db):
+        try:
+            result = await db.execute(TicketRepository.followup_state_statement(ticket_id))
+            return result.first(), None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    async def get_ticket_timeline(ticket_id: int, page, db):
+        try:
+            statement = TicketRepository.timeline_statement(
+                ticket_id, page, TicketRepository.timeline_limits_branches(db.get_bind().dialect)
+            )
+            result = await db.execute(statement)
+            return result.all(), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching the ticket timeline: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching the ticket timeline: {str(e)}"
+
+    @staticmethod
+    async def search_tickets(words, limit: int, db):
+        try:
+            if TicketSearchIndex.uses_fulltext(db.get_bind().dialect):
+                result = await db.execute(TicketRepository.fulltext_search_statement(words, limit))
+                return [(row, row.score) for row in result.all()], None
+
+            if not ticket_search_index.built:
+                result = await db.execute(TicketRepository.search_documents_statement())
+                ticket_search_index.rebuild(result.all())
+            hits = ticket_search_index.search(words, limit)
+            if not hits:
+                return [], None
+            result = await db.execute(TicketRepository.search_hits_statement([ticket_id for ticket_id, _ in hits]))
+            return TicketRepository.rank_hits(result.all(), hits), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while searching tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while searching tickets: {str(e)}"
+
+    @staticmethod
+    async def get_transition_state(ticket_id: int, db):
+        try:
+            result = await db.execute(TicketRepository.transition_state_statement(ticket_id))
+            return result.first(), None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    async def get_tickets_by_assignee(user_id, status, db, page=None):
+        try:
+            result = await db.execute(TicketRepository.assignee_statement(user_id, status, page))
+            return result.scalars().all(), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching assigned tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching assigned tickets: {str(e)}"
+
+    @staticmethod
+    async def get_ticket_by_customer(ticket_id: int, user_id: int, db):
+        try:
+            result = await db.execute(TicketRepository.customer_ticket_statement(ticket_id, user_id))
+            ticket = result.scalars().first()
+            if not ticket:
+                return None, "Ticket not found or unauthorized"
+            return ticket, None
+        except Exception as e:
+            await db.rollback()
+            return None, f"Database error while fetching ticket: {str(e)}"
+
+    @staticmethod
+    async def update_ticket(ticket: Ticket, payload, db):
+        try:
+            TicketRepository.apply_update(ticket, payload)
+            ticket_search_index.stage(db, ticket.ticket_id, ticket.issue_description)
+            await db.commit()
+            await db.refresh(ticket)
+            return ticket, None
+        except StaleDataError:
+            await db.rollback()
+            return None, VERSION_CONFLICT
+        except Exception as e:
+            await db.rollback()
+            return None, f"Database error while updating ticket: {str(e)}"
+
+    @staticmethod
+    async def delete_ticket_by_customer(ticket_id: int, user_id: int, db, version: int = None):
+        try:
+            for statement in TicketRepository.delete_dependents_statements(ticket_id):
+                await db.execute(statement)
+            result = await db.execute(TicketRepository.delete_by_customer_statement(ticket_id, user_id, version))
+            if result.rowcount == 0:
+                await db.rollback()
+                return None, VERSION_CONFLICT if version is not None else "Ticket not found or unauthorized"
+            ticket_search_index.stage(db, ticket_id, None)
+            await db.commit()
+            return True, None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            return None, f"Database error during deletion: {str(e)}"
+        except Exception as e:
+            await db.rollback()
+            return None, f"Unexpected error during deletion: {str(e)}"
+
+    @staticmethod
+    async def get_address_by_id(address_id: int, user_id: int, db):
+        try:
+            result = await db.execute(TicketRepository.address_statement(address_id, user_id))
+            address = result.scalars().first()
+            if not address:
+                return None, "Address not found or unauthorized"
+            return address, None
+        except Exception as e:
+            await db.rollback()
+            return None, f"Database error while fetching address: {str(e)}"
+
+    @staticmethod
+    async def get_issue_category_by_id(category_id: int, db):
+        return await db.run_sync(lambda session: TicketRepository.get_issue_category_by_id(category_id, session))
+
+    @staticmethod
+    async def get_classified_tickets(db, page=None):
+        try:
+            result = await db.execute(TicketRepository.classified_statement(page))
+            return result.scalars().all(), None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    async def get_all_with_users(db, page=None):
+        try:
+            result = await db.execute(TicketRepository.all_with_users_statement(page))
+            return result.all(), None
+        except Exception as e:
+            return None, str(e)
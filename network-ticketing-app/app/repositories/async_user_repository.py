@@ -0,0 +1,21 @@
+from app.repositories.user_repository import UserRepository
+
+
+class AsyncUserRepository:
+    """AsyncSession counterpart of the UserRepository lookups the async ticket routes need."""
+
+    @staticmethod
+    async def get_user_by_id(user_id: int, db):
+        try:
+            result = await db.execute(UserRepository.user_by_id_statement(user_id))
+            return result.scalars().first()
+        except Exception as e:
+            return None
+
+    @staticmethod
+    async def get_user_by_email(email: str, db):
+        try:
+            result = await db.execute(UserRepository.user_by_email_statement(email))
+            return result.scalars().first(), None
+        except Exception as e:
+            return None, str(e)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import select, update
+from app.models.cache_version import CacheVersion
+
+
+class CacheVersionRepository:
+    @staticmethod
+    def get_version(name: str, db):
+        try:
+            version = db.execute(select(CacheVersion.version).where(CacheVersion.name == name)).scalar()
+            return version or 0, None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    def bump(name: str, db):
+        """
+        Increments the cache's version inside the caller's transaction (no commit), so the
+        bump becomes visible to other workers together with the write it announces.
+        """
+        now = datetime.utcnow().replace(microsecond=0)
+        result = db.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == name)
+            .values(version=CacheVersion.version + 1, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.add(CacheVersion(name=name, version=1, updated_at=now))
@@ -1,4 +1,6 @@
 from app.models.issue_category import IssueCategory
+from app.repositories.cache_version_repository import CacheVersionRepository
+from app.utils.category_catalog import category_catalog, CATEGORY_CATALOG_NAME
 
 class IssueCategoryRepository:
     @staticmethod
@@ -6,7 +8,9 @@ class IssueCategoryRepository:
         try:
             category = IssueCategory(category_name=payload.category_name)
             db.add(category)
+            CacheVersionRepository.bump(CATEGORY_CATALOG_NAME, db)
             db.commit()
+            category_catalog.invalidate()
             db.refresh(category)
             return category, None
         except Exception as e:
@@ -15,19 +19,24 @@ class IssueCategoryRepository:
 
     @staticmethod
     def list_all(db):
-        try:
-            categories = db.query(IssueCategory).all()
-            return categories, None
-        except Exception as e:
-            return None, str(e)
+        # ✅ Served from the in-memory catalog; db is only used to check/reload it
+        snapshot, err = category_catalog.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.rows, None
+
+    @staticmethod
+    def catalog(db):
+        """The full catalog snapshot (rows, id/name maps and the list's ETag)."""
+        return category_catalog.snapshot(db)
+
+    @staticmethod
+    def get_by_id(category_id, db):
+        return category_catalog.get(category_id, db)
 
     @staticmethod
     def get_by_name(name, db):
-        try:
-            category = db.query(IssueCategory).filter(IssueCategory.category_name == name).first()
-            return category, None
-        except Exception as e:
-            return None, str(e)
+        return category_catalog.get_by_name(name, db)
 
 
     @staticmethod
@@ -38,7 +47,9 @@ class IssueCategoryRepository:
                 return None, "Category not found"
 
             category.category_name = payload.category_name
+            CacheVersionRepository.bump(CATEGORY_CATALOG_NAME, db)
             db.commit()
+            category_catalog.invalidate()
             db.refresh(category)
             return category, None
         except Exception as e:
@@ -53,7 +64,9 @@ class IssueCategoryRepository:
                 return None, "Category not found"
 
             db.delete(category)
+            CacheVersionRepository.bump(CATEGORY_CATALOG_NAME, db)
             db.commit()
+            category_catalog.invalidate()
             return True, None
         except Exception as e:
             db.rollback()
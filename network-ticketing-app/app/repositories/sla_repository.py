@@ -1,13 +1,27 @@
-from app.models.sla import SLA
+from datetime import timedelta
+from sqlalchemy import select
+from app.models.sla import SLA, Severity, Priority
 from app.models.ticket import Ticket
+from app.repositories.cache_version_repository import CacheVersionRepository
+from app.repositories.ticket_repository import TicketRepository
+from app.utils.pagination import Pagination
+from app.utils.sla_thresholds import SLAThresholds
+from app.utils.sla_cache import sla_cache, SLA_CACHE_NAME
 
 class SLARepository:
     @staticmethod
     def create(payload, db):
         try:
-            sla = SLA(**payload.model_dump())
+            # ✅ The columns store the model enums, so map the request enums across by value
+            sla = SLA(
+                severity=Severity(payload.severity.value),
+                priority=Priority(payload.priority.value),
+                time_limit_hr=payload.time_limit_hr
+            )
             db.add(sla)
+            CacheVersionRepository.bump(SLA_CACHE_NAME, db)
             db.commit()
+            sla_cache.invalidate()
             db.refresh(sla)
             return sla, None
         except Exception as e:
@@ -16,11 +30,12 @@ class SLARepository:
 
     @staticmethod
     def list_all(db):
-        try:
-            slas = db.query(SLA).all()
-            return slas, None
-        except Exception as e:
-            return None, str(e)
+        # ✅ Served from the process-local matrix; db is only used to check/reload it
+        return sla_cache.list_all(db)
+
+    @staticmethod
+    def get_by_id(sla_id: int, db):
+        return sla_cache.get(sla_id, db)
 
     @staticmethod
     def update(sla_id, payload, db):
@@ -29,10 +44,12 @@ class SLARepository:
             if not sla:
                 return None, "SLA not found"
 
-            sla.severity = payload.severity
-            sla.priority = payload.priority
+            sla.severity = Severity(payload.severity.value)
+            sla.priority = Priority(payload.priority.value)
             sla.time_limit_hr = payload.time_limit_hr
+            CacheVersionRepository.bump(SLA_CACHE_NAME, db)
             db.commit()
+            sla_cache.invalidate()
             db.refresh(sla)
             return sla, None
         except Exception as e:
@@ -47,7 +64,9 @@ class SLARepository:
                 return None, "SLA not found"
 
             db.delete(sla)
+            CacheVersionRepository.bump(SLA_CACHE_NAME, db)
             db.commit()
+            sla_cache.invalidate()
             return True, None
         except Exception as e:
             db.rollback()
@@ -56,24 +75,45 @@ class SLARepository:
 
     @staticmethod
     def filter_by_priority_severity(priority, severity, db):
-        try:
-            slas = db.query(SLA).filter(
-                SLA.priority == priority,
-                SLA.severity == severity
-            ).all()
-            return slas, None
-        except Exception as e:
-            return None, str(e)
+        # ✅ Accept the display value ("High") as well as the stored name ("high")
+        severity = SLARepository._lookup(Severity, severity)
+        priority = SLARepository._lookup(Priority, priority)
+        if severity is None or priority is None:
+            return [], None
+        return sla_cache.find(severity, priority, db)
+
+    @staticmethod
+    def _lookup(enum_cls, raw):
+        for member in enum_cls:
+            if raw in (member.value, member.name):
+                return member
+        return None
 
 
     @staticmethod
-    def get_tickets_with_sla_for_agent(db):
+    def get_tickets_with_sla_for_agent(now, db, color=None, remaining_lt=None, page=None):
+        """
+        The SLA dashboard rows with their color evaluated in SQL at now. Rows are read along
+        ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at: remaining_lt and the yellow/green filters
+        narrow the due_date range, and the color is checked on the index entry before the row is read.
+        """
         try:
-            tickets = (
-                db.query(Ticket)
-                .filter(Ticket.sla_id.isnot(None))
-                .all()
-            )
-            return tickets, None
+            query = select(
+                Ticket.ticket_id,
+                Ticket.issue_description,
+                Ticket.priority,
+                Ticket.severity,
+                Ticket.due_date,
+                SLAThresholds.color_expression(now).label("sla_status_color")
+            ).where(Ticket.sla_id.isnot(None), Ticket.due_date.isnot(None))
+            if color is not None:
+                query = query.where(SLAThresholds.color_filter(color, now))
+            if remaining_lt is not None:
+                query = query.where(Ticket.due_date < now + timedelta(seconds=remaining_lt))
+            if page is None:
+                query = query.order_by(Ticket.due_date)
+            else:
+                query = Pagination.apply(query, page, TicketRepository.SORT_COLUMNS, Ticket.ticket_id)
+            return db.execute(query).all(), None
         except Exception as e:
             return None, str(e)
\ No newline at end of file
@@ -1,29 +1,132 @@
-from app.models.ticket import Ticket
+import os
+from app.models.ticket import Ticket, TicketStatus, Priority
 from app.models.address import Address
 from app.models.issue_category import IssueCategory
+from app.models.user import User
+from app.models.assignment import Assignment
+from app.models.feedback import Feedback
+from app.models.ticket_action_log import TicketActionLog
+from collections import deque
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, insert, delete, literal, null, or_, union_all, type_coerce, Float
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy.exc import SQLAlchemyError
 from app.schemas.ticket import UpdateTicketRequest
+from app.utils.category_catalog import category_catalog
+from app.utils.etag import VERSION_CONFLICT
+from app.utils.pagination import Pagination, PageRequest
+from app.utils.sla_thresholds import SLAThresholds
+from app.utils.ticket_search import ticket_search_index, TicketSearchIndex
+
+# "auto" uses SELECT ... FOR UPDATE SKIP LOCKED on MySQL 8 / PostgreSQL and compare-and-set elsewhere
+TICKET_CLAIM_SKIP_LOCKED = os.getenv("TICKET_CLAIM_SKIP_LOCKED", "auto").lower()
+# Candidates read per compare-and-set round, and rounds tried before giving up on a busy queue
+TICKET_CLAIM_BATCH = int(os.getenv("TICKET_CLAIM_BATCH", 8))
+TICKET_CLAIM_ROUNDS = int(os.getenv("TICKET_CLAIM_ROUNDS", 3))
 
 
 class TicketRepository:
+    # ✅ Sort keys the list endpoints may page on; each is backed by an index (see Ticket.__table_args__)
+    SORT_COLUMNS = {
+        "ticket_id": Ticket.ticket_id,
+        "created_at": Ticket.created_at,
+        "due_date": Ticket.due_date,
+    }
+
+    # Statement builders and in-memory updates shared with AsyncTicketRepository, so both paths
+    # run the same SQL and differ only in how they execute it
+
+    @staticmethod
+    def new_ticket(user_id: int, ticket_data, created_at, updated_at, due_date, address_id: int):
+        return Ticket(
+            issue_description=ticket_data.issue_description,
+            issue_category_id=ticket_data.issue_category_id,
+            created_by=user_id,
+            address_id=address_id,
+            status=TicketStatus.new,
+            created_at=created_at,
+            updated_at=updated_at,
+            due_date=due_date
+        )
+
+    @staticmethod
+    def ticket_statement(ticket_id: int):
+        return select(Ticket).where(Ticket.ticket_id == ticket_id)
+
+    @staticmethod
+    def customer_ticket_statement(ticket_id: int, user_id: int):
+        return select(Ticket).where(Ticket.ticket_id == ticket_id, Ticket.created_by == user_id)
+
+    @staticmethod
+    def address_statement(address_id: int, user_id: int):
+        return select(Address).where(Address.address_id == address_id, Address.user_id == user_id)
+
+    @staticmethod
+    def unclassified_statement(page=None):
+        query = select(Ticket).where(Ticket.sla_id.is_(None))
+        return Pagination.apply(query, page, TicketRepository.SORT_COLUMNS, Ticket.ticket_id)
+
     @staticmethod
-    def create_ticket(user_id: int, ticket_data, db, created_at, updated_at, due_date, address_id: int):
+    def classified_statement(page=None):
+        query = select(Ticket).where(*TicketRepository.classified_queue_filters())
+        return Pagination.apply(query, page, TicketRepository.SORT_COLUMNS, Ticket.ticket_id)
+
+    @staticmethod
+    def assignee_statement(user_id: int, status, page=None):
+        query = select(Ticket).where(Ticket.assigned_to == user_id)
+        if status:
+            query = query.where(Ticket.status == status)
+        return Pagination.apply(query, page, TicketRepository.SORT_COLUMNS, Ticket.ticket_id)
+
+    @staticmethod
+    def delete_by_customer_statement(ticket_id: int, user_id: int, version: int = None):
+        statement = delete(Ticket).where(Ticket.ticket_id == ticket_id, Ticket.created_by == user_id)
+        if version is not None:
+            statement = statement.where(Ticket.version == version)
+        return statement.execution_options(synchronize_session=False)
+
+    @staticmethod
+    def delete_dependents_statements(ticket_id: int):
+        """Rows that reference the ticket by foreign key; run ahead of delete_by_customer_statement in the same transaction."""
+        return tuple(
+            delete(model).where(model.ticket_id == ticket_id).execution_options(synchronize_session=False)
+            for model in (TicketActionLog, Assignment, Feedback)
+        )
+
+    @staticmethod
+    def apply_classification(ticket: Ticket, severity, priority, sla_id, due_date):
+        ticket.severity = severity
+        ticket.priority = priority
+        ticket.sla_id = sla_id
+        ticket.due_date = due_date
+        ticket.sla_warning_at, ticket.sla_critical_at = SLAThresholds.compute(ticket.created_at, due_date)
+        ticket.updated_at = datetime.utcnow().replace(microsecond=0)
+
+    @staticmethod
+    def apply_assignment(ticket: Ticket, assigned_to: int):
+        ticket.assigned_to = assigned_to
+        ticket.status = TicketStatus.assigned
+        ticket.updated_at = datetime.utcnow().replace(microsecond=0)
+
+    @staticmethod
+    def apply_update(ticket: Ticket, payload):
+        ticket.issue_description = payload.issue_description
+        ticket.issue_category_id = payload.issue_category_id
+        ticket.address_id = payload.address_id
+
+    @staticmethod
+    def create_ticket(user_id: int, ticket_data, db, created_at, updated_at, due_date, address_id: int, commit: bool = True):
         try:
-            new_ticket = Ticket(
-                issue_description=ticket_data.issue_description,
-                issue_category_id=ticket_data.issue_category_id,
-                created_by=user_id,
-                address_id=address_id,  
-                status="new",
-                created_at=created_at,
-                updated_at=updated_at,
-                due_date=due_date
-            )
+            new_ticket = TicketRepository.new_ticket(user_id, ticket_data, created_at, updated_at, due_date, address_id)
             db.add(new_ticket)
-            db.commit()
-            db.refresh(new_ticket)
+            # ✅ Flushed for the ticket_id the search index is keyed on; still one transaction
+            db.flush()
+            ticket_search_index.stage(db, new_ticket.ticket_id, new_ticket.issue_description)
+            if commit:
+                db.commit()
+                db.refresh(new_ticket)
             return new_ticket, None
         except SQLAlchemyError as e:
             db.rollback()
@@ -34,9 +137,63 @@ class TicketRepository:
 
 
     @staticmethod
-    def get_tickets_without_sla(db):
+    def bulk_create_tickets(rows: list, db, commit: bool = True):
+        """
+        Inserts many tickets at once and returns their ids in the order of rows. Dialects with
+        executemany RETURNING get one batched INSERT; others (MySQL) fall back to a single ORM
+        flush, since a multi-row INSERT there cannot report every generated id reliably.
+        """
         try:
-            return db.query(Ticket).filter(Ticket.sla_id == None).all()
+            if db.get_bind().dialect.insert_executemany_returning:
+                result = db.execute(
+                    insert(Ticket).returning(
+                        Ticket.ticket_id, Ticket.issue_description, Ticket.issue_category_id, Ticket.address_id
+                    ),
+                    rows
+                )
+                # ✅ RETURNING order is not guaranteed; rows with identical content are interchangeable,
+                # so match ids back by content instead of paying for per-row ordering
+                ids_by_content = {}
+                for ticket_id, *content in sorted(result.all()):
+                    ids_by_content.setdefault(tuple(content), deque()).append(ticket_id)
+                ticket_ids = [
+                    ids_by_content[(row["issue_description"], row["issue_category_id"], row["address_id"])].popleft()
+                    for row in rows
+                ]
+            else:
+                tickets = [Ticket(**row) for row in rows]
+                db.add_all(tickets)
+                db.flush()
+                ticket_ids = [t.ticket_id for t in tickets]
+            for ticket_id, row in zip(ticket_ids, rows):
+                ticket_search_index.stage(db, ticket_id, row["issue_description"])
+            if commit:
+                db.commit()
+            return ticket_ids, None
+        except SQLAlchemyError as e:
+            db.rollback()
+            return None, f"DB error during bulk ticket creation: {str(e)}"
+        except Exception as e:
+            db.rollback()
+            return None, f"Unexpected error: {str(e)}"
+
+    @staticmethod
+    def get_address_ids_for_user(address_ids, user_id: int, db):
+        """Which of address_ids belong to user_id, in one IN query."""
+        try:
+            rows = db.execute(
+                select(Address.address_id).where(Address.address_id.in_(address_ids), Address.user_id == user_id)
+            ).scalars().all()
+            return set(rows), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching addresses: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching addresses: {str(e)}"
+
+    @staticmethod
+    def get_tickets_without_sla(db, page=None):
+        try:
+            return db.execute(TicketRepository.unclassified_statement(page)).scalars().all(), None
         except SQLAlchemyError as e:
             return None, f"DB error while fetching unclassified tickets: {str(e)}"
         except Exception as e:
@@ -45,7 +202,7 @@ class TicketRepository:
     @staticmethod
     def get_ticket_by_id(ticket_id: int, db: Session):
         try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id).first()
+            ticket = db.execute(TicketRepository.ticket_statement(ticket_id)).scalars().first()
             if not ticket:
                 return None, "Ticket not found"
             return ticket, None
@@ -57,20 +214,18 @@ class TicketRepository:
             return None, f"Unexpected error while fetching ticket: {str(e)}"
 
     @staticmethod
-    def classify_ticket(ticket_id: int, severity, priority, sla_id, due_date, db):
+    def classify_ticket(ticket_id: int, severity, priority, sla_id, due_date, db, commit: bool = True):
         try:
-            ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
+            # ✅ db.get serves an already-loaded ticket from the identity map without a SELECT
+            ticket = db.get(Ticket, ticket_id)
             if not ticket:
                 return None, "Ticket not found"
 
-            ticket.severity = severity
-            ticket.priority = priority
-            ticket.sla_id = sla_id
-            ticket.due_date = due_date
-            ticket.updated_at = datetime.utcnow()
+            TicketRepository.apply_classification(ticket, severity, priority, sla_id, due_date)
 
-            db.commit()
-            db.refresh(ticket)
+            if commit:
+                db.commit()
+                db.refresh(ticket)
             return ticket, None
         except SQLAlchemyError as e:
             db.rollback()
@@ -80,18 +235,17 @@ class TicketRepository:
             return None, f"Unexpected error: {str(e)}"
 
     @staticmethod
-    def assign_ticket(ticket_id: int, assigned_to: int, db):
+    def assign_ticket(ticket_id: int, assigned_to: int, db, commit: bool = True):
         try:
-            ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
+            ticket = db.get(Ticket, ticket_id)
             if not ticket:
                 return None, "Ticket not found"
 
-            ticket.assigned_to = assigned_to
-            ticket.status = "assigned"
-            ticket.updated_at = datetime.utcnow()
+            TicketRepository.apply_assignment(ticket, assigned_to)
 
-            db.commit()
-            db.refresh(ticket)
+            if commit:
+                db.commit()
+                db.refresh(ticket)
             return ticket, None
         except SQLAlchemyError as e:
             db.rollback()
@@ -101,50 +255,488 @@ class TicketRepository:
             return None, f"Unexpected error: {str(e)}"
 
     @staticmethod
-    def update_status(ticket_id: int, new_status: str, db):
+    def get_ticket_states(ticket_ids, db):
+        """The columns bulk classify/assign validate against, for all ticket_ids in one IN query."""
         try:
-            ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
-            if not ticket:
-                return None, "Ticket not found"
+            rows = db.execute(
+                select(
+                    Ticket.ticket_id, Ticket.status, Ticket.severity, Ticket.priority, Ticket.sla_id,
+                    Ticket.created_at, Ticket.created_by, Ticket.assigned_to
+                )
+                .where(Ticket.ticket_id.in_(ticket_ids))
+            ).all()
+            return {row.ticket_id: row for row in rows}, None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching tickets: {str(e)}"
 
-            ticket.status = new_status
-            ticket.updated_at = datetime.utcnow()
+    @staticmethod
+    def bulk_classify(created_at_by_id: dict, severity, priority, sla_id, due_date, db, commit: bool = True):
+        """
+        Applies one classification to every ticket in created_at_by_id (ticket_id -> created_at).
+        The SLA color thresholds depend on created_at, so it runs one UPDATE per distinct creation
+        time; tickets filed together (e.g. by bulk create) share one. Returns (rows_updated, err).
+        """
+        try:
+            groups = {}
+            for ticket_id, created_at in created_at_by_id.items():
+                groups.setdefault(created_at, []).append(ticket_id)
+
+            updated_at = datetime.utcnow().replace(microsecond=0)
+            updated = 0
+            for created_at, ticket_ids in groups.items():
+                warning_at, critical_at = SLAThresholds.compute(created_at, due_date)
+                result = db.execute(
+                    update(Ticket)
+                    .where(Ticket.ticket_id.in_(ticket_ids))
+                    .values(
+                        severity=severity,
+                        priority=priority,
+                        sla_id=sla_id,
+                        due_date=due_date,
+                        sla_warning_at=warning_at,
+                        sla_critical_at=critical_at,
+                        updated_at=updated_at,
+                        version=Ticket.version + 1
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                updated += result.rowcount
+            if commit:
+                db.commit()
+            return updated, None
+        except SQLAlchemyError as e:
+            db.rollback()
+            return None, f"DB error during bulk classification: {str(e)}"
+        except Exception as e:
+            db.rollback()
+            return None, f"Unexpected error: {str(e)}"
 
-            db.commit()
-            db.refresh(ticket)
-            return ticket, None
+    @staticmethod
+    def bulk_assign(ticket_ids, assigned_to: int, db, commit: bool = True):
+        """
+        Assigns every ticket in a single UPDATE, re-checking the assignability rules in the WHERE
+        clause so a ticket changed since validation is not assigned. Returns (rows_updated, err).
+        """
+        try:
+            result = db.execute(
+                update(Ticket)
+                .where(
+                    Ticket.ticket_id.in_(ticket_ids),
+                    Ticket.status.in_([TicketStatus.new, TicketStatus.reopened]),
+                    Ticket.severity.isnot(None),
+                    Ticket.priority.isnot(None),
+                    Ticket.sla_id.isnot(None)
+                )
+                .values(
+                    assigned_to=assigned_to,
+                    status=TicketStatus.assigned,
+                    updated_at=datetime.utcnow().replace(microsecond=0),
+                    version=Ticket.version + 1
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if commit:
+                db.commit()
+            return result.rowcount, None
         except SQLAlchemyError as e:
             db.rollback()
-            return None, f"DB error during status update: {str(e)}"
+            return None, f"DB error during bulk assignment: {str(e)}"
         except Exception as e:
             db.rollback()
             return None, f"Unexpected error: {str(e)}"
-    
+
     @staticmethod
-    def update_status(ticket_id, new_status, db):
+    def get_open_workload(statuses, db):
+        """(ticket_id, assigned_to, priority, severity) for every assigned ticket in one of statuses."""
         try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id).first()
-            if not ticket:
-                return None, "Ticket not found"
+            rows = db.execute(
+                select(Ticket.ticket_id, Ticket.assigned_to, Ticket.priority, Ticket.severity)
+                .where(Ticket.status.in_(statuses), Ticket.assigned_to.isnot(None))
+            ).all()
+            return rows, None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching open tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching open tickets: {str(e)}"
 
-            ticket.status = new_status
+    @staticmethod
+    def transition_status(ticket_id: int, new_status, allowed_from, db, assigned_to: int = None,
+                          created_by: int = None, updated_since=None, updated_at=None, expected_versions=None):
+        """
+        Compare-and-set status change: one UPDATE ... WHERE ticket_id = :id AND status IN (:allowed)
+        plus any ownership/recency/If-Match guards. Returns (row, err); row holds the TRANSITION_RESULT
+        columns as written, or is None when no row matched, i.e. the ticket is missing, not in an
+        allowed state, or another request changed it first.
+        """
+        try:
+            statement = TicketRepository.transition_statement(
+                ticket_id, new_status, allowed_from, assigned_to, created_by, updated_since, updated_at,
+                expected_versions
+            )
+            if TicketRepository.returns_updated_rows(db.get_bind().dialect):
+                row = db.execute(statement.returning(*TicketRepository.TRANSITION_RESULT)).first()
+            else:
+                row = None
+                if db.execute(statement).rowcount == 1:
+                    row = db.execute(TicketRepository.transition_result_statement(ticket_id)).first()
             db.commit()
-            db.refresh(ticket)
-            return ticket, None
+            return row, None
         except SQLAlchemyError as e:
             db.rollback()
-            return None, f"Database error during status update: {str(e)}"
+            return None, f"DB error during status update: {str(e)}"
         except Exception as e:
             db.rollback()
             return None, f"Unexpected error during status update: {str(e)}"
 
     @staticmethod
-    def get_tickets_by_assignee(user_id, status, db):
+    def classified_queue_filters():
+        """Classified tickets still waiting for an engineer (the /tickets/classified list)."""
+        return (
+            Ticket.status == TicketStatus.new,
+            Ticket.priority.isnot(None),
+            Ticket.severity.isnot(None),
+            Ticket.assigned_to.is_(None)
+        )
+
+    @staticmethod
+    def claim_filters():
+        # ✅ Assignment also needs the SLA, so the claim queue requires it on top of the classified filters
+        return TicketRepository.classified_queue_filters() + (Ticket.sla_id.isnot(None),)
+
+    # ✅ Claim order is priority high → low; each priority is one ordered range of
+    # ix_tickets_status_assigned_to_priority_due_date, earliest due first
+    CLAIM_PRIORITY_ORDER = (Priority.high, Priority.medium, Priority.low)
+
+    @staticmethod
+    def claim_candidates_statement(priority, limit: int, skip_locked: bool):
+        """One priority's slice of the claim queue, earliest due first; with skip_locked, rows held by other claimers are passed over."""
+        statement = (
+            select(Ticket.ticket_id)
+            .where(*TicketRepository.claim_filters(), Ticket.priority == priority)
+            .order_by(Ticket.due_date, Ticket.ticket_id)
+            .limit(limit)
+        )
+        if skip_locked:
+            statement = statement.with_for_update(skip_locked=True)
+        return statement
+
+    @staticmethod
+    def claim_statement(ticket_id: int, engineer_id: int, updated_at):
+        # ✅ Re-checks the queue filters, so in compare-and-set mode only one claimer can win a ticket
+        return (
+            update(Ticket)
+            .where(Ticket.ticket_id == ticket_id, *TicketRepository.claim_filters())
+            .values(
+                assigned_to=engineer_id,
+                status=TicketStatus.assigned,
+                updated_at=updated_at,
+                version=Ticket.version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def claim_uses_skip_locked(dialect) -> bool:
+        if TICKET_CLAIM_SKIP_LOCKED == "auto":
+            return dialect.name in ("mysql", "mariadb", "postgresql")
+        return TICKET_CLAIM_SKIP_LOCKED == "true"
+
+    @staticmethod
+    def claim_next_ticket(engineer_id: int, db, commit: bool = True):
+        """
+        Assigns the next ticket in the claim queue to engineer_id. Returns (ticket_id, err), with
+        ticket_id None when the queue is empty or every candidate was taken by concurrent claimers.
+        """
         try:
-            query = db.query(Ticket).filter(Ticket.assigned_to == user_id)
-            if status:
-                query = query.filter(Ticket.status == status)
-            tickets = query.all()
+            now = datetime.utcnow().replace(microsecond=0)
+            ticket_id = None
+            if TicketRepository.claim_uses_skip_locked(db.get_bind().dialect):
+                for priority in TicketRepository.CLAIM_PRIORITY_ORDER:
+                    # ✅ The row stays locked until commit, so the UPDATE cannot lose it
+                    ticket_id = db.execute(
+                        TicketRepository.claim_candidates_statement(priority, 1, skip_locked=True)
+                    ).scalar()
+                    if ticket_id is not None:
+                        db.execute(TicketRepository.claim_statement(ticket_id, engineer_id, now))
+                        break
+            else:
+                for _ in range(TICKET_CLAIM_ROUNDS):
+                    candidates = []
+                    for priority in TicketRepository.CLAIM_PRIORITY_ORDER:
+                        candidates = db.execute(
+                            TicketRepository.claim_candidates_statement(priority, TICKET_CLAIM_BATCH, skip_locked=False)
+                        ).scalars().all()
+                        if candidates:
+                            break
+                    if not candidates:
+                        break
+                    for candidate in candidates:
+                        if db.execute(TicketRepository.claim_statement(candidate, engineer_id, now)).rowcount == 1:
+                            ticket_id = candidate
+                            break
+                    if ticket_id is not None:
+                        break
+
+            if commit:
+                db.commit()
+            return ticket_id, None
+        except SQLAlchemyError as e:
+            db.rollback()
+            return None, f"DB error while claiming a ticket: {str(e)}"
+        except Exception as e:
+            db.rollback()
+            return None, f"Unexpected error while claiming a ticket: {str(e)}"
+
+    @staticmethod
+    def get_pending_sla_deadlines(statuses, now, db):
+        """(ticket_id, sla_warning_at, sla_critical_at, due_date) of tickets in statuses that are not yet past due."""
+        try:
+            rows = db.execute(
+                select(Ticket.ticket_id, Ticket.sla_warning_at, Ticket.sla_critical_at, Ticket.due_date)
+                .where(Ticket.due_date > now, Ticket.status.in_(statuses))
+            ).all()
+            return rows, None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching SLA deadlines: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching SLA deadlines: {str(e)}"
+
+    @staticmethod
+    def get_sla_clocks(ticket_ids, db):
+        """(ticket_id, status, sla_warning_at, sla_critical_at, due_date) for ticket_ids, in one primary-key lookup."""
+        try:
+            rows = db.execute(
+                select(Ticket.ticket_id, Ticket.status, Ticket.sla_warning_at, Ticket.sla_critical_at, Ticket.due_date)
+                .where(Ticket.ticket_id.in_(ticket_ids))
+            ).all()
+            return rows, None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching SLA clocks: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching SLA clocks: {str(e)}"
+
+    @staticmethod
+    def followup_state_statement(ticket_id: int):
+        """A ticket's status, owners and deadlines without loading the entity; the timeline checks access against it."""
+        return select(
+            Ticket.status, Ticket.created_by, Ticket.assigned_to,
+            Ticket.sla_warning_at, Ticket.sla_critical_at, Ticket.due_date
+        ).where(Ticket.ticket_id == ticket_id)
+
+    @staticmethod
+    def get_followup_state(ticket_id: int, db):
+        try:
+            return db.execute(TicketRepository.followup_state_statement(ticket_id)).first(), None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    def timeline_limits_branches(dialect) -> bool:
+        # SQLite rejects ORDER BY / LIMIT on a UNION member, but merges index-ordered branches anyway
+        return dialect.name != "sqlite"
+
+    @staticmethod
+    def timeline_statement(ticket_id: int, page: PageRequest, limit_branches: bool = False):
+        """
+        One UNION ALL over the ticket's action logs, assignments and feedback, in time order.
+
+        event_key (row id * 3 + source rank) is unique across the three tables, so (event_time, event_key)
+        is the keyset. The keyset predicate goes into every branch, so each one is a range read of
+        its (ticket_id, time) index, and the rows are ordered by (event_time, event_id, source_rank):
+        the same order as event_key, but the one each branch's index already returns. With
+        limit_branches every branch also stops after limit + 1 rows, so databases that sort the
+        UNION result (MySQL) sort at most three pages instead of the ticket's whole history.
+        """
+        sources = (
+            (TicketActionLog.action_id, TicketActionLog.action_time, TicketActionLog.ticket_id, "status", [
+                TicketActionLog.updated_by.label("actor_id"),
+                null().label("assigned_to"),
+                TicketActionLog.status.label("status"),
+                null().label("rating"),
+                TicketActionLog.action_note.label("note")
+            ]),
+            (Assignment.assignment_id, Assignment.assigned_at, Assignment.ticket_id, "assignment", [
+                Assignment.assigned_by.label("actor_id"),
+                Assignment.assigned_to.label("assigned_to"),
+                null().label("status"),
+                null().label("rating"),
+                null().label("note")
+            ]),
+            (Feedback.feedback_id, Feedback.feedback_time, Feedback.ticket_id, "feedback", [
+                null().label("actor_id"),
+                null().label("assigned_to"),
+                null().label("status"),
+                Feedback.rating.label("rating"),
+                Feedback.comment.label("note")
+            ]),
+        )
+
+        branches = []
+        for rank, (id_column, time_column, ticket_column, source, columns) in enumerate(sources):
+            event_key = id_column * len(sources) + rank
+            branch = select(
+                event_key.label("event_key"),
+                id_column.label("event_id"),
+                literal(rank).label("source_rank"),
+                literal(source).label("source"),
+                time_column.label("event_time"),
+                *columns
+            ).where(ticket_column == ticket_id)
+            if page.after:
+                # ✅ Written as a time range plus a tie-break so the index seeks to the cursor
+                value, last_key = page.after
+                if page.descending:
+                    branch = branch.where(time_column <= value, or_(time_column < value, event_key < last_key))
+                else:
+                    branch = branch.where(time_column >= value, or_(time_column > value, event_key > last_key))
+            if limit_branches:
+                order = [c.desc() if page.descending else c.asc() for c in (time_column, id_column)]
+                branch = branch.order_by(*order).limit(page.limit + 1)
+            branches.append(branch)
+
+        timeline = union_all(*branches)
+        columns = timeline.selected_columns
+        keys = (columns.event_time, columns.event_id, columns.source_rank)
+        order = [key.desc() if page.descending else key.asc() for key in keys]
+        # ✅ One extra row so Pagination.page_of can tell whether another page follows
+        return timeline.order_by(*order).limit(page.limit + 1)
+
+    @staticmethod
+    def get_ticket_timeline(ticket_id: int, page: PageRequest, db):
+        try:
+            statement = TicketRepository.timeline_statement(
+                ticket_id, page, TicketRepository.timeline_limits_branches(db.get_bind().dialect)
+            )
+            return db.execute(statement).all(), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while fetching the ticket timeline: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while fetching the ticket timeline: {str(e)}"
+
+    # Columns a search hit returns
+    SEARCH_COLUMNS = (
+        Ticket.ticket_id, Ticket.issue_description, Ticket.status, Ticket.severity, Ticket.priority,
+        Ticket.assigned_to, Ticket.created_at
+    )
+
+    @staticmethod
+    def search_documents_statement():
+        """(ticket_id, issue_description) of every ticket, for rebuilding the in-process search index."""
+        return select(Ticket.ticket_id, Ticket.issue_description)
+
+    @staticmethod
+    def get_search_documents(db):
+        try:
+            return db.execute(TicketRepository.search_documents_statement()).all(), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while loading ticket descriptions: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while loading ticket descriptions: {str(e)}"
+
+    @staticmethod
+    def fulltext_search_statement(words, limit: int):
+        """MySQL FULLTEXT in boolean mode: every word required, each matching as a prefix ("rout*")."""
+        against = " ".join(f"+{word}*" for word in dict.fromkeys(words))
+        relevance = type_coerce(
+            mysql.match(Ticket.issue_description, against=against).in_boolean_mode(), Float
+        ).label("score")
+        return (
+            select(*TicketRepository.SEARCH_COLUMNS, relevance)
+            .where(relevance > 0)
+            .order_by(relevance.desc(), Ticket.ticket_id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def search_hits_statement(ticket_ids):
+        return select(*TicketRepository.SEARCH_COLUMNS).where(Ticket.ticket_id.in_(ticket_ids))
+
+    @staticmethod
+    def rank_hits(rows, hits):
+        """Orders rows like the index's (ticket_id, score) hits and attaches the score; ids no longer in the table drop out."""
+        by_id = {row.ticket_id: row for row in rows}
+        return [(by_id[ticket_id], score) for ticket_id, score in hits if ticket_id in by_id]
+
+    @staticmethod
+    def search_tickets(words, limit: int, db):
+        """Returns ([(row, score), ...], err), best match first."""
+        try:
+            if TicketSearchIndex.uses_fulltext(db.get_bind().dialect):
+                rows = db.execute(TicketRepository.fulltext_search_statement(words, limit)).all()
+                return [(row, row.score) for row in rows], None
+
+            if not ticket_search_index.built:
+                # Normally built by the lifespan; covers processes that serve before it ran
+                ticket_search_index.rebuild(db.execute(TicketRepository.search_documents_statement()).all())
+            hits = ticket_search_index.search(words, limit)
+            if not hits:
+                return [], None
+            rows = db.execute(TicketRepository.search_hits_statement([ticket_id for ticket_id, _ in hits])).all()
+            return TicketRepository.rank_hits(rows, hits), None
+        except SQLAlchemyError as e:
+            return None, f"Database error while searching tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while searching tickets: {str(e)}"
+
+    @staticmethod
+    def transition_statement(ticket_id, new_status, allowed_from, assigned_to, created_by, updated_since, updated_at,
+                             expected_versions=None):
+        statement = update(Ticket).where(Ticket.ticket_id == ticket_id, Ticket.status.in_(allowed_from))
+        if assigned_to is not None:
+            statement = statement.where(Ticket.assigned_to == assigned_to)
+        if created_by is not None:
+            statement = statement.where(Ticket.created_by == created_by)
+        if updated_since is not None:
+            statement = statement.where(Ticket.updated_at >= updated_since)
+        if expected_versions is not None:
+            statement = statement.where(Ticket.version.in_(expected_versions))
+        # ✅ Core UPDATEs bypass the mapper's version_id_col, so bump the version explicitly
+        return (
+            statement.values(
+                status=new_status,
+                updated_at=updated_at or datetime.utcnow().replace(microsecond=0),
+                version=Ticket.version + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    # ✅ What a successful transition hands back to the service: the version for the response's ETag,
+    # the owners the event feed routes on and the SLA instants a reopen re-arms the scheduler with
+    TRANSITION_RESULT = (
+        Ticket.version, Ticket.status, Ticket.created_by, Ticket.assigned_to,
+        Ticket.sla_warning_at, Ticket.sla_critical_at, Ticket.due_date
+    )
+
+    @staticmethod
+    def returns_updated_rows(dialect) -> bool:
+        """UPDATE ... RETURNING (SQLite 3.35+, PostgreSQL); MySQL and MariaDB have no equivalent."""
+        return dialect.update_returning
+
+    @staticmethod
+    def transition_result_statement(ticket_id: int):
+        # Without RETURNING, read back in the UPDATE's transaction while it still holds the row lock
+        return select(*TicketRepository.TRANSITION_RESULT).where(Ticket.ticket_id == ticket_id)
+
+    @staticmethod
+    def transition_state_statement(ticket_id: int):
+        """The columns a rejected transition is explained from; only read after a failed UPDATE."""
+        return select(Ticket.status, Ticket.assigned_to, Ticket.created_by, Ticket.updated_at, Ticket.version).where(
+            Ticket.ticket_id == ticket_id
+        )
+
+    @staticmethod
+    def get_transition_state(ticket_id: int, db):
+        try:
+            return db.execute(TicketRepository.transition_state_statement(ticket_id)).first(), None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    def get_tickets_by_assignee(user_id, status, db, page=None):
+        try:
+            tickets = db.execute(TicketRepository.assignee_statement(user_id, status, page)).scalars().all()
             return tickets, None
         except SQLAlchemyError as e:
             return None, f"Database error while fetching assigned tickets: {str(e)}"
@@ -165,14 +757,13 @@ class TicketRepository:
     @staticmethod
     def update_ticket_by_customer(ticket_id: int, user_id: int, payload, db: Session):
         try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id, created_by=user_id).first()
+            ticket = db.execute(TicketRepository.customer_ticket_statement(ticket_id, user_id)).scalars().first()
             if not ticket:
                 return None, "Ticket not found or unauthorized"
 
-            ticket.issue_description = payload.issue_description
-            ticket.issue_category_id = payload.issue_category_id
-            ticket.address_id = payload.address_id
+            TicketRepository.apply_update(ticket, payload)
             ticket.updated_at = datetime.utcnow()
+            ticket_search_index.stage(db, ticket.ticket_id, ticket.issue_description)
 
             db.commit()
             db.refresh(ticket)
@@ -186,13 +777,16 @@ class TicketRepository:
 
 
     @staticmethod
-    def delete_ticket_by_customer(ticket_id: int, user_id: int, db: Session):
+    def delete_ticket_by_customer(ticket_id: int, user_id: int, db: Session, version: int = None):
         try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id, created_by=user_id).first()
-            if not ticket:
-                return None, "Ticket not found or unauthorized"
-
-            db.delete(ticket)
+            # ✅ Dependents go first in the same transaction; a lost version check rolls them back with it
+            for statement in TicketRepository.delete_dependents_statements(ticket_id):
+                db.execute(statement)
+            result = db.execute(TicketRepository.delete_by_customer_statement(ticket_id, user_id, version))
+            if result.rowcount == 0:
+                db.rollback()
+                return None, VERSION_CONFLICT if version is not None else "Ticket not found or unauthorized"
+            ticket_search_index.stage(db, ticket_id, None)
             db.commit()
             return True, None
         except SQLAlchemyError as e:
@@ -206,7 +800,7 @@ class TicketRepository:
     @staticmethod
     def get_address_by_id(address_id: int, user_id: int, db: Session):
         try:
-            address = db.query(Address).filter_by(address_id=address_id, user_id=user_id).first()
+            address = db.execute(TicketRepository.address_statement(address_id, user_id)).scalars().first()
             if not address:
                 return None, "Address not found or unauthorized"
             return address, None
@@ -221,21 +815,19 @@ class TicketRepository:
 
     @staticmethod
     def get_issue_category_by_id(category_id: int, db: Session):
-        try:
-            category = db.query(IssueCategory).filter_by(category_id=category_id).first()
-            if not category:
-                return None, "Issue category not found"
-            return category, None
-        except Exception as e:
-            db.rollback()
-            return None, f"Database error while fetching issue category: {str(e)}"
+        category, err = category_catalog.get(category_id, db)
+        if err:
+            return None, f"Database error while fetching issue category: {err}"
+        if not category:
+            return None, "Issue category not found"
+        return category, None
 
 
 
     @staticmethod
     def get_ticket_by_customer(ticket_id: int, user_id: int, db: Session):
         try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id, created_by=user_id).first()
+            ticket = db.execute(TicketRepository.customer_ticket_statement(ticket_id, user_id)).scalars().first()
             if not ticket:
                 return None, "Ticket not found or unauthorized"
             return ticket, None
@@ -246,12 +838,14 @@ class TicketRepository:
     @staticmethod
     def update_ticket(ticket: Ticket, payload: UpdateTicketRequest, db: Session):
         try:
-            ticket.issue_description = payload.issue_description
-            ticket.issue_category_id = payload.issue_category_id
-            ticket.address_id = payload.address_id
+            TicketRepository.apply_update(ticket, payload)
+            ticket_search_index.stage(db, ticket.ticket_id, ticket.issue_description)
             db.commit()
             db.refresh(ticket)
             return ticket, None
+        except StaleDataError:
+            db.rollback()
+            return None, VERSION_CONFLICT
         except Exception as e:
             db.rollback()
             return None, f"Database error while updating ticket: {str(e)}"
@@ -259,14 +853,9 @@ class TicketRepository:
 
 
     @staticmethod
-    def get_classified_tickets(db):
+    def get_classified_tickets(db, page=None):
         try:
-            tickets = db.query(Ticket).filter(
-                Ticket.status == "new",
-                Ticket.priority.isnot(None),
-                Ticket.severity.isnot(None),
-                Ticket.assigned_to.is_(None)
-            ).all()
+            tickets = db.execute(TicketRepository.classified_statement(page)).scalars().all()
             return tickets, None
         except Exception as e:
             return None, str(e)
@@ -274,48 +863,85 @@ class TicketRepository:
         
 
     @staticmethod
-    def get_all_with_users(db):
+    def get_all_with_users(db, page=None):
         try:
-            # Fetch all tickets and eager-load user relationships
-            tickets = db.query(Ticket).all()
-            return tickets, None
+            # ✅ One joined SELECT of only the serialized columns, instead of a lazy load per user
+            rows = db.execute(TicketRepository.all_with_users_statement(page)).all()
+            return rows, None
         except Exception as e:
             return None, str(e)
-        
 
     @staticmethod
-    def update_status(ticket_id, new_status, db):
-        try:
-            ticket = db.query(Ticket).filter_by(ticket_id=ticket_id).first()
-            if not ticket:
-                return None, "Ticket not found"
-
-            ticket.status = new_status
-            ticket.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(ticket)
-            return ticket, None
-        except SQLAlchemyError as e:
-            db.rollback()
-            return None, f"Database error during status update: {str(e)}"
-        except Exception as e:
-            db.rollback()
-            return None, f"Unexpected error during status update: {str(e)}"
-
-
+    def all_with_users_statement(page=None):
+        """SELECT for the agent "all tickets" view: tickets outer-joined to creator and assignee,
+        projected to the columns TicketService._format_ticket_with_users reads."""
+        creator = aliased(User)
+        assignee = aliased(User)
+        user_columns = ("user_id", "name", "email", "role", "contact_number", "location")
+        statement = (
+            select(
+                Ticket.ticket_id,
+                Ticket.issue_description,
+                Ticket.status,
+                Ticket.priority,
+                Ticket.severity,
+                Ticket.created_at,
+                Ticket.updated_at,
+                Ticket.due_date,
+                *[getattr(creator, c).label(f"creator_{c}") for c in user_columns],
+                *[getattr(assignee, c).label(f"assignee_{c}") for c in user_columns],
+            )
+            .outerjoin(creator, Ticket.created_by == creator.user_id)
+            .outerjoin(assignee, Ticket.assigned_to == assignee.user_id)
+        )
+        if page is None:
+            return statement.order_by(Ticket.ticket_id)
+        return Pagination.apply(statement, page, TicketRepository.SORT_COLUMNS, Ticket.ticket_id)
 
     @staticmethod
-    def update_status(ticket_id: int, new_status: str, db: Session):
+    def stream_for_export(status, created_from, created_to, category_id, db, batch_size: int):
+        """Runs the export SELECT on a server-side cursor. The returned Result is consumed lazily,
+        batch_size rows at a time, so the caller must keep db open until it has been iterated."""
         try:
-            ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
-            if not ticket:
-                return None, "Ticket not found"
-
-            ticket.status = new_status
-            ticket.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(ticket)
-            return ticket, None
+            creator = aliased(User)
+            assignee = aliased(User)
+            statement = (
+                select(
+                    Ticket.ticket_id,
+                    Ticket.issue_description,
+                    Ticket.status,
+                    Ticket.priority,
+                    Ticket.severity,
+                    Ticket.issue_category_id,
+                    IssueCategory.category_name,
+                    Ticket.created_at,
+                    Ticket.updated_at,
+                    Ticket.due_date,
+                    creator.user_id.label("creator_user_id"),
+                    creator.name.label("creator_name"),
+                    creator.email.label("creator_email"),
+                    assignee.user_id.label("assignee_user_id"),
+                    assignee.name.label("assignee_name"),
+                    assignee.email.label("assignee_email"),
+                )
+                .outerjoin(IssueCategory, Ticket.issue_category_id == IssueCategory.category_id)
+                .outerjoin(creator, Ticket.created_by == creator.user_id)
+                .outerjoin(assignee, Ticket.assigned_to == assignee.user_id)
+            )
+            if status:
+                statement = statement.where(Ticket.status == status)
+            if created_from:
+                statement = statement.where(Ticket.created_at >= created_from)
+            if created_to:
+                statement = statement.where(Ticket.created_at < created_to)
+            if category_id:
+                statement = statement.where(Ticket.issue_category_id == category_id)
+
+            # ✅ yield_per implies stream_results: rows are fetched from the cursor in batches, not buffered
+            statement = statement.order_by(Ticket.created_at, Ticket.ticket_id).execution_options(yield_per=batch_size)
+            return db.execute(statement), None
         except SQLAlchemyError as e:
-            db.rollback()
-            return None, str(e)
\ No newline at end of file
+            return None, f"DB error while exporting tickets: {str(e)}"
+        except Exception as e:
+            return None, f"Unexpected error while exporting tickets: {str(e)}"
+        
@@ -1,17 +1,25 @@
+import hashlib
+from datetime import datetime
 from sqlalchemy.orm import Session
 from typing import Optional, Tuple
 from app.models.refresh_token import RefreshToken
+from app.models.user import User
 
 class TokenRepository:
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
     @staticmethod
     def store_refresh_token(user_id: int, token: str, db: Session) -> Tuple[Optional[RefreshToken], Optional[str]]:
         try:
-            new_token = RefreshToken(user_id=user_id, token=token)
+            new_token = RefreshToken(user_id=user_id, token_hash=TokenRepository.hash_token(token))
             db.add(new_token)
             db.commit()
             db.refresh(new_token)
             return new_token, None
         except Exception as e:
+            db.rollback()
             return None, str(e)
 
 
@@ -19,20 +27,55 @@ class TokenRepository:
     @staticmethod
     def delete_token(token: str, db: Session):
         try:
-            record = db.query(RefreshToken).filter_by(token=token).first()
-            if not record:
-                return False, None
-            db.delete(record)
+            deleted = (
+                db.query(RefreshToken)
+                .filter(RefreshToken.token_hash == TokenRepository.hash_token(token))
+                .delete(synchronize_session=False)
+            )
             db.commit()
-            return True, None
+            return deleted > 0, None
         except Exception as e:
+            db.rollback()
             return False, str(e)
 
 
 
+    @staticmethod
     def get_token(token: str, db: Session):
         try:
-            record = db.query(RefreshToken).filter_by(token=token).first()
+            record = db.query(RefreshToken).filter_by(token_hash=TokenRepository.hash_token(token)).first()
             return record, None
         except Exception as e:
-            return None, str(e)
\ No newline at end of file
+            return None, str(e)
+
+    @staticmethod
+    def get_token_with_user(token: str, db: Session):
+        try:
+            row = (
+                db.query(RefreshToken, User)
+                .join(User, RefreshToken.user_id == User.user_id)
+                .filter(RefreshToken.token_hash == TokenRepository.hash_token(token))
+                .first()
+            )
+            return row, None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    def delete_expired_batch(batch_size: int, db: Session):
+        try:
+            ids = [
+                row.id for row in
+                db.query(RefreshToken.id)
+                .filter(RefreshToken.expires_at < datetime.utcnow())
+                .limit(batch_size)
+                .all()
+            ]
+            if not ids:
+                return 0, None
+            db.query(RefreshToken).filter(RefreshToken.id.in_(ids)).delete(synchronize_session=False)
+            db.commit()
+            return len(ids), None
+        except Exception as e:
+            db.rollback()
+            return 0, str(e)
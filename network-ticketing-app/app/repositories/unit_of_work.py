@@ -0,0 +1,81 @@
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.exc import SQLAlchemyError
+from app.utils.etag import VERSION_CONFLICT
+
+
+class UnitOfWork:
+    """
+    Groups repository writes made with commit=False into a single flush and commit.
+
+        with UnitOfWork(db) as uow:
+            ticket, err = TicketRepository.assign_ticket(ticket_id, engineer_id, db, commit=False)
+            if err:
+                return None, err            # leaving the block without commit() rolls back
+            _, err = uow.commit()
+
+    commit() keeps the session's objects loaded instead of expiring them, so the caller can build
+    its response from in-memory state without a post-commit refresh/SELECT.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.committed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.committed:
+            self.db.rollback()
+        return False
+
+    def commit(self):
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+            self.committed = True
+            return True, None
+        except StaleDataError:
+            # ✅ A versioned row was changed by another request between our read and this flush
+            self.db.rollback()
+            return None, VERSION_CONFLICT
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            return None, f"DB error during commit: {str(e)}"
+        except Exception as e:
+            self.db.rollback()
+            return None, f"Unexpected error during commit: {str(e)}"
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+
+class AsyncUnitOfWork:
+    """AsyncSession counterpart of UnitOfWork (async sessions are created with expire_on_commit=False)."""
+
+    def __init__(self, db):
+        self.db = db
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if not self.committed:
+            await self.db.rollback()
+        return False
+
+    async def commit(self):
+        try:
+            await self.db.commit()
+            self.committed = True
+            return True, None
+        except StaleDataError:
+            await self.db.rollback()
+            return None, VERSION_CONFLICT
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            return None, f"DB error during commit: {str(e)}"
+        except Exception as e:
+            await self.db.rollback()
+            return None, f"Unexpected error during commit: {str(e)}"
@@ -1,28 +1,51 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.schemas.user import UserCreate
 from datetime import datetime
 from passlib.hash import bcrypt
 from sqlalchemy.orm import Session
 from typing import Tuple, Optional, Dict
+from app.utils.pagination import Pagination
 
 
 class UserRepository:
+    SORT_COLUMNS = {
+        "user_id": User.user_id,
+        "created_at": User.created_at,
+    }
+
+    @staticmethod
+    def user_by_id_statement(user_id: int):
+        return select(User).where(User.user_id == user_id)
+
+    @staticmethod
+    def user_by_email_statement(email: str):
+        return select(User).where(User.email == email)
+
     @staticmethod
     def get_user_by_id(user_id: int, db):
         try:
-            user = db.query(User).filter(User.user_id == user_id).first()
+            user = db.execute(UserRepository.user_by_id_statement(user_id)).scalars().first()
             if not user:
                 return None
             return user
         except Exception as e:
             return None
 
+    @staticmethod
+    def get_engineer_ids(db):
+        try:
+            rows = db.query(User.user_id).filter(User.role == UserRole.engineer).all()
+            return [user_id for (user_id,) in rows], None
+        except Exception as e:
+            return None, str(e)
+
     @staticmethod
     def get_user_by_email(email: str, db: Session):
         try:
             print("Querying for email:", email)
-            user = db.query(User).filter(User.email == email).first()
+            user = db.execute(UserRepository.user_by_email_statement(email)).scalars().first()
             print("Found user:", user)
             return user, None
         except Exception as e:
@@ -50,9 +73,10 @@ class UserRepository:
         
 
     @staticmethod
-    def get_all_users(db: Session):
+    def get_all_users(db: Session, page=None):
         try:
-            users = db.query(User).all()
+            query = Pagination.apply(db.query(User), page, UserRepository.SORT_COLUMNS, User.user_id)
+            users = query.all()
             return users,None
         except Exception as e:
             return None, str(e)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from app.database import TICKET_DB_MODE
 from app.views.auth_view import auth_router
 from app.views.user_view import user_router
 from app.views.ticket_view import ticket_router
@@ -6,13 +7,21 @@ from app.views.issue_category_view import issue_category_router
 from app.views.sla_view import sla_router
 from app.views.address_view import address_router
 from app.views.feedback_view import feedback_router  # ✅ import added
+from app.views.metrics_view import metrics_router
+from app.views.event_view import event_router
 
 network_ticketing_router = APIRouter()
 
 network_ticketing_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
 network_ticketing_router.include_router(user_router, prefix="/user", tags=["user"])
+if TICKET_DB_MODE == "async":
+    # Registered first so its routes win; anything it does not implement falls through to ticket_router
+    from app.views.async_ticket_view import async_ticket_router
+    network_ticketing_router.include_router(async_ticket_router, prefix="/tickets", tags=["tickets"])
 network_ticketing_router.include_router(ticket_router, prefix="/tickets", tags=["tickets"])
 network_ticketing_router.include_router(issue_category_router, prefix="/issue/category", tags=["issue category"])
 network_ticketing_router.include_router(sla_router, prefix="/sla", tags=["SLA"])
 network_ticketing_router.include_router(address_router, prefix="/address", tags=["address"])
-network_ticketing_router.include_router(feedback_router, prefix="/feedback", tags=["feedback"]) 
+network_ticketing_router.include_router(feedback_router, prefix="/feedback", tags=["feedback"])
+network_ticketing_router.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
+network_ticketing_router.include_router(event_router, prefix="/events", tags=["events"])
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from enum import Enum
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 # Enums for status, severity, and priority
@@ -29,16 +29,32 @@ class TicketCreateRequest(BaseModel):
     issue_category_id: int
     address_id: int
 
+# ✅ Request schema for bulk ticket creation (one entry per ticket, results reported per index)
+class BulkTicketCreateRequest(BaseModel):
+    tickets: List[TicketCreateRequest]
+
 # ✅ Request schema for ticket classification (used by admin/manager/agent)
 class ClassifyTicketRequest(BaseModel):
     severity: Severity
     priority: Priority
     sla_id: int
 
+# ✅ Request schema for bulk classification: one classification applied to every listed ticket
+class BulkClassifyTicketsRequest(BaseModel):
+    ticket_ids: List[int]
+    severity: Severity
+    priority: Priority
+    sla_id: int
+
 # ✅ Request schema for assignment (used by admin)
 class AssignTicketRequest(BaseModel):
     assigned_to: int
 
+# ✅ Request schema for bulk assignment of several tickets to one engineer
+class BulkAssignTicketsRequest(BaseModel):
+    ticket_ids: List[int]
+    assigned_to: int
+
 # ✅ Request schema for status update (used by engineer/admin)
 class UpdateStatusRequest(BaseModel):
     status: TicketStatus
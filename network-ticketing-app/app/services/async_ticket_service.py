@@ -0,0 +1,451 @@
+from datetime import datetime, timedelta
+from app.models.ticket import Severity, Priority, TicketStatus
+from app.repositories.async_ticket_repository import AsyncTicketRepository
+from app.repositories.async_assignment_repository import AsyncAssignmentRepository
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.issue_category_repository import IssueCategoryRepository
+from app.repositories.sla_repository import SLARepository
+from app.repositories.unit_of_work import AsyncUnitOfWork
+from app.services.ticket_service import TicketService
+from app.services.ticket_transitions import TicketTransitions, TicketStatusChange
+from app.schemas.ticket import AssignTicketRequest, ClassifyTicketRequest, UpdateTicketRequest
+from app.utils.etag import ETag, VERSION_CONFLICT
+from app.utils.pagination import Pagination, PAGE_SIZE_DEFAULT
+from app.utils.workload_index import workload_index, OPEN_STATUSES
+from app.tasks.sla_breach_scheduler import sla_breach_scheduler, SLA_OPEN_STATUSES
+from app.utils.ticket_events import ticket_event_bus
+from app.tasks.action_log_writer import action_log_writer
+
+
+class AsyncTicketService:
+    """AsyncSession counterpart of TicketService; business rules and response shapes match it."""
+
+    @staticmethod
+    async def create_ticket(user, ticket_data, db):
+        if user.role.value != "customer":
+            return None, "Only customers can create tickets"
+
+        # Validate issue category
+        category, err = await db.run_sync(
+            lambda session: IssueCategoryRepository.get_by_id(ticket_data.issue_category_id, session)
+        )
+        if err:
+            return None, err
+        if not category:
+            return None, f"Issue category with ID {ticket_data.issue_category_id} does not exist"
+
+        # ✅ Validate address
+        address, err = await AsyncTicketRepository.get_address_by_id(ticket_data.address_id, user.user_id, db)
+        if not address:
+            return None, f"Chosen address does not belong to the user"
+
+        # ✅ Create ticket
+        now = datetime.utcnow().replace(microsecond=0)
+        async with AsyncUnitOfWork(db) as uow:
+            ticket, err = await AsyncTicketRepository.create_ticket(
+                user_id=user.user_id,
+                ticket_data=ticket_data,
+                db=db,
+                created_at=now,
+                updated_at=now,
+                due_date=None,
+                address_id=ticket_data.address_id,
+                commit=False
+            )
+            if err:
+                return None, f"Ticket creation failed: {err}"
+
+            _, err = await uow.commit()
+            if err:
+                return None, f"Ticket creation failed: {err}"
+
+        ticket_event_bus.publish(
+            "created", ticket.ticket_id, user.user_id, None,
+            status="new", issue_category_id=ticket.issue_category_id
+        )
+        action_log_writer.record(ticket.ticket_id, user.user_id, TicketStatus.new, "Ticket created")
+        return ticket, None
+
+    @staticmethod
+    async def get_unclassified_tickets(user, db, page=None):
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can view unclassified tickets"
+
+        tickets, err = await AsyncTicketRepository.get_tickets_without_sla(db, page)
+        if err:
+            return None, "Failed to fetch unclassified tickets"
+
+        return Pagination.page_of(tickets, page, "ticket_id"), None
+
+    @staticmethod
+    async def classify_ticket(user, ticket_id: int, payload: ClassifyTicketRequest, db, expected_versions=None):
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can classify tickets"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
+
+        # ✅ The SLA cache is sync; run_sync only touches the database when it needs a version check
+        sla, err = await db.run_sync(lambda session: SLARepository.get_by_id(payload.sla_id, session))
+        if err:
+            return None, err
+        if not sla:
+            return None, f"SLA with ID {payload.sla_id} does not exist"
+
+        due_date = datetime.utcnow().replace(microsecond=0) + timedelta(hours=sla.time_limit_hr)
+
+        async with AsyncUnitOfWork(db) as uow:
+            ticket, err = await AsyncTicketRepository.classify_ticket(
+                ticket_id=ticket_id,
+                severity=Severity(payload.severity.value),
+                priority=Priority(payload.priority.value),
+                sla_id=payload.sla_id,
+                due_date=due_date,
+                db=db,
+                commit=False
+            )
+            if err:
+                return None, f"Classification failed: {err}"
+
+            _, err = await uow.commit()
+            if err:
+                return None, f"Classification failed: {err}"
+
+        if ticket.status in OPEN_STATUSES:
+            # ✅ Reclassifying an open ticket changes its weight on the assignee's workload
+            workload_index.assign(ticket_id, ticket.assigned_to, ticket.priority, ticket.severity)
+        sla_breach_scheduler.track(
+            ticket_id, ticket.status, ticket.sla_warning_at, ticket.sla_critical_at, ticket.due_date
+        )
+        ticket_event_bus.publish(
+            "classified", ticket_id, ticket.created_by, ticket.assigned_to,
+            severity=payload.severity.value, priority=payload.priority.value,
+            sla_id=payload.sla_id, due_date=str(ticket.due_date)
+        )
+        action_log_writer.record(
+            ticket_id, user.user_id, ticket.status,
+            f"Classified: severity {payload.severity.value}, priority {payload.priority.value}, SLA {payload.sla_id}"
+        )
+        return ticket, None
+
+    @staticmethod
+    async def assign_ticket(user, ticket_id, payload, db, expected_versions=None):
+        if user.role.value == "customer":
+            return None, "Customers can't assign tickets!"
+
+        engineer = await AsyncUserRepository.get_user_by_id(payload.assigned_to, db)
+        if not engineer or engineer.role.value != "engineer":
+            return None, "Assigned user must be a valid engineer"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
+
+        # ✅ Ensure ticket is classified before assignment
+        if not ticket.severity or not ticket.priority or not ticket.sla_id:
+            return None, "Ticket must be classified (severity, priority, SLA) before assignment"
+
+        # ✅ Ensure ticket is in a valid state for assignment
+        if ticket.status.value not in ["new", "reopened"]:
+            return None, f"Ticket with status '{ticket.status.value}' cannot be assigned"
+
+        async with AsyncUnitOfWork(db) as uow:
+            ticket, err = await AsyncTicketRepository.assign_ticket(ticket_id, payload.assigned_to, db, commit=False)
+            if err:
+                return None, f"Assignment failed: {err}"
+
+            _, log_err = await AsyncAssignmentRepository.log_assignment(
+                ticket_id=ticket_id,
+                assigned_to=payload.assigned_to,
+                assigned_by=user.user_id,
+                db=db,
+                commit=False
+            )
+            if log_err:
+                return None, f"Assignment log failed: {log_err}"
+
+            _, err = await uow.commit()
+            if err:
+                return None, f"Assignment failed: {err}"
+
+        workload_index.assign(ticket_id, payload.assigned_to, ticket.priority, ticket.severity)
+        ticket_event_bus.publish(
+            "assigned", ticket_id, ticket.created_by, payload.assigned_to,
+            assigned_to=payload.assigned_to, status="assigned"
+        )
+        action_log_writer.record(ticket_id, user.user_id, TicketStatus.assigned, f"Assigned to user {payload.assigned_to}")
+        return ticket, None
+
+    @staticmethod
+    async def auto_assign_ticket(user, ticket_id, db, expected_versions=None):
+        if user.role.value == "customer":
+            return None, "Customers can't assign tickets!"
+
+        engineer_id = workload_index.pick()
+        if engineer_id is None:
+            return None, "No engineers available for assignment"
+
+        return await AsyncTicketService.assign_ticket(
+            user, ticket_id, AssignTicketRequest(assigned_to=engineer_id), db, expected_versions
+        )
+
+    @staticmethod
+    async def claim_next_ticket(user, db):
+        if user.role.value != "engineer":
+            return None, "Only engineers can claim tickets"
+
+        async with AsyncUnitOfWork(db) as uow:
+            ticket_id, err = await AsyncTicketRepository.claim_next_ticket(user.user_id, db, commit=False)
+            if err:
+                return None, f"Claim failed: {err}"
+            if ticket_id is None:
+                return None, "No tickets waiting to be claimed"
+
+            _, log_err = await AsyncAssignmentRepository.log_assignment(
+                ticket_id=ticket_id,
+                assigned_to=user.user_id,
+                assigned_by=user.user_id,
+                db=db,
+                commit=False
+            )
+            if log_err:
+                return None, f"Assignment log failed: {log_err}"
+
+            _, err = await uow.commit()
+            if err:
+                return None, f"Claim failed: {err}"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+
+        workload_index.assign(ticket_id, user.user_id, ticket.priority, ticket.severity)
+        ticket_event_bus.publish(
+            "assigned", ticket_id, ticket.created_by, user.user_id,
+            assigned_to=user.user_id, status="assigned"
+        )
+        action_log_writer.record(ticket_id, user.user_id, TicketStatus.assigned, "Claimed from the classified queue")
+        return ticket, None
+
+    @staticmethod
+    async def change_ticket_status(user, ticket_id, new_status: str, db, expected_versions=None):
+        if user.role.value == "engineer":
+            return await AsyncTicketService._transition("engineer_update", ticket_id, new_status, user.user_id, db, expected_versions)
+        if user.role.value == "admin":
+            return await AsyncTicketService._transition("admin_update", ticket_id, new_status, user.user_id, db, expected_versions)
+
+        return None, "Only engineers or admins can change ticket status"
+
+    @staticmethod
+    async def _transition(action: str, ticket_id: int, new_status: str, user_id, db, expected_versions=None,
+                    actor_id=None):
+        now = datetime.utcnow().replace(microsecond=0)
+        conditions, err = TicketTransitions.plan(action, new_status, user_id, now, expected_versions)
+        if err:
+            return None, err
+
+        written, err = await AsyncTicketRepository.transition_status(
+            ticket_id, TicketStatus(new_status), db=db, updated_at=now, **conditions
+        )
+        if err:
+            return None, f"Failed to update ticket status: {err}"
+
+        if written is None:
+            state, err = await AsyncTicketRepository.get_transition_state(ticket_id, db)
+            if err:
+                return None, err
+            return None, TicketTransitions.explain_rejection(action, new_status, conditions, state)
+
+        workload_index.transition(ticket_id, TicketStatus(new_status))
+        if TicketStatus(new_status) not in SLA_OPEN_STATUSES:
+            sla_breach_scheduler.cancel(ticket_id)
+
+        # ✅ The UPDATE returned the owners and SLA instants, so no follow-up read is needed
+        if TicketStatus(new_status) == TicketStatus.reopened:
+            sla_breach_scheduler.track(
+                ticket_id, written.status, written.sla_warning_at, written.sla_critical_at, written.due_date
+            )
+        ticket_event_bus.publish(
+            "status_changed", ticket_id, written.created_by, written.assigned_to, status=new_status
+        )
+        # ✅ actor_id names the caller when user_id is not an ownership condition (agent updates)
+        if (actor_id or user_id) is not None:
+            action_log_writer.record(ticket_id, actor_id or user_id, TicketStatus(new_status))
+        return TicketStatusChange(ticket_id, TicketStatus(new_status), now, written.version), None
+
+    @staticmethod
+    async def get_engineer_tickets(user, status_filter, db, page=None):
+        if user.role.value != "engineer":
+            return None, "Only engineers can view assigned tickets"
+
+        tickets, err = await AsyncTicketRepository.get_tickets_by_assignee(
+            user_id=user.user_id,
+            status=status_filter,
+            db=db,
+            page=page
+        )
+        if err:
+            return None, err
+
+        return Pagination.page_of(tickets, page, "ticket_id"), None
+
+    @staticmethod
+    async def start_ticket_work(user, ticket_id, db, expected_versions=None):
+        if user.role.value != "engineer":
+            return None, "Only engineers can start ticket work"
+
+        return await AsyncTicketService._transition("start_work", ticket_id, "in_progress", user.user_id, db, expected_versions)
+
+    @staticmethod
+    async def get_ticket_details(user, ticket_id: int, db):
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+
+        # 👷 Engineer can only view tickets assigned to them
+        if user.role.value == "engineer" and ticket.assigned_to != user.user_id:
+            return None, "You are not assigned to this ticket"
+
+        return ticket, None
+
+    @staticmethod
+    async def search_tickets(user, query: str, limit, db):
+        words, err = TicketService._search_words(user, query, limit)
+        if err:
+            return None, err
+
+        hits, err = await AsyncTicketRepository.search_tickets(words, limit or PAGE_SIZE_DEFAULT, db)
+        if err:
+            return None, err
+        return [TicketService._format_search_hit(row, score) for row, score in hits], None
+
+    @staticmethod
+    async def get_ticket_timeline(user, ticket_id: int, db, page):
+        state, err = await AsyncTicketRepository.get_followup_state(ticket_id, db)
+        if err:
+            return None, f"Failed to fetch ticket: {err}"
+        err = TicketService._timeline_access_error(user, state)
+        if err:
+            return None, err
+
+        events, err = await AsyncTicketRepository.get_ticket_timeline(ticket_id, page, db)
+        if err:
+            return None, err
+
+        result = Pagination.page_of(events, page, "event_key")
+        result.items = [TicketService._format_timeline_event(e) for e in result.items]
+        return result, None
+
+    @staticmethod
+    async def update_ticket_by_customer(ticket_id: int, payload: UpdateTicketRequest, db, user, expected_versions=None):
+        if user.role.value != "customer":
+            return None, "Only customers can edit their own tickets"
+
+        # Validate required fields
+        if not payload.issue_description or not payload.issue_category_id or not payload.address_id:
+            return None, "Missing required fields"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_customer(ticket_id, user.user_id, db)
+        if err:
+            return None, err
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
+
+        updated_ticket, err = await AsyncTicketRepository.update_ticket(ticket, payload, db)
+        if err:
+            return None, err
+
+        return updated_ticket, None
+
+    @staticmethod
+    async def delete_ticket_by_customer(ticket_id: int, db, user, expected_versions=None):
+        if user.role.value != "customer":
+            return None, "Only customers can delete their tickets"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+        if ticket.created_by != user.user_id:
+            return None, "You are not authorized to delete this ticket"
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
+
+        success, err = await AsyncTicketRepository.delete_ticket_by_customer(
+            ticket_id, user.user_id, db, ticket.version
+        )
+        if err:
+            return None, err
+        workload_index.release(ticket_id)
+        sla_breach_scheduler.cancel(ticket_id)
+        return success, None
+
+    @staticmethod
+    async def get_ticket_summary_for_customer(ticket_id: int, user, db):
+        if user.role.value != "customer":
+            return None, "Only customers can view their own tickets"
+
+        ticket, err = await AsyncTicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+        if ticket.created_by != user.user_id:
+            return None, "You are not authorized to view this ticket"
+
+        address, err = await AsyncTicketRepository.get_address_by_id(ticket.address_id, user.user_id, db)
+        if err:
+            return None, err
+
+        category, err = await AsyncTicketRepository.get_issue_category_by_id(ticket.issue_category_id, db)
+        if err:
+            return None, err
+
+        full_address = f"{address.street}, {address.city}, {address.state}, {address.postal_code}, {address.country}"
+
+        return {
+            "ticket_id": ticket.ticket_id,
+            "issue_description": ticket.issue_description,
+            "address": full_address,
+            "status": ticket.status,
+            "issue_category_id": ticket.issue_category_id,
+            "issue_category_name": category.category_name
+        }, None
+
+    @staticmethod
+    async def get_classified_tickets(user, db, page=None):
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can view classified tickets"
+
+        tickets, err = await AsyncTicketRepository.get_classified_tickets(db, page)
+        if err:
+            return None, f"Error fetching classified tickets: {err}"
+
+        result = Pagination.page_of(tickets, page, "ticket_id")
+        result.items = [TicketService._format_classified_ticket(t) for t in result.items]
+        return result, None
+
+    @staticmethod
+    async def get_all_tickets_with_users(db, page=None):
+        tickets, err = await AsyncTicketRepository.get_all_with_users(db, page)
+        if err:
+            return None, f"Error fetching tickets: {err}"
+
+        result = Pagination.page_of(tickets, page, "ticket_id")
+        result.items = [TicketService._format_ticket_with_users(t) for t in result.items]
+        return result, None
+
+    @staticmethod
+    async def update_ticket_status_by_agent(ticket_id: int, new_status: str, db, expected_versions=None, actor_id=None):
+        return await AsyncTicketService._transition(
+            "agent_update", ticket_id, new_status.lower(), None, db, expected_versions, actor_id=actor_id
+        )
+
+    @staticmethod
+    async def reopen_ticket_by_customer(ticket_id: int, db, user, expected_versions=None):
+        if user.role.value != "customer":
+            return None, "Only customers can reopen tickets"
+
+        return await AsyncTicketService._transition("customer_reopen", ticket_id, "reopened", user.user_id, db, expected_versions)
@@ -1,17 +1,20 @@
-from passlib.hash import bcrypt
+from starlette.concurrency import run_in_threadpool
 from app.repositories.user_repository import UserRepository
 from app.utils.jwt_handler import JWTHandler
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.repositories.token_repository import TokenRepository
+from app.utils.password_hasher import PasswordHasher
 
 
 
 class AuthService:
+    # Blocking DB calls go through run_in_threadpool and bcrypt through the
+    # PasswordHasher pool, so these coroutines never block the event loop.
     @staticmethod
-    def signup(user, db):
-        existing_user, err = UserRepository.get_user_by_email(user.email, db)
+    async def signup(user, db):
+        existing_user, err = await run_in_threadpool(UserRepository.get_user_by_email, user.email, db)
         if user.role != "customer":
             return None, "Cant have any other role than customer"
         if err:
@@ -20,26 +23,34 @@ class AuthService:
             return None, "Email already registered"
 
         safe_password = user.password[:72]
-        hashed_pw = bcrypt.hash(safe_password)
-        new_user, err = UserRepository.create_user(user, hashed_pw, db)
+        hashed_pw, err = await PasswordHasher.hash(safe_password)
+        if err:
+            return None, err
+        new_user, err = await run_in_threadpool(UserRepository.create_user, user, hashed_pw, db)
         if err:
             return None, f"User creation failed: {err}"
 
         return new_user, None
     
     @staticmethod
-    def login(user_data, db):
+    async def login(user_data, db):
         print("service entered")
         print("Email is: ", user_data.email)
-        user, err = UserRepository.get_user_by_email(user_data.email, db)
+        user, err = await run_in_threadpool(UserRepository.get_user_by_email, user_data.email, db)
         print("user", user)
         if err:
             return None, "Database error during email check"
-        if not user or not bcrypt.verify(user_data.password, user.password_hash):
+        if not user:
+            return None, "Invalid email or password"
+
+        valid, err = await PasswordHasher.verify(user_data.password, user.password_hash)
+        if err:
+            return None, err
+        if not valid:
             return None, "Invalid email or password"
 
         access_token = JWTHandler.create_access_token(
-            {"sub": user.email},
+            JWTHandler.build_access_claims(user),
             expires_delta=timedelta(minutes=15)
         )
 
@@ -48,7 +59,7 @@ class AuthService:
             expires_delta=timedelta(days=7)
         )
 
-        _, token_err = TokenRepository.store_refresh_token(user.user_id, refresh_token, db)
+        _, token_err = await run_in_threadpool(TokenRepository.store_refresh_token, user.user_id, refresh_token, db)
         if token_err:
             return None, f"Failed to store refresh token: {token_err}"
 
@@ -68,20 +79,18 @@ class AuthService:
 
     @staticmethod
     def refresh_access_token(refresh_token: str, db: Session):
-        token_record, err = TokenRepository.get_token(refresh_token, db)
-        if err or not token_record:
+        # ✅ Token record and its user in one joined query
+        row, err = TokenRepository.get_token_with_user(refresh_token, db)
+        if err or not row:
             return None, "Invalid or expired refresh token"
+        token_record, user = row
 
         # Optional: check expiry
         if token_record.expires_at < datetime.utcnow():
             return None, "Refresh token has expired"
 
-        user = db.query(User).filter_by(user_id=token_record.user_id).first()
-        if not user:
-            return None, "User not found"
-
         new_access_token = JWTHandler.create_access_token(
-            {"sub": user.email},
+            JWTHandler.build_access_claims(user),
             expires_delta=timedelta(minutes=15)
         )
 
@@ -105,16 +114,18 @@ class AuthService:
     
 
     @staticmethod
-    def admin_signup(user, db):
-        existing_user, err = UserRepository.get_user_by_email(user.email, db)
+    async def admin_signup(user, db):
+        existing_user, err = await run_in_threadpool(UserRepository.get_user_by_email, user.email, db)
         if err:
             return None, "Database error during email check"
         if existing_user:
             return None, "Email already registered"
 
         safe_password = user.password[:72]
-        hashed_pw = bcrypt.hash(safe_password)
-        new_user, err = UserRepository.create_user(user, hashed_pw, db)
+        hashed_pw, err = await PasswordHasher.hash(safe_password)
+        if err:
+            return None, err
+        new_user, err = await run_in_threadpool(UserRepository.create_user, user, hashed_pw, db)
         if err:
             return None, f"User creation failed: {err}"
 
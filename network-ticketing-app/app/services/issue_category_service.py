@@ -20,16 +20,19 @@ class IssueCategoryService:
 
     @staticmethod
     def list_all(db):
-        categories, err = IssueCategoryRepository.list_all(db)
+        catalog, err = IssueCategoryRepository.catalog(db)
         if err:
             return None, err
 
-        return [
-            {
-                "category_id": c.category_id,
-                "category_name": c.category_name
-            } for c in categories
-        ], None
+        return {
+            "items": [
+                {
+                    "category_id": c.category_id,
+                    "category_name": c.category_name
+                } for c in catalog.rows
+            ],
+            "etag": catalog.etag
+        }, None
 
     @staticmethod
     def update(category_id, payload, db):
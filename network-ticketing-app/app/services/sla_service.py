@@ -1,9 +1,13 @@
 from app.repositories.sla_repository import SLARepository
 from app.schemas.sla import SLAResponse
-from datetime import datetime, timezone
+from app.utils.pagination import Pagination
+from app.utils.sla_thresholds import SLA_COLORS
+from datetime import datetime
 
 
 class SLAService:
+    SLA_STATUS_SORTS = ("due_date", "-due_date")
+
     @staticmethod
     def create(payload, db):
         sla, err = SLARepository.create(payload, db)
@@ -78,43 +82,29 @@ class SLAService:
 
 
     @staticmethod
-    def get_sla_status_for_agent(db):
-        tickets, err = SLARepository.get_tickets_with_sla_for_agent(db)
+    def get_sla_status_for_agent(db, page=None, color=None, remaining_lt=None):
+        if color is not None and color not in SLA_COLORS:
+            return None, f"color must be one of: {', '.join(SLA_COLORS)}"
+        if remaining_lt is not None and remaining_lt < 0:
+            return None, "remaining_lt must be a non-negative number of seconds"
+
+        # ✅ Timestamps are stored as naive UTC, so compare against naive UTC
+        now = datetime.utcnow().replace(microsecond=0)
+        rows, err = SLARepository.get_tickets_with_sla_for_agent(now, db, color, remaining_lt, page)
         if err:
             return None, "Error fetching tickets: " + err
 
-        response = []
-        now = datetime.now(timezone.utc)
-
-        for t in tickets:
-            if not t.due_date:
-                continue
-
-            created = t.created_at.replace(tzinfo=timezone.utc)
-            due = t.due_date.replace(tzinfo=timezone.utc)
-
-            total_sla = (due - created).total_seconds()
-            remaining = (due - now).total_seconds()
-
-            if remaining < 0:
-                color = "red"
-            else:
-                pct = remaining / total_sla
-                if pct > 0.4:
-                    color = "green"
-                elif pct > 0.1:
-                    color = "yellow"
-                else:
-                    color = "red"
-
-            response.append({
+        result = Pagination.page_of(rows, page, "ticket_id")
+        result.items = [
+            {
                 "ticket_id": t.ticket_id,
                 "issue_description": t.issue_description,
                 "priority": t.priority.value if t.priority else None,
                 "severity": t.severity.value if t.severity else None,
                 "due_date": t.due_date.isoformat(),
-                "remaining_seconds": max(int(remaining), 0),
-                "sla_status_color": color
-            })
-
-        return response, None
\ No newline at end of file
+                "remaining_seconds": max(int((t.due_date - now).total_seconds()), 0),
+                "sla_status_color": t.sla_status_color
+            }
+            for t in result.items
+        ]
+        return result, None
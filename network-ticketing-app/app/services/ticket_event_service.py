@@ -0,0 +1,76 @@
+import asyncio
+import json
+import os
+from app.utils.ticket_events import ticket_event_bus
+
+# Comment frames keep idle connections from being closed by proxies; retry is the client's reconnect delay
+TICKET_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("TICKET_EVENTS_KEEPALIVE_SECONDS", 15))
+TICKET_EVENTS_RETRY_MS = int(os.getenv("TICKET_EVENTS_RETRY_MS", 3000))
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+class TicketEventService:
+    @staticmethod
+    def open_stream(user, last_event_id: str = None):
+        """
+        Returns an async generator of Server-Sent Events frames for the user's ticket changes.
+        It subscribes when the response starts, so the subscription lives on the event loop and
+        is released when the client disconnects.
+        """
+        return TicketEventService._frames(user.user_id, user.role.value, last_event_id), None
+
+    @staticmethod
+    async def _frames(user_id: int, role: str, last_event_id: str):
+        subscription, replay, err = ticket_event_bus.subscribe(user_id, role, last_event_id)
+        if err:
+            yield TicketEventService._frame("error", {"message": err})
+            return
+
+        try:
+            yield f"retry: {TICKET_EVENTS_RETRY_MS}\n\n"
+
+            sent = 0
+            if replay is None:
+                # ✅ The id lets the next reconnect resume from here instead of resetting again
+                yield TicketEventService._frame(
+                    "reset",
+                    {"message": "Missed events are no longer available, reload the ticket lists"},
+                    ticket_event_bus.stats()["last_event_id"]
+                )
+            else:
+                for event in replay:
+                    sent = event.event_id
+                    yield TicketEventService._event_frame(event)
+
+            while True:
+                # ✅ A connection that fell behind is closed once its queue is drained; the client
+                # reconnects with Last-Event-ID and the rest comes from the replay buffer
+                if subscription.lagged and subscription.queue.empty():
+                    yield TicketEventService._frame("lagged", {"message": "Too far behind, reconnect to resume"})
+                    return
+
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), TICKET_EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                # Events published while subscribing can arrive both in the replay and the queue
+                if event.event_id <= sent:
+                    continue
+                sent = event.event_id
+                yield TicketEventService._event_frame(event)
+        finally:
+            ticket_event_bus.unsubscribe(subscription)
+
+    @staticmethod
+    def _event_frame(event):
+        return TicketEventService._frame(event.kind, event.to_dict(), ticket_event_bus.event_id(event))
+
+    @staticmethod
+    def _frame(kind: str, data: dict, event_id: str = None):
+        lines = [f"id: {event_id}"] if event_id else []
+        lines.append(f"event: {kind}")
+        lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+        return "\n".join(lines) + "\n\n"
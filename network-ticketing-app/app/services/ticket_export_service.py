@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from app.database import SessionLocal
+from app.models.ticket import TicketStatus
+from app.repositories.ticket_repository import TicketRepository
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_COLUMNS = (
+    "ticket_id", "issue_description", "status", "priority", "severity",
+    "issue_category_id", "category_name", "created_at", "updated_at", "due_date",
+    "creator_user_id", "creator_name", "creator_email",
+    "assignee_user_id", "assignee_name", "assignee_email",
+)
+
+
+class TicketExportService:
+    @staticmethod
+    def open_export(user, fmt: str, status, created_from, created_to, category_id):
+        """
+        Validates the export request and starts the query. Returns a generator of response chunks,
+        one per fetched batch, that owns its own session: the request-scoped session from get_db
+        is closed before a StreamingResponse body is sent.
+        """
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can export tickets"
+
+        if fmt not in EXPORT_MEDIA_TYPES:
+            return None, f"format must be one of: {', '.join(EXPORT_MEDIA_TYPES)}"
+
+        if status:
+            try:
+                status = TicketStatus(status)
+            except ValueError:
+                return None, f"Invalid status '{status}'"
+
+        if created_from and created_to and created_from >= created_to:
+            return None, "created_from must be before created_to"
+
+        # ✅ Run the query now so connection errors surface as a status code, not a truncated body
+        db = SessionLocal()
+        result, err = TicketRepository.stream_for_export(
+            status, created_from, created_to, category_id, db, EXPORT_BATCH_SIZE
+        )
+        if err:
+            db.close()
+            return None, err
+
+        return TicketExportService._chunks(result, fmt, db), None
+
+    @staticmethod
+    def _chunks(result, fmt: str, db):
+        try:
+            if fmt == "csv":
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(EXPORT_COLUMNS)
+                for rows in result.partitions():
+                    writer.writerows(TicketExportService._values(row) for row in rows)
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate(0)
+                if buffer.tell():
+                    yield buffer.getvalue()  # header only: no rows matched
+            else:
+                for rows in result.partitions():
+                    yield "".join(
+                        json.dumps(dict(zip(EXPORT_COLUMNS, TicketExportService._values(row)))) + "\n"
+                        for row in rows
+                    )
+        finally:
+            result.close()
+            db.close()
+
+    @staticmethod
+    def _values(row):
+        mapping = row._mapping
+        return [TicketExportService._value(mapping[c]) for c in EXPORT_COLUMNS]
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if hasattr(value, "value"):
+            return value.value
+        return value
@@ -1,63 +1,166 @@
+import os
 from datetime import datetime, timedelta
-from app.models.sla import SLA
-from app.models.issue_category import IssueCategory
-from app.models.address import Address
+from app.models.ticket import Severity, Priority, TicketStatus
 from app.repositories.ticket_repository import TicketRepository
 from app.repositories.assignment_repository import AssignmentRepository
+from app.repositories.issue_category_repository import IssueCategoryRepository
+from app.repositories.sla_repository import SLARepository
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.ticket_transitions import TicketTransitions, TicketStatusChange
 from app.repositories.user_repository import UserRepository
-from app.schemas.ticket import ClassifyTicketRequest, TicketResponse
+from app.schemas.ticket import AssignTicketRequest, ClassifyTicketRequest, TicketResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
 from app.schemas.ticket import UpdateTicketRequest
+from app.utils.etag import ETag, VERSION_CONFLICT
+from app.utils.pagination import Pagination, PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+from app.utils.ticket_search import tokenize
+from app.utils.sla_thresholds import SLAThresholds
+from app.utils.workload_index import workload_index, OPEN_STATUSES
+from app.tasks.sla_breach_scheduler import sla_breach_scheduler, SLA_OPEN_STATUSES
+from app.utils.ticket_events import ticket_event_bus
+from app.tasks.action_log_writer import action_log_writer
 
+TICKET_BULK_MAX_ITEMS = int(os.getenv("TICKET_BULK_MAX_ITEMS", 500))
 
 
 class TicketService:
+    # ✅ Sort orders each list endpoint accepts (first entry is the default)
+    ALL_TICKETS_SORTS = ("ticket_id", "-ticket_id", "created_at", "-created_at", "due_date", "-due_date")
+    UNCLASSIFIED_SORTS = ("created_at", "-created_at")
+    CLASSIFIED_SORTS = ("created_at", "-created_at")
+    ASSIGNED_SORTS = ("created_at", "-created_at", "due_date", "-due_date")
+    TIMELINE_SORTS = ("event_time", "-event_time")
+
     @staticmethod
     def create_ticket(user, ticket_data, db):
         if user.role.value != "customer":
             return None, "Only customers can create tickets"
 
         # Validate issue category
-        category = db.query(IssueCategory).filter_by(category_id=ticket_data.issue_category_id).first()
+        category, err = IssueCategoryRepository.get_by_id(ticket_data.issue_category_id, db)
+        if err:
+            return None, err
         if not category:
             return None, f"Issue category with ID {ticket_data.issue_category_id} does not exist"
 
         # ✅ Validate address
-        address = db.query(Address).filter_by(address_id=ticket_data.address_id, user_id=user.user_id).first()
+        address, err = TicketRepository.get_address_by_id(ticket_data.address_id, user.user_id, db)
         if not address:
             return None, f"Chosen address does not belong to the user"
 
-        # ✅ Create ticket
-        now = datetime.utcnow()
-        ticket, err = TicketRepository.create_ticket(
-            user_id=user.user_id,
-            ticket_data=ticket_data,
-            db=db,
-            created_at=now,
-            updated_at=now,
-            due_date=None,
-            address_id=ticket_data.address_id  # ✅ Pass address_id
+        # ✅ Create ticket (whole seconds, so the in-memory values match what a TIMESTAMP column stores)
+        now = datetime.utcnow().replace(microsecond=0)
+        with UnitOfWork(db) as uow:
+            ticket, err = TicketRepository.create_ticket(
+                user_id=user.user_id,
+                ticket_data=ticket_data,
+                db=db,
+                created_at=now,
+                updated_at=now,
+                due_date=None,
+                address_id=ticket_data.address_id,  # ✅ Pass address_id
+                commit=False
+            )
+            if err:
+                return None, f"Ticket creation failed: {err}"
+
+            _, err = uow.commit()
+            if err:
+                return None, f"Ticket creation failed: {err}"
+
+        ticket_event_bus.publish(
+            "created", ticket.ticket_id, user.user_id, None,
+            status="new", issue_category_id=ticket.issue_category_id
+        )
+        action_log_writer.record(ticket.ticket_id, user.user_id, TicketStatus.new, "Ticket created")
+        return ticket, None
+
+
+    @staticmethod
+    def bulk_create_tickets(user, items, db):
+        """
+        Validates every item against one catalog lookup and one address IN query, then inserts the
+        valid ones in a single statement and commit. Returns one result per item, in request order.
+        """
+        if user.role.value != "customer":
+            return None, "Only customers can create tickets"
+        if not items:
+            return None, "No tickets to create"
+        if len(items) > TICKET_BULK_MAX_ITEMS:
+            return None, f"At most {TICKET_BULK_MAX_ITEMS} tickets can be created per request"
+
+        catalog, err = IssueCategoryRepository.catalog(db)
+        if err:
+            return None, err
+
+        owned_addresses, err = TicketRepository.get_address_ids_for_user(
+            {item.address_id for item in items}, user.user_id, db
         )
         if err:
-            return None, f"Ticket creation failed: {err}"
+            return None, err
 
-        return ticket, None
+        now = datetime.utcnow().replace(microsecond=0)
+        results = [None] * len(items)
+        rows = []
+        positions = []
+        for index, item in enumerate(items):
+            if item.issue_category_id not in catalog.by_id:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "message": f"Issue category with ID {item.issue_category_id} does not exist"
+                }
+            elif item.address_id not in owned_addresses:
+                results[index] = {"index": index, "status": "error", "message": "Chosen address does not belong to the user"}
+            else:
+                rows.append({
+                    "issue_description": item.issue_description,
+                    "issue_category_id": item.issue_category_id,
+                    "address_id": item.address_id,
+                    "created_by": user.user_id,
+                    "status": TicketStatus.new,
+                    "created_at": now,
+                    "updated_at": now,
+                    "due_date": None,
+                    "version": 1
+                })
+                positions.append(index)
+
+        if rows:
+            with UnitOfWork(db) as uow:
+                ticket_ids, err = TicketRepository.bulk_create_tickets(rows, db, commit=False)
+                if err:
+                    return None, f"Bulk ticket creation failed: {err}"
+
+                _, err = uow.commit()
+                if err:
+                    return None, f"Bulk ticket creation failed: {err}"
+
+            for index, ticket_id in zip(positions, ticket_ids):
+                results[index] = {"index": index, "status": "created", "ticket_id": ticket_id}
+                ticket_event_bus.publish(
+                    "created", ticket_id, user.user_id, None,
+                    status="new", issue_category_id=items[index].issue_category_id
+                )
+                action_log_writer.record(ticket_id, user.user_id, TicketStatus.new, "Ticket created")
+
+        return results, None
 
 
     @staticmethod
-    def get_unclassified_tickets(user, db):
+    def get_unclassified_tickets(user, db, page=None):
         if user.role.value not in ["admin", "manager", "agent"]:
             return None, "Only authorized roles can view unclassified tickets"
 
-        tickets = TicketRepository.get_tickets_without_sla(db)
-        if tickets is None:
+        tickets, err = TicketRepository.get_tickets_without_sla(db, page)
+        if err:
             return None, "Failed to fetch unclassified tickets"
 
-        return tickets, None
+        return Pagination.page_of(tickets, page, "ticket_id"), None
 
     @staticmethod
-    def classify_ticket(user, ticket_id: int, payload: ClassifyTicketRequest, db):
+    def classify_ticket(user, ticket_id: int, payload: ClassifyTicketRequest, db, expected_versions=None):
         if user.role.value not in ["admin", "manager", "agent"]:
             return None, "Only authorized roles can classify tickets"
 
@@ -66,28 +169,55 @@ class TicketService:
             return None, err
         if not ticket:
             return None, "Ticket not found"
+        # ✅ If-Match: refuse to classify a ticket that changed since the client read it
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
 
-        sla = db.query(SLA).filter_by(sla_id=payload.sla_id).first()
+        sla, err = SLARepository.get_by_id(payload.sla_id, db)
+        if err:
+            return None, err
         if not sla:
             return None, f"SLA with ID {payload.sla_id} does not exist"
 
-        due_date = datetime.utcnow() + timedelta(hours=sla.time_limit_hr)
-
-        ticket, err = TicketRepository.classify_ticket(
-            ticket_id=ticket_id,
-            severity=payload.severity,
-            priority=payload.priority,
-            sla_id=payload.sla_id,
-            due_date=due_date,
-            db=db
+        due_date = datetime.utcnow().replace(microsecond=0) + timedelta(hours=sla.time_limit_hr)
+
+        with UnitOfWork(db) as uow:
+            # ✅ The columns store the model enums, so map the request enums across by value
+            ticket, err = TicketRepository.classify_ticket(
+                ticket_id=ticket_id,
+                severity=Severity(payload.severity.value),
+                priority=Priority(payload.priority.value),
+                sla_id=payload.sla_id,
+                due_date=due_date,
+                db=db,
+                commit=False
+            )
+            if err:
+                return None, f"Classification failed: {err}"
+
+            _, err = uow.commit()
+            if err:
+                return None, f"Classification failed: {err}"
+
+        if ticket.status in OPEN_STATUSES:
+            # ✅ Reclassifying an open ticket changes its weight on the assignee's workload
+            workload_index.assign(ticket_id, ticket.assigned_to, ticket.priority, ticket.severity)
+        sla_breach_scheduler.track(
+            ticket_id, ticket.status, ticket.sla_warning_at, ticket.sla_critical_at, ticket.due_date
+        )
+        ticket_event_bus.publish(
+            "classified", ticket_id, ticket.created_by, ticket.assigned_to,
+            severity=payload.severity.value, priority=payload.priority.value,
+            sla_id=payload.sla_id, due_date=str(ticket.due_date)
+        )
+        action_log_writer.record(
+            ticket_id, user.user_id, ticket.status,
+            f"Classified: severity {payload.severity.value}, priority {payload.priority.value}, SLA {payload.sla_id}"
         )
-        if err:
-            return None, f"Classification failed: {err}"
-
         return ticket, None
 
     @staticmethod
-    def assign_ticket(user, ticket_id, payload, db):
+    def assign_ticket(user, ticket_id, payload, db, expected_versions=None):
         if user.role.value == "customer":
             return None, "Customers can't assign tickets!"
 
@@ -100,6 +230,8 @@ class TicketService:
             return None, err
         if not ticket:
             return None, "Ticket not found"
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
 
         # ✅ Ensure ticket is classified before assignment
         if not ticket.severity or not ticket.priority or not ticket.sla_id:
@@ -109,117 +241,404 @@ class TicketService:
         if ticket.status.value not in ["new", "reopened"]:
             return None, f"Ticket with status '{ticket.status.value}' cannot be assigned"
 
-        ticket, err = TicketRepository.assign_ticket(ticket_id, payload.assigned_to, db)
-        if err:
-            return None, f"Assignment failed: {err}"
+        # ✅ Ticket update and assignment log commit together or not at all
+        with UnitOfWork(db) as uow:
+            ticket, err = TicketRepository.assign_ticket(ticket_id, payload.assigned_to, db, commit=False)
+            if err:
+                return None, f"Assignment failed: {err}"
+
+            _, log_err = AssignmentRepository.log_assignment(
+                ticket_id=ticket_id,
+                assigned_to=payload.assigned_to,
+                assigned_by=user.user_id,
+                db=db,
+                commit=False
+            )
+            if log_err:
+                return None, f"Assignment log failed: {log_err}"
+
+            _, err = uow.commit()
+            if err:
+                return None, f"Assignment failed: {err}"
+
+        workload_index.assign(ticket_id, payload.assigned_to, ticket.priority, ticket.severity)
+        ticket_event_bus.publish(
+            "assigned", ticket_id, ticket.created_by, payload.assigned_to,
+            assigned_to=payload.assigned_to, status="assigned"
+        )
+        action_log_writer.record(ticket_id, user.user_id, TicketStatus.assigned, f"Assigned to user {payload.assigned_to}")
+        return ticket, None
 
-        _, log_err = AssignmentRepository.log_assignment(
-            ticket_id=ticket_id,
-            assigned_to=payload.assigned_to,
-            assigned_by=user.user_id,
-            db=db
+    @staticmethod
+    def auto_assign_ticket(user, ticket_id, db, expected_versions=None):
+        """Assigns the ticket to the engineer with the lowest weighted open workload."""
+        if user.role.value == "customer":
+            return None, "Customers can't assign tickets!"
+
+        engineer_id = workload_index.pick()
+        if engineer_id is None:
+            return None, "No engineers available for assignment"
+
+        return TicketService.assign_ticket(
+            user, ticket_id, AssignTicketRequest(assigned_to=engineer_id), db, expected_versions
         )
-        if log_err:
-            return None, f"Assignment log failed: {log_err}"
 
+
+
+    @staticmethod
+    def claim_next_ticket(user, db):
+        """Pull model: the calling engineer takes the most urgent classified ticket nobody has claimed."""
+        if user.role.value != "engineer":
+            return None, "Only engineers can claim tickets"
+
+        # ✅ Claim and assignment log commit together; the claimed row stays locked until then
+        with UnitOfWork(db) as uow:
+            ticket_id, err = TicketRepository.claim_next_ticket(user.user_id, db, commit=False)
+            if err:
+                return None, f"Claim failed: {err}"
+            if ticket_id is None:
+                return None, "No tickets waiting to be claimed"
+
+            _, log_err = AssignmentRepository.log_assignment(
+                ticket_id=ticket_id,
+                assigned_to=user.user_id,
+                assigned_by=user.user_id,
+                db=db,
+                commit=False
+            )
+            if log_err:
+                return None, f"Assignment log failed: {log_err}"
+
+            _, err = uow.commit()
+            if err:
+                return None, f"Claim failed: {err}"
+
+        ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
+        if err:
+            return None, err
+
+        workload_index.assign(ticket_id, user.user_id, ticket.priority, ticket.severity)
+        ticket_event_bus.publish(
+            "assigned", ticket_id, ticket.created_by, user.user_id,
+            assigned_to=user.user_id, status="assigned"
+        )
+        action_log_writer.record(ticket_id, user.user_id, TicketStatus.assigned, "Claimed from the classified queue")
         return ticket, None
 
+    @staticmethod
+    def bulk_classify_tickets(user, payload, db):
+        """
+        Classifies every listed ticket with one SLA lookup, one IN query and one UPDATE, all in a
+        single transaction. Returns one result per distinct ticket id, in request order.
+        """
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can classify tickets"
+
+        ticket_ids, err = TicketService._bulk_ticket_ids(payload.ticket_ids)
+        if err:
+            return None, err
+
+        sla, err = SLARepository.get_by_id(payload.sla_id, db)
+        if err:
+            return None, err
+        if not sla:
+            return None, f"SLA with ID {payload.sla_id} does not exist"
+
+        states, err = TicketRepository.get_ticket_states(ticket_ids, db)
+        if err:
+            return None, err
 
+        found = [ticket_id for ticket_id in ticket_ids if ticket_id in states]
+        due_date = datetime.utcnow().replace(microsecond=0) + timedelta(hours=sla.time_limit_hr)
+
+        if found:
+            with UnitOfWork(db) as uow:
+                _, err = TicketRepository.bulk_classify(
+                    {ticket_id: states[ticket_id].created_at for ticket_id in found},
+                    severity=Severity(payload.severity.value),
+                    priority=Priority(payload.priority.value),
+                    sla_id=payload.sla_id,
+                    due_date=due_date,
+                    db=db,
+                    commit=False
+                )
+                if err:
+                    return None, f"Classification failed: {err}"
+
+                _, err = uow.commit()
+                if err:
+                    return None, f"Classification failed: {err}"
+
+            for ticket_id in found:
+                if states[ticket_id].status in OPEN_STATUSES:
+                    workload_index.assign(
+                        ticket_id, states[ticket_id].assigned_to,
+                        Priority(payload.priority.value), Severity(payload.severity.value)
+                    )
+                warning_at, critical_at = SLAThresholds.compute(states[ticket_id].created_at, due_date)
+                sla_breach_scheduler.track(ticket_id, states[ticket_id].status, warning_at, critical_at, due_date)
+                ticket_event_bus.publish(
+                    "classified", ticket_id, states[ticket_id].created_by, states[ticket_id].assigned_to,
+                    severity=payload.severity.value, priority=payload.priority.value,
+                    sla_id=payload.sla_id, due_date=str(due_date)
+                )
+                action_log_writer.record(
+                    ticket_id, user.user_id, states[ticket_id].status,
+                    f"Classified: severity {payload.severity.value}, priority {payload.priority.value}, SLA {payload.sla_id}"
+                )
+
+        return [
+            {"ticket_id": ticket_id, "status": "classified", "due_date": str(due_date)}
+            if ticket_id in states else
+            {"ticket_id": ticket_id, "status": "error", "message": "Ticket not found"}
+            for ticket_id in ticket_ids
+        ], None
 
     @staticmethod
-    def change_ticket_status(user, ticket_id, new_status: str, db):
-        ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
+    def bulk_assign_tickets(user, payload, db):
+        """
+        Assigns every listed ticket to one engineer with one UPDATE and one executemany INSERT of the
+        Assignment rows, in a single transaction. Returns one result per distinct ticket id.
+        """
+        if user.role.value == "customer":
+            return None, "Customers can't assign tickets!"
+
+        ticket_ids, err = TicketService._bulk_ticket_ids(payload.ticket_ids)
+        if err:
+            return None, err
+
+        engineer = UserRepository.get_user_by_id(payload.assigned_to, db)
+        if not engineer or engineer.role.value != "engineer":
+            return None, "Assigned user must be a valid engineer"
+
+        states, err = TicketRepository.get_ticket_states(ticket_ids, db)
         if err:
             return None, err
-        if not ticket:
-            return None, "Ticket not found"
 
-        current_status = ticket.status.value
+        results = []
+        assignable = []
+        for ticket_id in ticket_ids:
+            state = states.get(ticket_id)
+            if state is None:
+                message = "Ticket not found"
+            elif not state.severity or not state.priority or not state.sla_id:
+                message = "Ticket must be classified (severity, priority, SLA) before assignment"
+            elif state.status.value not in ["new", "reopened"]:
+                message = f"Ticket with status '{state.status.value}' cannot be assigned"
+            else:
+                assignable.append(ticket_id)
+                results.append({"ticket_id": ticket_id, "status": "assigned", "assigned_to": payload.assigned_to})
+                continue
+            results.append({"ticket_id": ticket_id, "status": "error", "message": message})
+
+        if assignable:
+            with UnitOfWork(db) as uow:
+                updated, err = TicketRepository.bulk_assign(assignable, payload.assigned_to, db, commit=False)
+                if err:
+                    return None, f"Assignment failed: {err}"
+                # ✅ The UPDATE re-checks the rules; a shortfall means another request got there first
+                if updated != len(assignable):
+                    return None, "Some tickets were modified concurrently, please retry"
+
+                _, log_err = AssignmentRepository.log_assignments(
+                    assignable, payload.assigned_to, user.user_id, db, commit=False
+                )
+                if log_err:
+                    return None, f"Assignment log failed: {log_err}"
+
+                _, err = uow.commit()
+                if err:
+                    return None, f"Assignment failed: {err}"
+
+            for ticket_id in assignable:
+                workload_index.assign(
+                    ticket_id, payload.assigned_to, states[ticket_id].priority, states[ticket_id].severity
+                )
+                ticket_event_bus.publish(
+                    "assigned", ticket_id, states[ticket_id].created_by, payload.assigned_to,
+                    assigned_to=payload.assigned_to, status="assigned"
+                )
+                action_log_writer.record(
+                    ticket_id, user.user_id, TicketStatus.assigned, f"Assigned to user {payload.assigned_to}"
+                )
+
+        return results, None
 
-        # Engineer rules
+    @staticmethod
+    def _bulk_ticket_ids(ticket_ids):
+        ticket_ids = list(dict.fromkeys(ticket_ids))  # drop repeats, keep request order
+        if not ticket_ids:
+            return None, "No tickets given"
+        if len(ticket_ids) > TICKET_BULK_MAX_ITEMS:
+            return None, f"At most {TICKET_BULK_MAX_ITEMS} tickets can be updated per request"
+        return ticket_ids, None
+
+    @staticmethod
+    def change_ticket_status(user, ticket_id, new_status: str, db, expected_versions=None):
         if user.role.value == "engineer":
-            if ticket.assigned_to != user.user_id:
-                return None, "You are not assigned to this ticket"
-            if new_status not in ["on_hold", "resolved", "in_progress"]:
-                return None, "Engineers can only change status to 'on_hold', 'in_progress' or 'resolved'"
-            if current_status not in ["assigned", "in_progress", "on_hold"]:
-                return None, f"Cannot change status from '{current_status}'"
-
-        # Admin rules
-        elif user.role.value == "admin":
-            if new_status == "closed" and current_status != "resolved":
-                return None, "Ticket must be resolved before it can be closed"
-            if new_status == "reopened" and current_status != "closed":
-                return None, "Only closed tickets can be reopened"
-            if new_status not in ["closed", "reopened"]:
-                return None, "Admins can only change status to 'closed' or 'reopened'"
+            return TicketService._transition("engineer_update", ticket_id, new_status, user.user_id, db, expected_versions)
+        if user.role.value == "admin":
+            return TicketService._transition("admin_update", ticket_id, new_status, user.user_id, db, expected_versions)
 
-        else:
-            return None, "Only engineers or admins can change ticket status"
+        return None, "Only engineers or admins can change ticket status"
 
-        ticket, err = TicketRepository.update_status(ticket_id, new_status, db)
+    @staticmethod
+    def _transition(action: str, ticket_id: int, new_status: str, user_id, db, expected_versions=None,
+                    actor_id=None):
+        """Applies a TRANSITIONS entry as one conditional UPDATE; a rejection is explained from a follow-up read."""
+        now = datetime.utcnow().replace(microsecond=0)
+        conditions, err = TicketTransitions.plan(action, new_status, user_id, now, expected_versions)
         if err:
-            return None, f"Failed to update status: {err}"
+            return None, err
 
-        return ticket, None
+        written, err = TicketRepository.transition_status(
+            ticket_id, TicketStatus(new_status), db=db, updated_at=now, **conditions
+        )
+        if err:
+            return None, f"Failed to update ticket status: {err}"
+
+        if written is None:
+            state, err = TicketRepository.get_transition_state(ticket_id, db)
+            if err:
+                return None, err
+            return None, TicketTransitions.explain_rejection(action, new_status, conditions, state)
+
+        workload_index.transition(ticket_id, TicketStatus(new_status))
+        if TicketStatus(new_status) not in SLA_OPEN_STATUSES:
+            sla_breach_scheduler.cancel(ticket_id)
+
+        # ✅ The UPDATE returned the owners and SLA instants, so no follow-up read is needed
+        if TicketStatus(new_status) == TicketStatus.reopened:
+            sla_breach_scheduler.track(
+                ticket_id, written.status, written.sla_warning_at, written.sla_critical_at, written.due_date
+            )
+        ticket_event_bus.publish(
+            "status_changed", ticket_id, written.created_by, written.assigned_to, status=new_status
+        )
+        # ✅ actor_id names the caller when user_id is not an ownership condition (agent updates)
+        if (actor_id or user_id) is not None:
+            action_log_writer.record(ticket_id, actor_id or user_id, TicketStatus(new_status))
+        return TicketStatusChange(ticket_id, TicketStatus(new_status), now, written.version), None
 
 
     @staticmethod
-    def get_engineer_tickets(user, status_filter, db):
+    def get_engineer_tickets(user, status_filter, db, page=None):
         if user.role.value != "engineer":
             return None, "Only engineers can view assigned tickets"
 
         tickets, err = TicketRepository.get_tickets_by_assignee(
             user_id=user.user_id,
             status=status_filter,
-            db=db
+            db=db,
+            page=page
         )
         if err:
             return None, err
 
-        return tickets, None
+        return Pagination.page_of(tickets, page, "ticket_id"), None
     
     @staticmethod
-    def start_ticket_work(user, ticket_id, db):
+    def start_ticket_work(user, ticket_id, db, expected_versions=None):
         if user.role.value != "engineer":
             return None, "Only engineers can start ticket work"
 
+        return TicketService._transition("start_work", ticket_id, "in_progress", user.user_id, db, expected_versions)
+
+
+    @staticmethod
+    def get_ticket_details(user, ticket_id: int, db: Session):
         ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
         if err:
             return None, err
         if not ticket:
             return None, "Ticket not found"
 
-        if ticket.assigned_to != user.user_id:
+        # 👷 Engineer can only view tickets assigned to them
+        if user.role.value == "engineer" and ticket.assigned_to != user.user_id:
             return None, "You are not assigned to this ticket"
 
-        if ticket.status.value == "resolved":
-            return None, "Ticket is already resolved"
-        
-        if ticket.status.value.lower() not in ["new", "assigned"]:
-            return None, f"Cannot start ticket with status '{ticket.status.value}'"
+        # 👩‍💼 Admin can view any ticket — no restriction
+        return ticket, None
 
-        ticket, err = TicketRepository.update_status(ticket_id, "in_progress", db)
+    @staticmethod
+    def get_ticket_timeline(user, ticket_id: int, db: Session, page):
+        state, err = TicketRepository.get_followup_state(ticket_id, db)
         if err:
-            return None, f"Failed to update ticket status: {err}"
+            return None, f"Failed to fetch ticket: {err}"
+        err = TicketService._timeline_access_error(user, state)
+        if err:
+            return None, err
 
-        return ticket, None
+        events, err = TicketRepository.get_ticket_timeline(ticket_id, page, db)
+        if err:
+            return None, err
 
+        result = Pagination.page_of(events, page, "event_key")
+        result.items = [TicketService._format_timeline_event(e) for e in result.items]
+        return result, None
 
     @staticmethod
-    def get_ticket_details(user, ticket_id: int, db: Session):
-        ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
+    def search_tickets(user, query: str, limit, db: Session):
+        words, err = TicketService._search_words(user, query, limit)
         if err:
             return None, err
-        if not ticket:
-            return None, "Ticket not found"
 
-        # 👷 Engineer can only view tickets assigned to them
-        if user.role.value == "engineer" and ticket.assigned_to != user.user_id:
-            return None, "You are not assigned to this ticket"
+        hits, err = TicketRepository.search_tickets(words, limit or PAGE_SIZE_DEFAULT, db)
+        if err:
+            return None, err
+        return [TicketService._format_search_hit(row, score) for row, score in hits], None
 
-        # 👩‍💼 Admin can view any ticket — no restriction
-        return ticket, None
+    @staticmethod
+    def _search_words(user, query: str, limit):
+        if user.role.value not in ["admin", "manager", "agent"]:
+            return None, "Only authorized roles can search tickets"
+        if limit is not None and not 1 <= limit <= PAGE_SIZE_MAX:
+            return None, f"limit must be between 1 and {PAGE_SIZE_MAX}"
+        words = tokenize(query)
+        if not words:
+            return None, "Search query must contain at least one word"
+        return words, None
+
+    @staticmethod
+    def _format_search_hit(row, score):
+        return {
+            "ticket_id": row.ticket_id,
+            "issue_description": row.issue_description,
+            "status": row.status.value if row.status else None,
+            "severity": row.severity.value if row.severity else None,
+            "priority": row.priority.value if row.priority else None,
+            "assigned_to": row.assigned_to,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "score": round(float(score), 4)
+        }
+
+    @staticmethod
+    def _timeline_access_error(user, state):
+        if not state:
+            return "Ticket not found"
+        # 👷 Engineers see tickets assigned to them, 🙋 customers their own, staff every ticket
+        if user.role.value == "engineer" and state.assigned_to != user.user_id:
+            return "You are not assigned to this ticket"
+        if user.role.value == "customer" and state.created_by != user.user_id:
+            return "You are not authorized to view this ticket"
+        return None
+
+    @staticmethod
+    def _format_timeline_event(event):
+        item = {
+            "type": event.source,
+            "at": event.event_time.isoformat(),
+            "actor_id": event.actor_id
+        }
+        if event.source == "status":
+            item["status"] = event.status.value
+            item["note"] = event.note
+        elif event.source == "assignment":
+            item["assigned_to"] = event.assigned_to
+        else:
+            item["rating"] = event.rating
+            item["comment"] = event.note
+        return item
     
 
     @staticmethod
@@ -252,7 +671,7 @@ class TicketService:
 
     
     @staticmethod
-    def update_ticket_by_customer(ticket_id: int, payload: UpdateTicketRequest, db: Session, user):
+    def update_ticket_by_customer(ticket_id: int, payload: UpdateTicketRequest, db: Session, user, expected_versions=None):
         if user.role.value != "customer":
             return None, "Only customers can edit their own tickets"
 
@@ -264,6 +683,8 @@ class TicketService:
         ticket, err = TicketRepository.get_ticket_by_customer(ticket_id, user.user_id, db)
         if err:
             return None, err
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
 
         # Update ticket
         updated_ticket, err = TicketRepository.update_ticket(ticket, payload, db)
@@ -276,7 +697,7 @@ class TicketService:
 
     
     @staticmethod
-    def delete_ticket_by_customer(ticket_id: int, db: Session, user):
+    def delete_ticket_by_customer(ticket_id: int, db: Session, user, expected_versions=None):
         if user.role.value != "customer":
             return None, "Only customers can delete their tickets"
 
@@ -287,10 +708,14 @@ class TicketService:
             return None, "Ticket not found"
         if ticket.created_by != user.user_id:
             return None, "You are not authorized to delete this ticket"
+        if not ETag.matches(expected_versions, ticket.version):
+            return None, VERSION_CONFLICT
 
-        success, err = TicketRepository.delete_ticket_by_customer(ticket_id, user.user_id, db)
+        success, err = TicketRepository.delete_ticket_by_customer(ticket_id, user.user_id, db, ticket.version)
         if err:
             return None, err
+        workload_index.release(ticket_id)
+        sla_breach_scheduler.cancel(ticket_id)
         return success, None
 
 
@@ -334,146 +759,96 @@ class TicketService:
 
 
     @staticmethod
-    def get_classified_tickets(user, db):
+    def get_classified_tickets(user, db, page=None):
         if user.role.value not in ["admin", "manager", "agent"]:
             return None, "Only authorized roles can view classified tickets"
 
-        tickets, err = TicketRepository.get_classified_tickets(db)
+        tickets, err = TicketRepository.get_classified_tickets(db, page)
         if err:
             return None, f"Error fetching classified tickets: {err}"
-        if not tickets:
-            return [], None
 
-        response = [
-            TicketResponse(
-                ticket_id=t.ticket_id,
-                issue_description=t.issue_description,
-                status=t.status.value if hasattr(t.status, "value") else t.status,
-                priority=t.priority.value if t.priority else None,
-                severity=t.severity.value if t.severity else None,
-                created_by=t.created_by,
-                assigned_to=t.assigned_to,
-                issue_category_id=t.issue_category_id,
-                address_id=t.address_id,
-                sla_id=t.sla_id,
-                created_at=t.created_at,
-                updated_at=t.updated_at,
-                due_date=t.due_date
-            ).model_dump(mode="json")
-            for t in tickets
-        ]
+        result = Pagination.page_of(tickets, page, "ticket_id")
+        result.items = [TicketService._format_classified_ticket(t) for t in result.items]
+
+        return result, None
 
-        return response, None
+    @staticmethod
+    def _format_classified_ticket(t):
+        return TicketResponse(
+            ticket_id=t.ticket_id,
+            issue_description=t.issue_description,
+            status=t.status.value if hasattr(t.status, "value") else t.status,
+            priority=t.priority.value if t.priority else None,
+            severity=t.severity.value if t.severity else None,
+            created_by=t.created_by,
+            assigned_to=t.assigned_to,
+            issue_category_id=t.issue_category_id,
+            address_id=t.address_id,
+            sla_id=t.sla_id,
+            created_at=t.created_at,
+            updated_at=t.updated_at,
+            due_date=t.due_date
+        ).model_dump(mode="json")
 
 
 
     @staticmethod
-    def get_all_tickets_with_users(db):
-        tickets, err = TicketRepository.get_all_with_users(db)
+    def get_all_tickets_with_users(db, page=None):
+        tickets, err = TicketRepository.get_all_with_users(db, page)
         if err:
             return None, f"Error fetching tickets: {err}"
 
-        response = []
-        for t in tickets:
-            response.append({
-                "ticket_id": t.ticket_id,
-                "issue_description": t.issue_description,
-                "status": t.status.value if t.status else None,
-                "priority": t.priority.value if t.priority else None,
-                "severity": t.severity.value if t.severity else None,
-                "created_at": t.created_at.isoformat() if t.created_at else None,
-                "updated_at": t.updated_at.isoformat() if t.updated_at else None,
-                "due_date": t.due_date.isoformat() if t.due_date else None,
-                "created_by": {
-                    "user_id": t.creator.user_id if t.creator else None,
-                    "name": t.creator.name if t.creator else None,
-                    "email": t.creator.email if t.creator else None,
-                    "role": t.creator.role.value if t.creator and t.creator.role else None,
-                    "contact_number": t.creator.contact_number if t.creator else None,
-                    "location": t.creator.location if t.creator else None
-                },
-                "assigned_to": {
-                    "user_id": t.assignee.user_id if t.assignee else None,
-                    "name": t.assignee.name if t.assignee else None,
-                    "email": t.assignee.email if t.assignee else None,
-                    "role": t.assignee.role.value if t.assignee and t.assignee.role else None,
-                    "contact_number": t.assignee.contact_number if t.assignee else None,
-                    "location": t.assignee.location if t.assignee else None
-                }
-            })
+        result = Pagination.page_of(tickets, page, "ticket_id")
+        result.items = [TicketService._format_ticket_with_users(t) for t in result.items]
 
-        return response, None
-    
+        return result, None
 
     @staticmethod
-    def update_ticket_status_by_agent(ticket_id: int, new_status: str, db: Session):
-        # ✅ Fetch ticket
-        ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
-        if err:
-            return None, err
-        if not ticket:
-            return None, "Ticket not found"
-
-        current_status = ticket.status.value.lower()
-        new_status = new_status.lower()
-
-        # ✅ Define valid transitions
-        valid_transitions = {
-            "resolved": ["closed"],
-            "closed": ["reopened"]
+    def _format_ticket_with_users(t):
+        # ✅ t is a projected row from TicketRepository.all_with_users_statement
+        return {
+            "ticket_id": t.ticket_id,
+            "issue_description": t.issue_description,
+            "status": t.status.value if t.status else None,
+            "priority": t.priority.value if t.priority else None,
+            "severity": t.severity.value if t.severity else None,
+            "created_at": t.created_at.isoformat() if t.created_at else None,
+            "updated_at": t.updated_at.isoformat() if t.updated_at else None,
+            "due_date": t.due_date.isoformat() if t.due_date else None,
+            "created_by": {
+                "user_id": t.creator_user_id,
+                "name": t.creator_name,
+                "email": t.creator_email,
+                "role": t.creator_role.value if t.creator_role else None,
+                "contact_number": t.creator_contact_number,
+                "location": t.creator_location
+            },
+            "assigned_to": {
+                "user_id": t.assignee_user_id,
+                "name": t.assignee_name,
+                "email": t.assignee_email,
+                "role": t.assignee_role.value if t.assignee_role else None,
+                "contact_number": t.assignee_contact_number,
+                "location": t.assignee_location
+            }
         }
+    
 
-        # ✅ Validate current status
-        if current_status not in valid_transitions:
-            return None, f"Tickets with status '{current_status}' cannot be modified by agent"
-
-        # ✅ Validate next status
-        allowed_next = valid_transitions[current_status]
-        if new_status not in allowed_next:
-            return None, f"Invalid transition: '{current_status}' → '{new_status}'"
-
-        # ✅ Update via repository
-        updated_ticket, err = TicketRepository.update_status(ticket_id, new_status, db)
-        if err:
-            return None, f"Failed to update ticket status: {err}"
-
-        return updated_ticket, None
+    @staticmethod
+    def update_ticket_status_by_agent(ticket_id: int, new_status: str, db: Session, expected_versions=None, actor_id=None):
+        return TicketService._transition(
+            "agent_update", ticket_id, new_status.lower(), None, db, expected_versions, actor_id=actor_id
+        )
 
 
 
     @staticmethod
-    def reopen_ticket_by_customer(ticket_id: int, db: Session, user):
-            # ✅ Role check
+    def reopen_ticket_by_customer(ticket_id: int, db: Session, user, expected_versions=None):
+        # ✅ Role check; ownership, current status and the 48 hour window are enforced by the UPDATE
         if user.role.value != "customer":
             return None, "Only customers can reopen tickets"
 
-            # ✅ Fetch ticket
-        ticket, err = TicketRepository.get_ticket_by_id(ticket_id, db)
-        if err:
-            return None, err
-        if not ticket:
-            return None, "Ticket not found"
-
-            # ✅ Ownership check
-        if ticket.created_by != user.user_id:
-            return None, "You are not authorized to reopen this ticket"
-
-            # ✅ Status check
-        if ticket.status.value.lower() not in ["resolved", "closed"]:
-            return None, f"Only resolved or closed tickets can be reopened (current: {ticket.status.value})"
-
-            # ✅ Optional — Time window (48 hours)
-        if ticket.updated_at:
-            time_diff = datetime.utcnow() - ticket.updated_at
-            if time_diff.total_seconds() > 48 * 3600:
-                return None, "Reopen window expired (only within 48 hours allowed)"
-
-            # ✅ Update status to 'reopened'
-        updated_ticket, err = TicketRepository.update_status(ticket_id, "reopened", db)
-        if err:
-            return None, err
-
-        return updated_ticket, None
+        return TicketService._transition("customer_reopen", ticket_id, "reopened", user.user_id, db, expected_versions)
 
 
 
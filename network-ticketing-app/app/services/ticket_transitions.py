@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+from app.models.ticket import TicketStatus
+from app.utils.etag import ETag, VERSION_CONFLICT
+
+WORKING_STATUSES = ["assigned", "in_progress", "on_hold"]
+
+
+class Transition:
+    """
+    One row of the status transition table. targets maps each status the action may set to the
+    statuses the ticket may currently be in. owner restricts the action to the ticket's
+    "assignee" or "creator"; window_hours limits it to tickets updated within that many hours.
+    """
+
+    __slots__ = ("label", "targets", "owner", "window_hours")
+
+    def __init__(self, label: str, targets: dict, owner: str = None, window_hours: int = None):
+        self.label = label
+        self.targets = targets
+        self.owner = owner
+        self.window_hours = window_hours
+
+
+# ✅ Every status change the API allows; each is applied as a single conditional UPDATE
+TRANSITIONS = {
+    "engineer_update": Transition("Engineers", {
+        "in_progress": WORKING_STATUSES,
+        "on_hold": WORKING_STATUSES,
+        "resolved": WORKING_STATUSES,
+    }, owner="assignee"),
+    "start_work": Transition("Engineers", {"in_progress": ["new", "assigned"]}, owner="assignee"),
+    "admin_update": Transition("Admins", {"closed": ["resolved"], "reopened": ["closed"]}),
+    "agent_update": Transition("Agents", {"closed": ["resolved"], "reopened": ["closed"]}),
+    "customer_reopen": Transition("Customers", {"reopened": ["resolved", "closed"]}, owner="creator", window_hours=48),
+}
+
+
+class TicketStatusChange:
+    """
+    What a successful transition wrote; exposes the Ticket attributes the views serialize,
+    including the new version for the ETag.
+    """
+
+    __slots__ = ("ticket_id", "status", "updated_at", "version")
+
+    def __init__(self, ticket_id: int, status: TicketStatus, updated_at: datetime, version: int):
+        self.ticket_id = ticket_id
+        self.status = status
+        self.updated_at = updated_at
+        self.version = version
+
+
+class TicketTransitions:
+    @staticmethod
+    def plan(action: str, new_status: str, user_id: int, now: datetime, expected_versions=None):
+        """
+        Resolves the table entry into the UPDATE's conditions.
+        Returns ({allowed_from, assigned_to, created_by, updated_since, expected_versions}, err).
+        """
+        transition = TRANSITIONS[action]
+        if new_status not in transition.targets:
+            targets = [f"'{s}'" for s in transition.targets]
+            allowed = targets[0] if len(targets) == 1 else ", ".join(targets[:-1]) + " or " + targets[-1]
+            return None, f"{transition.label} can only change status to {allowed}"
+
+        return {
+            "allowed_from": [TicketStatus(s) for s in transition.targets[new_status]],
+            "assigned_to": user_id if transition.owner == "assignee" else None,
+            "created_by": user_id if transition.owner == "creator" else None,
+            "updated_since": now - timedelta(hours=transition.window_hours) if transition.window_hours else None,
+            "expected_versions": expected_versions,
+        }, None
+
+    @staticmethod
+    def explain_rejection(action: str, new_status: str, conditions: dict, state):
+        """Why the conditional UPDATE matched no row, from a follow-up read of the ticket."""
+        if state is None:
+            return "Ticket not found"
+
+        transition = TRANSITIONS[action]
+        if conditions["assigned_to"] is not None and state.assigned_to != conditions["assigned_to"]:
+            return "You are not assigned to this ticket"
+        if conditions["created_by"] is not None and state.created_by != conditions["created_by"]:
+            return "You are not authorized to change this ticket"
+        if not ETag.matches(conditions["expected_versions"], state.version):
+            return VERSION_CONFLICT
+
+        current = state.status.value if state.status else None
+        if state.status not in conditions["allowed_from"]:
+            allowed = ", ".join(f"'{s}'" for s in transition.targets[new_status])
+            return f"Cannot change status from '{current}' to '{new_status}' (allowed from {allowed})"
+
+        if conditions["updated_since"] is not None and state.updated_at < conditions["updated_since"]:
+            return f"Status change window expired (only within {transition.window_hours} hours allowed)"
+
+        return "Ticket was modified concurrently, please retry"
@@ -4,6 +4,8 @@ from app.models.user import User  # if needed for logging or future updates
 from typing import Tuple, Optional, Dict
 
 class UserService:
+    USER_SORTS = ("user_id", "-user_id", "created_at", "-created_at")
+
     @staticmethod
     def logout(user_id: int, db: Session) -> Tuple[Optional[Dict], Optional[str]]:
         try:
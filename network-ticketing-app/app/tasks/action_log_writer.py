@@ -0,0 +1,140 @@
+import os
+import threading
+from datetime import datetime
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+from app.database import SessionLocal
+from app.models.ticket_action_log import TicketActionLog, TicketStatus as ActionLogStatus
+from app.tasks.background_task import BackgroundTask
+
+# A batch is written every FLUSH_INTERVAL_MS or as soon as BATCH_SIZE records are waiting
+TICKET_ACTION_LOG_FLUSH_INTERVAL_MS = int(os.getenv("TICKET_ACTION_LOG_FLUSH_INTERVAL_MS", 200))
+TICKET_ACTION_LOG_BATCH_SIZE = int(os.getenv("TICKET_ACTION_LOG_BATCH_SIZE", 500))
+# Records held while the database is unreachable; beyond this the oldest are dropped (and counted)
+TICKET_ACTION_LOG_MAX_PENDING = int(os.getenv("TICKET_ACTION_LOG_MAX_PENDING", 50000))
+
+
+class TicketActionLogWriter(BackgroundTask):
+    """
+    Buffers TicketActionLog rows in memory and writes them in the background with multi-row INSERTs,
+    so recording an action costs a list append instead of a round trip on the request path.
+
+    The buffer is flushed on graceful shutdown; records still pending when a worker is killed are lost.
+    """
+
+    def __init__(self):
+        super().__init__(run_at_start=False)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._flush_lock = threading.Lock()
+        self.recorded = 0
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.last_error = None
+
+    def record(self, ticket_id: int, updated_by: int, status, action_note: str = None):
+        """status is an app.models.ticket.TicketStatus; the log table has its own enum with the same names."""
+        row = {
+            "ticket_id": ticket_id,
+            "updated_by": updated_by,
+            "status": ActionLogStatus[status.name],
+            "action_note": action_note,
+            "action_time": datetime.utcnow().replace(microsecond=0)
+        }
+        with self._lock:
+            self._pending.append(row)
+            self.recorded += 1
+            overflow = len(self._pending) - TICKET_ACTION_LOG_MAX_PENDING
+            if overflow > 0:
+                del self._pending[:overflow]
+                self.dropped += overflow
+            full = len(self._pending) >= TICKET_ACTION_LOG_BATCH_SIZE
+        if full:
+            self.wake()
+
+    def flush(self):
+        """
+        Writes everything pending, one multi-row INSERT per batch. Returns the number of rows written.
+
+        A batch the database refuses on a constraint is retried row by row and the offending rows
+        (e.g. logged for a ticket deleted meanwhile) are rejected, so they cannot block every later flush.
+        Any other failure keeps the unwritten rows for the next flush.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+
+            written = 0
+            done = 0
+            db = SessionLocal()
+            try:
+                for start in range(0, len(rows), TICKET_ACTION_LOG_BATCH_SIZE):
+                    batch = rows[start:start + TICKET_ACTION_LOG_BATCH_SIZE]
+                    try:
+                        db.execute(insert(TicketActionLog).values(batch))
+                        db.commit()
+                        written += len(batch)
+                        done += len(batch)
+                        continue
+                    except IntegrityError:
+                        db.rollback()
+                    for row in batch:
+                        try:
+                            db.execute(insert(TicketActionLog).values(row))
+                            db.commit()
+                            written += 1
+                        except IntegrityError as e:
+                            db.rollback()
+                            self.rejected += 1
+                            self.last_error = str(e.orig)
+                        done += 1
+            except Exception as e:
+                db.rollback()
+                self.failed_flushes += 1
+                self.last_error = str(e)
+                # ✅ Keep the unwritten rows, ahead of anything recorded meanwhile, for the next flush
+                with self._lock:
+                    self._pending[:0] = rows[done:]
+            finally:
+                db.close()
+
+            self.written += written
+            self.flushes += 1
+            return written
+
+    async def stop(self):
+        await super().stop()
+        # ✅ Graceful shutdown: whatever is still buffered goes out before the process exits
+        await run_in_threadpool(self.flush)
+
+    def stats(self):
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "running": self.running,
+            "pending": pending,
+            "recorded": self.recorded,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+            "flush_interval_ms": TICKET_ACTION_LOG_FLUSH_INTERVAL_MS,
+            "batch_size": TICKET_ACTION_LOG_BATCH_SIZE
+        }
+
+    async def tick(self):
+        await run_in_threadpool(self.flush)
+
+    def next_delay(self) -> float:
+        return TICKET_ACTION_LOG_FLUSH_INTERVAL_MS / 1000
+
+
+action_log_writer = TicketActionLogWriter()
@@ -0,0 +1,84 @@
+import asyncio
+from starlette.concurrency import run_in_threadpool
+
+
+class BackgroundTask:
+    """
+    One asyncio task per process that calls tick() in a loop and sleeps next_delay() seconds between
+    calls. wake() (safe from any thread) cuts the current sleep short.
+
+    With run_at_start=False the first tick waits one delay, for tasks whose first run the lifespan
+    already did before serving.
+    """
+
+    def __init__(self, run_at_start: bool = True):
+        self._run_at_start = run_at_start
+        self._loop = None
+        self._wakeup = None
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def tick(self):
+        raise NotImplementedError
+
+    def next_delay(self) -> float:
+        raise NotImplementedError
+
+    def start(self):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        task = self._task
+        self._task = None
+        self._loop = None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def wake(self):
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # loop already closed during shutdown
+
+    async def _run(self):
+        if not self._run_at_start:
+            await self._sleep()
+        while True:
+            # ✅ Cleared before the tick, so a wake() arriving while it runs is never lost
+            self._wakeup.clear()
+            await self.tick()
+            await self._sleep()
+
+    async def _sleep(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.next_delay())
+        except asyncio.TimeoutError:
+            pass
+
+
+class PeriodicTask(BackgroundTask):
+    """Runs a blocking job on the threadpool every interval_seconds."""
+
+    def __init__(self, job, interval_seconds: float, run_at_start: bool = True):
+        super().__init__(run_at_start)
+        self._job = job
+        self._interval_seconds = interval_seconds
+
+    async def tick(self):
+        await run_in_threadpool(self._job)
+
+    def next_delay(self) -> float:
+        return self._interval_seconds
@@ -0,0 +1,221 @@
+import heapq
+import itertools
+import os
+import threading
+from datetime import datetime
+from starlette.concurrency import run_in_threadpool
+from app.database import SessionLocal
+from app.models.ticket import TicketStatus
+from app.repositories.ticket_repository import TicketRepository
+from app.tasks.background_task import BackgroundTask
+
+SLA_BREACH_SCHEDULER_ENABLED = os.getenv("SLA_BREACH_SCHEDULER_ENABLED", "true").lower() == "true"
+# Upper bound on one sleep, so a missed wake-up or a clock step is corrected within this window
+SLA_BREACH_SCHEDULER_MAX_SLEEP_SECONDS = float(os.getenv("SLA_BREACH_SCHEDULER_MAX_SLEEP_SECONDS", 60))
+
+# Statuses in which the SLA clock is still running
+SLA_OPEN_STATUSES = (
+    TicketStatus.new, TicketStatus.assigned, TicketStatus.in_progress, TicketStatus.on_hold, TicketStatus.reopened
+)
+
+# In firing order: 40% of the window left, 10% left, past due
+SLA_EVENT_KINDS = ("warning", "critical", "breach")
+
+
+class SLAEvent:
+    __slots__ = ("ticket_id", "kind", "fire_at", "due_date")
+
+    def __init__(self, ticket_id: int, kind: str, fire_at: datetime, due_date: datetime):
+        self.ticket_id = ticket_id
+        self.kind = kind
+        self.fire_at = fire_at
+        self.due_date = due_date
+
+    def to_dict(self):
+        return {
+            "ticket_id": self.ticket_id,
+            "kind": self.kind,
+            "fire_at": self.fire_at.isoformat(),
+            "due_date": self.due_date.isoformat()
+        }
+
+
+class SLABreachScheduler(BackgroundTask):
+    """
+    Emits SLA warning, critical and breach events when a ticket crosses sla_warning_at,
+    sla_critical_at and due_date.
+
+    Upcoming thresholds sit in a min-heap ordered by time, so the background task sleeps until the
+    earliest one instead of polling. Open tickets are read once at startup; after that the heap only
+    changes through track()/cancel() calls from classification, status transitions and deletes.
+    Rescheduling or cancelling a ticket bumps its generation, and heap entries from an older
+    generation are dropped when they reach the top.
+
+    The heap only sees changes made through this worker, so before firing, the due tickets' status and
+    deadlines are re-read in one query: events for tickets closed, deleted or reclassified elsewhere
+    are dropped (and the ticket rescheduled from the stored deadlines) instead of emitted.
+
+    Listeners are called on the event loop with each SLAEvent. Every worker runs its own scheduler;
+    set SLA_BREACH_SCHEDULER_ENABLED=false on all but one if listeners must fire once per cluster.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._heap = []           # (fire_at, seq, ticket_id, kind, generation)
+        self._generations = {}    # ticket_id -> (generation, due_date) of its live entries
+        self._seq = itertools.count()
+        self._listeners = []
+        self.emitted = {kind: 0 for kind in SLA_EVENT_KINDS}
+        self.stale_dropped = 0
+
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def track(self, ticket_id: int, status, warning_at, critical_at, due_date, now=None):
+        """Schedules the ticket's thresholds while its SLA clock runs, cancels them otherwise."""
+        if due_date is None or status not in SLA_OPEN_STATUSES:
+            self.cancel(ticket_id)
+            return
+
+        now = now or datetime.utcnow()
+        thresholds = [
+            (at, kind) for at, kind in zip((warning_at, critical_at, due_date), SLA_EVENT_KINDS) if at is not None
+        ]
+        # ✅ Of the thresholds already behind us only the latest still fires, so a ticket classified
+        # (or reopened) late reports its current state once instead of replaying every step
+        passed = [t for t in thresholds if t[0] <= now]
+        pending = [t for t in thresholds if t[0] > now]
+        self._push(ticket_id, due_date, passed[-1:] + pending)
+
+    def cancel(self, ticket_id: int):
+        with self._lock:
+            self._generations.pop(ticket_id, None)
+
+    def load(self, rows, now=None):
+        """Startup: rows of (ticket_id, sla_warning_at, sla_critical_at, due_date); thresholds already passed are skipped."""
+        now = now or datetime.utcnow()
+        for ticket_id, warning_at, critical_at, due_date in rows:
+            thresholds = zip((warning_at, critical_at, due_date), SLA_EVENT_KINDS)
+            self._push(ticket_id, due_date, [(at, kind) for at, kind in thresholds if at is not None and at > now])
+
+    def due_events(self, now):
+        """Pops and returns every live event whose time has come."""
+        events = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                fire_at, _, ticket_id, kind, generation = heapq.heappop(self._heap)
+                live = self._generations.get(ticket_id)
+                if live is None or live[0] != generation:
+                    continue  # rescheduled or cancelled
+                events.append(SLAEvent(ticket_id, kind, fire_at, live[1]))
+                if kind == "breach":
+                    del self._generations[ticket_id]
+        return events
+
+    def next_fire_at(self):
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enabled": SLA_BREACH_SCHEDULER_ENABLED,
+                "running": self.running,
+                "tracked_tickets": len(self._generations),
+                "heap_entries": len(self._heap),
+                "next_fire_at": self._heap[0][0].isoformat() if self._heap else None,
+                "emitted": dict(self.emitted),
+                "stale_dropped": self.stale_dropped,
+                "listeners": len(self._listeners)
+            }
+
+    def load_open_tickets(self):
+        db = SessionLocal()
+        try:
+            rows, err = TicketRepository.get_pending_sla_deadlines(SLA_OPEN_STATUSES, datetime.utcnow(), db)
+            if err:
+                print("❌ SLA scheduler load error:", err)
+                return False
+            self.load(rows)
+            return True
+        finally:
+            db.close()
+
+    async def start(self):
+        if not SLA_BREACH_SCHEDULER_ENABLED or self.running:
+            return
+        await run_in_threadpool(self.load_open_tickets)
+        super().start()
+
+    async def tick(self):
+        events = self.due_events(datetime.utcnow())
+        if events:
+            events = await run_in_threadpool(self.confirm, events)
+        for event in events:
+            self._emit(event)
+
+    def confirm(self, events):
+        """The events whose ticket still has a running SLA clock with the deadline they were scheduled for."""
+        db = SessionLocal()
+        try:
+            rows, err = TicketRepository.get_sla_clocks({event.ticket_id for event in events}, db)
+        finally:
+            db.close()
+        if err:
+            # Better a possibly stale event than a silently missed breach
+            print("❌ SLA scheduler confirm error:", err)
+            return events
+
+        clocks = {row.ticket_id: row for row in rows}
+        confirmed = []
+        for event in events:
+            clock = clocks.get(event.ticket_id)
+            if clock is not None and clock.status in SLA_OPEN_STATUSES and clock.due_date == event.due_date:
+                confirmed.append(event)
+                continue
+            self.stale_dropped += 1
+            if clock is None:
+                self.cancel(event.ticket_id)
+            else:
+                self.track(event.ticket_id, clock.status, clock.sla_warning_at, clock.sla_critical_at, clock.due_date)
+        return confirmed
+
+    def next_delay(self) -> float:
+        next_at = self.next_fire_at()
+        if next_at is None:
+            return SLA_BREACH_SCHEDULER_MAX_SLEEP_SECONDS
+        return min(max((next_at - datetime.utcnow()).total_seconds(), 0), SLA_BREACH_SCHEDULER_MAX_SLEEP_SECONDS)
+
+    def _emit(self, event: SLAEvent):
+        self.emitted[event.kind] += 1
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                print("❌ SLA event listener error:", e)
+
+    def _push(self, ticket_id: int, due_date, thresholds):
+        with self._lock:
+            generation = next(self._seq)
+            if not thresholds:
+                self._generations.pop(ticket_id, None)
+                return
+            self._generations[ticket_id] = (generation, due_date)
+            head = self._heap[0][0] if self._heap else None
+            for at, kind in thresholds:
+                heapq.heappush(self._heap, (at, next(self._seq), ticket_id, kind, generation))
+            # ✅ Drop dead entries once they dominate, so the heap stays O(tracked tickets)
+            if len(self._heap) > 4 * len(self._generations) + 64:
+                self._heap = [e for e in self._heap if self._generations.get(e[2], (None,))[0] == e[4]]
+                heapq.heapify(self._heap)
+            earlier = head is None or thresholds[0][0] < head
+        if earlier:
+            self.wake()
+
+
+sla_breach_scheduler = SLABreachScheduler()
@@ -0,0 +1,44 @@
+import os
+from app.database import SessionLocal
+from app.repositories.ticket_repository import TicketRepository
+from app.tasks.background_task import PeriodicTask
+from app.utils.ticket_search import ticket_search_index, TicketSearchIndex
+
+# Bounds how long descriptions changed by other workers (or outside the API) can be missing from search
+TICKET_SEARCH_RESYNC_SECONDS = int(os.getenv("TICKET_SEARCH_RESYNC_SECONDS", 600))
+
+
+class TicketSearchIndexRefresher:
+    """Rebuilds the in-process ticket search index at startup and then periodically; idle on MySQL FULLTEXT."""
+
+    _periodic = None
+
+    @staticmethod
+    def rebuild_once():
+        db = SessionLocal()
+        try:
+            if TicketSearchIndex.uses_fulltext(db.get_bind().dialect):
+                return False
+            rows, err = TicketRepository.get_search_documents(db)
+            if err:
+                print("❌ Ticket search index rebuild error:", err)
+                return False
+            ticket_search_index.rebuild(rows)
+            return True
+        finally:
+            db.close()
+
+    @staticmethod
+    def start():
+        if ticket_search_index.built:
+            TicketSearchIndexRefresher._periodic.start()
+
+    @staticmethod
+    async def stop():
+        await TicketSearchIndexRefresher._periodic.stop()
+
+
+# ✅ The lifespan does the first rebuild before serving; this task only resyncs
+TicketSearchIndexRefresher._periodic = PeriodicTask(
+    TicketSearchIndexRefresher.rebuild_once, TICKET_SEARCH_RESYNC_SECONDS, run_at_start=False
+)
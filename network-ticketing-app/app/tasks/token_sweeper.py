@@ -0,0 +1,45 @@
+import os
+from app.database import SessionLocal
+from app.repositories.token_repository import TokenRepository
+from app.tasks.background_task import PeriodicTask
+
+REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS = int(os.getenv("REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS", 3600))
+REFRESH_TOKEN_SWEEP_BATCH_SIZE = int(os.getenv("REFRESH_TOKEN_SWEEP_BATCH_SIZE", 1000))
+
+
+class RefreshTokenSweeper:
+    """Background task that deletes expired refresh tokens in small batches.
+
+    Each batch is its own short transaction, so the sweep never holds locks
+    on a large range of the table while logins keep inserting new rows.
+    """
+
+    _periodic = None
+
+    @staticmethod
+    def sweep_once():
+        db = SessionLocal()
+        total = 0
+        try:
+            while True:
+                deleted, err = TokenRepository.delete_expired_batch(REFRESH_TOKEN_SWEEP_BATCH_SIZE, db)
+                if err:
+                    print("❌ Refresh token sweep error:", err)
+                    break
+                total += deleted
+                if deleted < REFRESH_TOKEN_SWEEP_BATCH_SIZE:
+                    break
+        finally:
+            db.close()
+        return total
+
+    @staticmethod
+    def start():
+        RefreshTokenSweeper._periodic.start()
+
+    @staticmethod
+    async def stop():
+        await RefreshTokenSweeper._periodic.stop()
+
+
+RefreshTokenSweeper._periodic = PeriodicTask(RefreshTokenSweeper.sweep_once, REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS)
@@ -0,0 +1,46 @@
+import os
+from app.database import SessionLocal
+from app.repositories.ticket_repository import TicketRepository
+from app.repositories.user_repository import UserRepository
+from app.tasks.background_task import PeriodicTask
+from app.utils.workload_index import workload_index, OPEN_STATUSES
+
+# Bounds how long assignments made by other workers (or outside the API) can skew auto-assignment
+WORKLOAD_INDEX_RESYNC_SECONDS = int(os.getenv("WORKLOAD_INDEX_RESYNC_SECONDS", 300))
+
+
+class WorkloadIndexRefresher:
+    """Rebuilds the in-memory workload index from the tickets table at startup and then periodically."""
+
+    _periodic = None
+
+    @staticmethod
+    def rebuild_once():
+        db = SessionLocal()
+        try:
+            engineer_ids, err = UserRepository.get_engineer_ids(db)
+            if err:
+                print("❌ Workload index rebuild error:", err)
+                return False
+            open_tickets, err = TicketRepository.get_open_workload(OPEN_STATUSES, db)
+            if err:
+                print("❌ Workload index rebuild error:", err)
+                return False
+            workload_index.rebuild(engineer_ids, open_tickets)
+            return True
+        finally:
+            db.close()
+
+    @staticmethod
+    def start():
+        WorkloadIndexRefresher._periodic.start()
+
+    @staticmethod
+    async def stop():
+        await WorkloadIndexRefresher._periodic.stop()
+
+
+# ✅ The lifespan does the first rebuild before serving; this task only resyncs
+WorkloadIndexRefresher._periodic = PeriodicTask(
+    WorkloadIndexRefresher.rebuild_once, WORKLOAD_INDEX_RESYNC_SECONDS, run_at_start=False
+)
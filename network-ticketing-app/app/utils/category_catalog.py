@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+from sqlalchemy import select
+from app.models.issue_category import IssueCategory
+from app.utils.versioned_cache import VersionedCache
+
+CATEGORY_CATALOG_ENABLED = os.getenv("CATEGORY_CATALOG_ENABLED", "true").lower() == "true"
+CATEGORY_CATALOG_MAX_STALENESS_SECONDS = float(os.getenv("CATEGORY_CATALOG_MAX_STALENESS_SECONDS", 10))
+CATEGORY_CATALOG_NAME = "issue_categories"
+
+
+class CachedCategory:
+    """Detached copy of an IssueCategory row."""
+
+    __slots__ = ("category_id", "category_name")
+
+    def __init__(self, category_id, category_name):
+        self.category_id = category_id
+        self.category_name = category_name
+
+
+class CategorySnapshot:
+    __slots__ = ("version", "rows", "by_id", "by_name", "etag")
+
+    def __init__(self, version: int, rows: list):
+        self.version = version
+        self.rows = rows
+        self.by_id = {c.category_id: c for c in rows}
+        self.by_name = {c.category_name: c for c in rows}
+        # ✅ Derived from the content, so every worker hands out the same tag for the same list
+        digest = hashlib.sha256(
+            json.dumps([[c.category_id, c.category_name] for c in rows]).encode("utf-8")
+        ).hexdigest()
+        self.etag = f'"{digest[:32]}"'
+
+
+class CategoryCatalog(VersionedCache):
+    """Issue categories keyed by id and by name, plus a strong ETag for the full list."""
+
+    def get(self, category_id: int, db):
+        snapshot, err = self.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.by_id.get(category_id), None
+
+    def get_by_name(self, name: str, db):
+        snapshot, err = self.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.by_name.get(name), None
+
+    def _load(self, version: int, db):
+        try:
+            rows = db.execute(
+                select(IssueCategory.category_id, IssueCategory.category_name).order_by(IssueCategory.category_id)
+            ).all()
+            return CategorySnapshot(version, [CachedCategory(*row) for row in rows]), None
+        except Exception as e:
+            return None, f"Error loading issue category catalog: {str(e)}"
+
+
+category_catalog = CategoryCatalog(
+    name=CATEGORY_CATALOG_NAME,
+    enabled=CATEGORY_CATALOG_ENABLED,
+    max_staleness_seconds=CATEGORY_CATALOG_MAX_STALENESS_SECONDS
+)
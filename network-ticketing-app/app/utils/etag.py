@@ -0,0 +1,44 @@
+VERSION_CONFLICT = "Ticket was modified since it was read (If-Match does not match the current ETag)"
+
+
+class ETag:
+    """Strong ETags for versioned rows: the row's version number, quoted."""
+
+    @staticmethod
+    def for_version(version: int) -> str:
+        return f'"{version}"'
+
+    @staticmethod
+    def headers(version):
+        """Response headers for a write; empty when the new version is not known."""
+        return {"ETag": ETag.for_version(version)} if version is not None else None
+
+    @staticmethod
+    def parse_if_match(header: str):
+        """
+        Returns (versions, err). versions is None when there is no precondition (header absent
+        or "*"), otherwise the list of versions the client will accept.
+        """
+        if header is None or header.strip() == "*":
+            return None, None
+
+        versions = []
+        for tag in header.split(","):
+            tag = tag.strip()
+            if len(tag) < 3 or tag[0] != '"' or tag[-1] != '"' or not tag[1:-1].isdigit():
+                return None, "Invalid If-Match header: expected a quoted ETag from a previous response"
+            versions.append(int(tag[1:-1]))
+        return versions, None
+
+    @staticmethod
+    def none_match(header: str, etag: str) -> bool:
+        """True when If-None-Match already names etag, i.e. the client's copy is current (weak comparison)."""
+        if header is None:
+            return False
+        if header.strip() == "*":
+            return True
+        return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+    @staticmethod
+    def matches(versions, current: int) -> bool:
+        return versions is None or current in versions
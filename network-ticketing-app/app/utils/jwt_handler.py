@@ -6,8 +6,18 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))  # Default to 7 days if not set
+# When enabled, access tokens carry user_id and role so requests can be authorized without a user lookup
+JWT_STATELESS_PRINCIPAL = os.getenv("JWT_STATELESS_PRINCIPAL", "false").lower() == "true"
 
 class JWTHandler:
+    @staticmethod
+    def build_access_claims(user):
+        claims = {"sub": user.email}
+        if JWT_STATELESS_PRINCIPAL:
+            claims["user_id"] = user.user_id
+            claims["role"] = user.role.value
+        return claims
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: timedelta = None):
         to_encode = data.copy()
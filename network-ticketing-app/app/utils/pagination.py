@@ -0,0 +1,128 @@
+import base64
+import binascii
+import json
+import os
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 200))
+
+
+class PageRequest:
+    """A validated page request: sort key, direction, page size and the keyset to resume after."""
+
+    __slots__ = ("sort", "key", "descending", "limit", "after")
+
+    def __init__(self, sort: str, limit: int, after=None):
+        self.sort = sort
+        self.key = sort.lstrip("-")
+        self.descending = sort.startswith("-")
+        self.limit = limit
+        self.after = after  # (sort_value, id) of the last row of the previous page, or None
+
+
+class Page:
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+class Pagination:
+    """
+    Keyset pagination on (sort_key, id). The cursor is opaque to clients: base64 JSON of the
+    sort name plus the sort value and id of the last row served. Each page is one range scan of
+    an index on the sort key, so its cost doesn't depend on how deep the client has paged.
+    """
+
+    @staticmethod
+    def parse(limit, cursor, sort, allowed_sorts):
+        """Validates the limit/cursor/sort query params. The first of allowed_sorts is the default."""
+        if limit is None:
+            limit = PAGE_SIZE_DEFAULT
+        if limit < 1 or limit > PAGE_SIZE_MAX:
+            return None, f"limit must be between 1 and {PAGE_SIZE_MAX}"
+
+        after = None
+        if cursor:
+            try:
+                cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+                after = (Pagination._decode_value(value), int(last_id))
+            except (binascii.Error, ValueError, TypeError, KeyError):
+                return None, "Invalid cursor"
+            if sort and sort != cursor_sort:
+                return None, "Cursor does not match the requested sort order"
+            sort = cursor_sort
+
+        sort = sort or allowed_sorts[0]
+        if sort not in allowed_sorts:
+            return None, f"sort must be one of: {', '.join(allowed_sorts)}"
+
+        return PageRequest(sort, limit, after), None
+
+    @staticmethod
+    def apply(query, page: PageRequest, sort_columns: dict, id_column):
+        """Adds the keyset predicate, ordering and LIMIT to a Query or Select.
+        Fetches one extra row so page_of can tell whether another page follows."""
+        if page is None:
+            return query
+
+        column = sort_columns[page.key]
+        if column is id_column:
+            order = [id_column.desc() if page.descending else id_column.asc()]
+            if page.after:
+                query = query.where(id_column < page.after[1] if page.descending else id_column > page.after[1])
+        else:
+            if page.descending:
+                order = [column.desc(), id_column.desc()]
+            else:
+                order = [column.asc(), id_column.asc()]
+            if page.after:
+                query = query.where(Pagination._after(column, id_column, page))
+
+        return query.order_by(*order).limit(page.limit + 1)
+
+    @staticmethod
+    def _after(column, id_column, page: PageRequest):
+        # ✅ MySQL and SQLite sort NULLs first ascending and last descending
+        value, last_id = page.after
+        if page.descending:
+            if value is None:
+                return and_(column.is_(None), id_column < last_id)
+            return or_(column < value, and_(column == value, id_column < last_id), column.is_(None))
+        if value is None:
+            return or_(and_(column.is_(None), id_column > last_id), column.isnot(None))
+        return or_(column > value, and_(column == value, id_column > last_id))
+
+    @staticmethod
+    def page_of(rows, page: PageRequest, id_attr: str):
+        """Trims the look-ahead row and builds next_cursor from the last row kept."""
+        if page is None:
+            return Page(rows, None)
+
+        rows = list(rows)
+        if len(rows) <= page.limit:
+            return Page(rows, None)
+
+        rows = rows[:page.limit]
+        last = rows[-1]
+        return Page(rows, Pagination.encode_cursor(page.sort, getattr(last, page.key), getattr(last, id_attr)))
+
+    @staticmethod
+    def encode_cursor(sort: str, value, last_id) -> str:
+        payload = json.dumps([sort, Pagination._encode_value(value), last_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _encode_value(value):
+        if isinstance(value, datetime):
+            return {"dt": value.isoformat()}
+        return value
+
+    @staticmethod
+    def _decode_value(value):
+        if isinstance(value, dict):
+            return datetime.fromisoformat(value["dt"])
+        return value
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from passlib.hash import bcrypt
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 4))
+# Jobs allowed to wait for a worker before new requests are turned away
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+
+HASHER_BUSY = "Authentication service is busy, please retry shortly"
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives real
+    parallelism without tying up FastAPI's shared request threadpool. When
+    more than workers + queue jobs are in flight, callers get HASHER_BUSY
+    immediately instead of queueing behind a login storm.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hasher")
+    _capacity = PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE
+    _lock = threading.Lock()
+    _in_flight = 0
+    _completed = 0
+    _rejected = 0
+
+    @staticmethod
+    async def hash(password: str):
+        return await PasswordHasher._submit(bcrypt.hash, password)
+
+    @staticmethod
+    async def verify(password: str, password_hash: str):
+        return await PasswordHasher._submit(bcrypt.verify, password, password_hash)
+
+    @staticmethod
+    async def _submit(fn, *args):
+        with PasswordHasher._lock:
+            if PasswordHasher._in_flight >= PasswordHasher._capacity:
+                PasswordHasher._rejected += 1
+                return None, HASHER_BUSY
+            PasswordHasher._in_flight += 1
+
+        future = PasswordHasher._executor.submit(fn, *args)
+        # Release the slot when the job really finishes, even if the awaiting request was cancelled
+        future.add_done_callback(PasswordHasher._release)
+        try:
+            return await asyncio.wrap_future(future), None
+        except ValueError as e:
+            return None, str(e)
+
+    @staticmethod
+    def _release(_future):
+        with PasswordHasher._lock:
+            PasswordHasher._in_flight -= 1
+            PasswordHasher._completed += 1
+
+    @staticmethod
+    def stats():
+        with PasswordHasher._lock:
+            return {
+                "workers": PASSWORD_HASH_WORKERS,
+                "max_queue": PASSWORD_HASH_MAX_QUEUE,
+                "in_flight": PasswordHasher._in_flight,
+                "queued": max(PasswordHasher._in_flight - PASSWORD_HASH_WORKERS, 0),
+                "completed": PasswordHasher._completed,
+                "rejected": PasswordHasher._rejected
+            }
@@ -0,0 +1,112 @@
+import bisect
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# Upper bounds (milliseconds) of the histogram buckets; the last bucket is open ended
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class LatencyHistogram:
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = list(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(self.buckets_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def snapshot(self):
+        labels = [f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts))
+        }
+
+
+class PoolMetrics:
+    """Counters for one kind of SQLAlchemy connection pool (the sync or the async engine's)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait = LatencyHistogram()       # time spent waiting for a pooled (or new) connection
+        self.checkout = LatencyHistogram()   # full checkout, including connect and pre-ping
+        self.hold = LatencyHistogram()       # how long a request keeps the connection
+        self.timeouts = 0
+
+    def observe(self, histogram: LatencyHistogram, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            histogram.observe(elapsed_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool):
+        with self._lock:
+            data = {
+                "pool_class": type(pool).__name__,
+                "timeouts": self.timeouts,
+                "wait_time": self.wait.snapshot(),
+                "checkout_latency": self.checkout.snapshot(),
+                "hold_time": self.hold.snapshot()
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout()
+            })
+        return data
+
+
+class InstrumentedPool:
+    """Mixin for QueuePool subclasses that records wait, checkout and hold times into the class's metrics."""
+
+    metrics = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.observe(self.metrics.checkout, started)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe(self.metrics.wait, started)
+        record.info["checked_out_at"] = time.perf_counter()
+        return record
+
+    def _do_return_conn(self, record):
+        started = record.info.pop("checked_out_at", None)
+        if started is not None:
+            self.metrics.observe(self.metrics.hold, started)
+        super()._do_return_conn(record)
+
+
+class InstrumentedQueuePool(InstrumentedPool, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPool, AsyncAdaptedQueuePool):
+    # ✅ The async engine runs pool calls through greenlets, so the same synchronous overrides apply
+    metrics = PoolMetrics()
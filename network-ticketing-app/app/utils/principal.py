@@ -0,0 +1,51 @@
+from app.models.user import UserRole
+
+
+class Principal:
+    """Read-only snapshot of the authenticated user.
+
+    Handlers only read the profile columns and the role from the current
+    user, so a plain object is enough and it can be shared safely across
+    requests (unlike a session-bound ``User`` row).
+
+    Principals built from stateless token claims only carry ``user_id``,
+    ``email`` and ``role``; ``has_profile`` is False for those.
+    """
+
+    __slots__ = ("user_id", "name", "email", "role", "contact_number", "location", "created_at")
+
+    def __init__(self, user_id, email, role, name=None, contact_number=None, location=None, created_at=None):
+        self.user_id = user_id
+        self.email = email
+        self.role = role
+        self.name = name
+        self.contact_number = contact_number
+        self.location = location
+        self.created_at = created_at
+
+    @staticmethod
+    def from_user(user):
+        return Principal(
+            user_id=user.user_id,
+            email=user.email,
+            role=user.role,
+            name=user.name,
+            contact_number=user.contact_number,
+            location=user.location,
+            created_at=user.created_at
+        )
+
+    @staticmethod
+    def from_claims(payload: dict):
+        try:
+            return Principal(
+                user_id=int(payload["user_id"]),
+                email=payload["sub"],
+                role=UserRole(payload["role"])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @property
+    def has_profile(self):
+        return self.name is not None
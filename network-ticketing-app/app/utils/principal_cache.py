@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.user import User
+
+PRINCIPAL_CACHE_ENABLED = os.getenv("PRINCIPAL_CACHE_ENABLED", "true").lower() == "true"
+PRINCIPAL_CACHE_TTL_SECONDS = int(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60))
+PRINCIPAL_CACHE_MAX_SIZE = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", 10000))
+
+_CHANGED_USERS_KEY = "principal_cache_changed_users"
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache of principals keyed by token subject (email), with a TTL.
+
+    Users changed or deleted through the ORM are dropped from this worker's cache when their
+    transaction commits. Other workers are not told: they keep serving the old role or a deleted
+    user until the entry expires, i.e. for up to PRINCIPAL_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: int, max_size: int):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, subject: str):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if expires_at < time.monotonic():
+                del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return principal
+
+    def put(self, subject: str, principal):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, subject: str):
+        with self._lock:
+            if self._entries.pop(subject, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_user_id(self, user_id: int):
+        with self._lock:
+            stale = [key for key, (_, principal) in self._entries.items() if principal.user_id == user_id]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl_seconds,
+                "max_size": self.max_size,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+
+principal_cache = PrincipalCache(
+    enabled=PRINCIPAL_CACHE_ENABLED,
+    ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=PRINCIPAL_CACHE_MAX_SIZE
+)
+
+
+# Users changed or removed through the ORM (email changes included: the old subject is no longer
+# valid) are collected at flush and dropped once the commit is visible. Dropping them at flush would
+# let a request that reads the still-committed old row between flush and commit cache it again.
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    changed = {user.user_id for user in (*session.dirty, *session.deleted) if isinstance(user, User)}
+    if changed:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_cached_principals(session):
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        principal_cache.invalidate_user_id(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop(_CHANGED_USERS_KEY, None)
@@ -0,0 +1,71 @@
+import os
+from sqlalchemy import select
+from app.models.sla import SLA
+from app.utils.versioned_cache import VersionedCache
+
+SLA_CACHE_ENABLED = os.getenv("SLA_CACHE_ENABLED", "true").lower() == "true"
+# Upper bound on how long another worker's SLA change can go unnoticed
+SLA_CACHE_MAX_STALENESS_SECONDS = float(os.getenv("SLA_CACHE_MAX_STALENESS_SECONDS", 10))
+SLA_CACHE_NAME = "sla"
+
+
+class CachedSLA:
+    """Detached copy of an SLA row; exposes the attributes the services and views read."""
+
+    __slots__ = ("sla_id", "severity", "priority", "time_limit_hr")
+
+    def __init__(self, sla_id, severity, priority, time_limit_hr):
+        self.sla_id = sla_id
+        self.severity = severity
+        self.priority = priority
+        self.time_limit_hr = time_limit_hr
+
+
+class SLASnapshot:
+    __slots__ = ("version", "by_id", "by_matrix", "rows")
+
+    def __init__(self, version: int, rows: list):
+        self.version = version
+        self.rows = rows
+        self.by_id = {s.sla_id: s for s in rows}
+        self.by_matrix = {}
+        for s in rows:
+            self.by_matrix.setdefault((s.severity, s.priority), []).append(s)
+
+
+class SLACache(VersionedCache):
+    """The SLA severity x priority matrix, keyed by sla_id and by (severity, priority)."""
+
+    def get(self, sla_id: int, db):
+        snapshot, err = self.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.by_id.get(sla_id), None
+
+    def list_all(self, db):
+        snapshot, err = self.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.rows, None
+
+    def find(self, severity, priority, db):
+        snapshot, err = self.snapshot(db)
+        if err:
+            return None, err
+        return snapshot.by_matrix.get((severity, priority), []), None
+
+    def _load(self, version: int, db):
+        try:
+            rows = db.execute(
+                select(SLA.sla_id, SLA.severity, SLA.priority, SLA.time_limit_hr).order_by(SLA.sla_id)
+            ).all()
+            return SLASnapshot(version, [CachedSLA(*row) for row in rows]), None
+        except Exception as e:
+            return None, f"Error loading SLA cache: {str(e)}"
+
+
+sla_cache = SLACache(
+    name=SLA_CACHE_NAME,
+    enabled=SLA_CACHE_ENABLED,
+    max_staleness_seconds=SLA_CACHE_MAX_STALENESS_SECONDS
+)
@@ -0,0 +1,51 @@
+from datetime import timedelta
+from sqlalchemy import case
+from app.models.ticket import Ticket
+
+# Share of the SLA window (created_at -> due_date) that has elapsed when a ticket turns yellow / red,
+# i.e. yellow once at most 40% of the window is left and red once at most 10% is left
+SLA_WARNING_FRACTION = 0.6
+SLA_CRITICAL_FRACTION = 0.9
+
+SLA_COLORS = ("red", "yellow", "green")
+
+
+class SLAThresholds:
+    """
+    The red/yellow/green SLA color as two timestamps stored on the ticket when it is classified.
+
+    A ticket is green before sla_warning_at, yellow until sla_critical_at and red from then on
+    (which includes every breached ticket), so "which tickets are red right now" compares stored
+    columns instead of recomputing elapsed SLA time per row. Both instants sit at or before due_date
+    and are stored next to it in ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at, so the dashboard
+    reads the matching rows in due_date order and checks the color from the index entry.
+    """
+
+    @staticmethod
+    def compute(created_at, due_date):
+        """(sla_warning_at, sla_critical_at) for a ticket created at created_at and due at due_date."""
+        window = max((due_date - created_at).total_seconds(), 0)
+        warning_at = created_at + timedelta(seconds=int(window * SLA_WARNING_FRACTION))
+        critical_at = created_at + timedelta(seconds=int(window * SLA_CRITICAL_FRACTION))
+        return warning_at, critical_at
+
+    @staticmethod
+    def color_expression(now):
+        return case(
+            (Ticket.sla_critical_at <= now, "red"),
+            (Ticket.sla_warning_at <= now, "yellow"),
+            else_="green"
+        )
+
+    @staticmethod
+    def color_filter(color: str, now):
+        """
+        Tickets of color at now. Yellow and green tickets are not due yet (both thresholds come
+        before due_date), so those filters also bound the due_date range the index read starts at.
+        Red has no such bound, but in due_date order every breached ticket is red.
+        """
+        if color == "red":
+            return Ticket.sla_critical_at <= now
+        if color == "yellow":
+            return (Ticket.due_date > now) & (Ticket.sla_warning_at <= now) & (Ticket.sla_critical_at > now)
+        return (Ticket.due_date > now) & (Ticket.sla_warning_at > now)
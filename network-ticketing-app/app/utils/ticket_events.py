@@ -0,0 +1,176 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Events kept for Last-Event-ID replay, and events one connection may have unsent before it is dropped
+TICKET_EVENTS_REPLAY_SIZE = int(os.getenv("TICKET_EVENTS_REPLAY_SIZE", 1000))
+TICKET_EVENTS_QUEUE_SIZE = int(os.getenv("TICKET_EVENTS_QUEUE_SIZE", 100))
+TICKET_EVENTS_MAX_SUBSCRIBERS = int(os.getenv("TICKET_EVENTS_MAX_SUBSCRIBERS", 1000))
+
+# Roles that see every ticket's events; engineers and customers only see their own tickets
+STAFF_ROLES = ("admin", "manager", "agent")
+
+
+class TicketEvent:
+    __slots__ = ("event_id", "kind", "ticket_id", "created_by", "assigned_to", "data", "at")
+
+    def __init__(self, event_id: int, kind: str, ticket_id: int, created_by, assigned_to, data: dict):
+        self.event_id = event_id
+        self.kind = kind
+        self.ticket_id = ticket_id
+        self.created_by = created_by
+        self.assigned_to = assigned_to
+        self.data = data
+        self.at = datetime.utcnow().replace(microsecond=0)
+
+    def visible_to(self, role: str, user_id: int) -> bool:
+        if role in STAFF_ROLES:
+            return True
+        if role == "engineer":
+            # ✅ Newly classified, unassigned tickets are the engineers' claim queue
+            return self.assigned_to == user_id or (self.kind == "classified" and self.assigned_to is None)
+        if role == "customer":
+            return self.created_by == user_id and not self.kind.startswith("sla_")
+        return False
+
+    def to_dict(self):
+        return {"ticket_id": self.ticket_id, "at": self.at.isoformat(), **self.data}
+
+
+class Subscription:
+    """One connected client: its identity and a bounded queue of events it has not been sent yet."""
+
+    __slots__ = ("user_id", "role", "queue", "lagged")
+
+    def __init__(self, user_id: int, role: str):
+        self.user_id = user_id
+        self.role = role
+        self.queue = asyncio.Queue(maxsize=TICKET_EVENTS_QUEUE_SIZE)
+        # Set when the queue overflowed; the stream then ends so the client reconnects and replays
+        self.lagged = False
+
+
+class TicketEventBus:
+    """
+    In-process fan-out of ticket changes to live connections (see /events/tickets).
+
+    publish() may be called from request threads or the event loop. Every event gets an increasing
+    id and goes into a ring buffer, so a client reconnecting with Last-Event-ID receives what it
+    missed as long as it is still buffered. Delivery never blocks the publisher: a connection whose
+    queue is full is marked lagged and closed instead of buffering without bound.
+
+    The bus is per process: with several workers a client sees the events raised by the worker
+    it is connected to.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # ✅ Prefixes event ids, so a Last-Event-ID from before a restart is recognised as stale
+        self.epoch = int(time.time())
+        self._last_id = 0
+        self._buffer = deque(maxlen=TICKET_EVENTS_REPLAY_SIZE)
+        self._subscribers = set()
+        self._loop = None
+        self.published = 0
+        self.dropped_connections = 0
+
+    def publish(self, kind: str, ticket_id: int, owner_id=None, assignee_id=None, **data):
+        """owner_id / assignee_id (the ticket's created_by / assigned_to) decide who may see the event; data is the payload."""
+        with self._lock:
+            self._last_id += 1
+            event = TicketEvent(self._last_id, kind, ticket_id, owner_id, assignee_id, {"event": kind, **data})
+            self._buffer.append(event)
+            self.published += 1
+            loop = self._loop
+            has_subscribers = bool(self._subscribers)
+        if loop is None or not has_subscribers:
+            return event
+        try:
+            if _running_loop() is loop:
+                self._deliver(event)
+            else:
+                loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:
+            pass  # loop already closed during shutdown
+        return event
+
+    def publish_sla_event(self, sla_event):
+        """SLABreachScheduler listener: forwards warning/critical/breach events to staff connections."""
+        self.publish(
+            f"sla_{sla_event.kind}",
+            sla_event.ticket_id,
+            due_date=sla_event.due_date.isoformat()
+        )
+
+    def event_id(self, event: TicketEvent) -> str:
+        return f"{self.epoch}-{event.event_id}"
+
+    def subscribe(self, user_id: int, role: str, last_event_id: str = None):
+        """
+        Returns (subscription, replay, err). replay holds the buffered events after last_event_id
+        visible to the user, or None when they can no longer be replayed (the id has left the
+        buffer or predates a restart) and the client must refetch its lists instead.
+        """
+        with self._lock:
+            if len(self._subscribers) >= TICKET_EVENTS_MAX_SUBSCRIBERS:
+                return None, None, "Too many live connections, try again later"
+            self._loop = asyncio.get_running_loop()
+            subscription = Subscription(user_id, role)
+            self._subscribers.add(subscription)
+
+            replay = []
+            if last_event_id:
+                last = self._parse_event_id(last_event_id)
+                oldest = self._buffer[0].event_id if self._buffer else self._last_id + 1
+                if last is None or last < oldest - 1 or last > self._last_id:
+                    replay = None
+                else:
+                    replay = [e for e in self._buffer if e.event_id > last and e.visible_to(role, user_id)]
+        return subscription, replay, None
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "replay_size": TICKET_EVENTS_REPLAY_SIZE,
+                "queue_size": TICKET_EVENTS_QUEUE_SIZE,
+                "last_event_id": f"{self.epoch}-{self._last_id}",
+                "published": self.published,
+                "dropped_connections": self.dropped_connections
+            }
+
+    def _parse_event_id(self, value: str):
+        epoch, _, number = value.strip().partition("-")
+        if epoch != str(self.epoch) or not number.isdigit():
+            return None
+        return int(number)
+
+    def _deliver(self, event: TicketEvent):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            if subscription.lagged or not event.visible_to(subscription.role, subscription.user_id):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.lagged = True
+                self.dropped_connections += 1
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+ticket_event_bus = TicketEventBus()
@@ -0,0 +1,185 @@
+import bisect
+import heapq
+import math
+import os
+import re
+import threading
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# "auto" searches with MySQL FULLTEXT on MySQL/MariaDB and with the in-process index elsewhere
+TICKET_SEARCH_BACKEND = os.getenv("TICKET_SEARCH_BACKEND", "auto").lower()
+# Shorter words are neither indexed nor searched; keep in step with innodb_ft_min_token_size on MySQL
+TICKET_SEARCH_MIN_TOKEN_LENGTH = int(os.getenv("TICKET_SEARCH_MIN_TOKEN_LENGTH", 2))
+# Indexed words one query word may expand to by prefix ("rout" -> router, routing, ...)
+TICKET_SEARCH_MAX_EXPANSIONS = int(os.getenv("TICKET_SEARCH_MAX_EXPANSIONS", 50))
+
+# BM25 term-frequency saturation and document-length normalisation
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_PENDING_KEY = "ticket_search_pending"
+
+
+def tokenize(text: str):
+    """Lower-cased words of text, in order, without the ones below the minimum length."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if len(t) >= TICKET_SEARCH_MIN_TOKEN_LENGTH]
+
+
+class TicketSearchIndex:
+    """
+    In-process inverted index over ticket descriptions, ranked with BM25.
+
+    Every query word matches the indexed words it is a prefix of, and a ticket must match all of
+    them. The vocabulary is kept sorted, so the prefix expansion is a binary search.
+
+    Repository writes call stage(), and staged changes are applied once their transaction commits.
+    The index is per process, so it is rebuilt at startup and periodically (see
+    TicketSearchIndexRefresher), which also folds in changes made by other workers. On MySQL the
+    FULLTEXT index is used instead and nothing is kept in memory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings = {}   # word -> {ticket_id: occurrences}
+        self._lengths = {}    # ticket_id -> words indexed
+        self._words = {}      # ticket_id -> its distinct words, so removal only touches those postings
+        self._terms = []      # sorted vocabulary, for prefix lookups
+        self._total_length = 0
+        self.built = False
+        self.rebuilds = 0
+        self.searches = 0
+
+    @staticmethod
+    def uses_fulltext(dialect) -> bool:
+        if TICKET_SEARCH_BACKEND == "auto":
+            return dialect.name in ("mysql", "mariadb")
+        return TICKET_SEARCH_BACKEND == "fulltext"
+
+    def rebuild(self, rows):
+        """rows: (ticket_id, issue_description) for every ticket."""
+        postings, lengths, words, total_length = {}, {}, {}, 0
+        for ticket_id, description in rows:
+            tokens = tokenize(description)
+            lengths[ticket_id] = len(tokens)
+            words[ticket_id] = tuple(set(tokens))
+            total_length += len(tokens)
+            for token in tokens:
+                docs = postings.setdefault(token, {})
+                docs[ticket_id] = docs.get(ticket_id, 0) + 1
+
+        with self._lock:
+            self._postings = postings
+            self._lengths = lengths
+            self._words = words
+            self._terms = sorted(postings)
+            self._total_length = total_length
+            self.built = True
+            self.rebuilds += 1
+
+    def upsert(self, ticket_id: int, description: str):
+        tokens = tokenize(description)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        with self._lock:
+            self._remove(ticket_id)
+            for token, count in counts.items():
+                docs = self._postings.get(token)
+                if docs is None:
+                    docs = self._postings[token] = {}
+                    bisect.insort(self._terms, token)
+                docs[ticket_id] = count
+            self._lengths[ticket_id] = len(tokens)
+            self._words[ticket_id] = tuple(counts)
+            self._total_length += len(tokens)
+
+    def remove(self, ticket_id: int):
+        with self._lock:
+            self._remove(ticket_id)
+
+    def search(self, words, limit: int):
+        """The best limit (ticket_id, score) pairs for tickets matching every word, best first."""
+        with self._lock:
+            self.searches += 1
+            ticket_count = len(self._lengths)
+            if not words or not ticket_count:
+                return []
+            average_length = self._total_length / ticket_count or 1
+
+            scores = None
+            for word in dict.fromkeys(words):
+                # ✅ A ticket holding several expansions (router, routers) counts the best one only
+                best = {}
+                for term in self._expand(word):
+                    docs = self._postings[term]
+                    idf = math.log(1 + (ticket_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                    for ticket_id, occurrences in docs.items():
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[ticket_id] / average_length)
+                        score = idf * occurrences * (BM25_K1 + 1) / (occurrences + norm)
+                        if score > best.get(ticket_id, 0):
+                            best[ticket_id] = score
+
+                if scores is None:
+                    scores = best
+                else:
+                    scores = {ticket_id: s + best[ticket_id] for ticket_id, s in scores.items() if ticket_id in best}
+                if not scores:
+                    return []
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def stage(self, db, ticket_id: int, description):
+        """Queues an index update (description None removes the ticket) for when db's transaction commits."""
+        session = getattr(db, "sync_session", db)  # AsyncSession wraps a Session
+        if TicketSearchIndex.uses_fulltext(session.get_bind().dialect):
+            return
+        session.info.setdefault(_PENDING_KEY, []).append((ticket_id, description))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "backend": TICKET_SEARCH_BACKEND,
+                "built": self.built,
+                "tickets": len(self._lengths),
+                "terms": len(self._terms),
+                "rebuilds": self.rebuilds,
+                "searches": self.searches
+            }
+
+    def _expand(self, word: str):
+        start = bisect.bisect_left(self._terms, word)
+        end = bisect.bisect_left(self._terms, word + "\uffff", start)
+        return self._terms[start:min(end, start + TICKET_SEARCH_MAX_EXPANSIONS)]
+
+    def _remove(self, ticket_id: int):
+        length = self._lengths.pop(ticket_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for token in self._words.pop(ticket_id, ()):
+            docs = self._postings[token]
+            del docs[ticket_id]
+            if not docs:
+                del self._postings[token]
+                del self._terms[bisect.bisect_left(self._terms, token)]
+
+
+ticket_search_index = TicketSearchIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_staged(session):
+    for ticket_id, description in session.info.pop(_PENDING_KEY, ()):
+        if description is None:
+            ticket_search_index.remove(ticket_id)
+        else:
+            ticket_search_index.upsert(ticket_id, description)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged(session):
+    session.info.pop(_PENDING_KEY, None)
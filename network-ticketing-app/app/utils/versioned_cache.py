@@ -0,0 +1,96 @@
+import threading
+import time
+from app.database import SessionLocal
+from app.repositories.cache_version_repository import CacheVersionRepository
+
+
+class VersionedCache:
+    """
+    Process-local copy of a small, rarely changing table.
+
+    Writers bump the cache's row in cache_versions in the same transaction as their change and call
+    invalidate() on this worker. Other workers compare that version at most once every
+    max_staleness_seconds and reload when it moved, so a change reaches every worker within that window.
+
+    Subclasses implement _load(version, db) -> (snapshot, err); a snapshot is immutable, exposes
+    .version and .rows, and is read without taking the lock.
+    """
+
+    def __init__(self, name: str, enabled: bool, max_staleness_seconds: float):
+        self.name = name
+        self.enabled = enabled
+        self.max_staleness_seconds = max_staleness_seconds
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.version_checks = 0
+        self.invalidations = 0
+
+    def snapshot(self, db):
+        snapshot = self._snapshot
+        if self._fresh(snapshot):
+            self.hits += 1
+            return snapshot, None
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._fresh(snapshot):
+                self.hits += 1
+                return snapshot, None
+
+            # ✅ One primary-key read decides whether the (small) table needs reloading
+            version, err = CacheVersionRepository.get_version(self.name, db)
+            if err:
+                return None, f"Error checking {self.name} cache version: {err}"
+            self.version_checks += 1
+
+            if snapshot is None or snapshot.version != version or not self.enabled:
+                snapshot, err = self._load(version, db)
+                if err:
+                    return None, err
+                self.loads += 1
+
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+            return snapshot, None
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+            self.invalidations += 1
+
+    def warm(self):
+        """Loads the table at startup so the first request does not pay for it."""
+        db = SessionLocal()
+        try:
+            _, err = self.snapshot(db)
+            if err:
+                print(f"❌ {self.name} cache warm-up error:", err)
+        finally:
+            db.close()
+
+    def stats(self):
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                "enabled": self.enabled,
+                "max_staleness_seconds": self.max_staleness_seconds,
+                "size": len(snapshot.rows) if snapshot else 0,
+                "version": snapshot.version if snapshot else None,
+                "hits": self.hits,
+                "loads": self.loads,
+                "version_checks": self.version_checks,
+                "invalidations": self.invalidations
+            }
+
+    def _fresh(self, snapshot):
+        return (
+            self.enabled
+            and snapshot is not None
+            and time.monotonic() - self._checked_at < self.max_staleness_seconds
+        )
+
+    def _load(self, version: int, db):
+        raise NotImplementedError
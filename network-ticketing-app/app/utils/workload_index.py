@@ -0,0 +1,139 @@
+import heapq
+import threading
+from sqlalchemy import event
+from app.models.ticket import Severity, Priority, TicketStatus
+from app.models.user import User, UserRole
+
+# ✅ Statuses in which a ticket counts against its engineer's workload
+OPEN_STATUSES = (TicketStatus.assigned, TicketStatus.in_progress, TicketStatus.on_hold)
+
+SEVERITY_WEIGHTS = {Severity.low: 1, Severity.medium: 2, Severity.high: 3}
+PRIORITY_WEIGHTS = {Priority.low: 1, Priority.medium: 2, Priority.high: 3}
+
+
+def ticket_weight(priority, severity) -> int:
+    return PRIORITY_WEIGHTS.get(priority, 1) + SEVERITY_WEIGHTS.get(severity, 1)
+
+
+class WorkloadIndex:
+    """
+    Per-engineer weighted count of open tickets, kept in a min-heap so the least-loaded engineer
+    is found in O(log n) without an aggregate query.
+
+    The heap uses lazy deletion: every load change pushes a fresh (load, engineer_id) entry and
+    entries that no longer match the engineer's current load are discarded when they reach the top.
+    The index is rebuilt from the tickets table at startup and periodically (see WorkloadIndexRefresher),
+    which also folds in assignments made by other workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap = []
+        self._loads = {}      # engineer_id -> current load
+        self._tickets = {}    # ticket_id -> (engineer_id, weight)
+        self.rebuilds = 0
+        self.picks = 0
+
+    def rebuild(self, engineer_ids, open_tickets):
+        """open_tickets: rows of (ticket_id, assigned_to, priority, severity) in an OPEN_STATUSES state."""
+        loads = {engineer_id: 0 for engineer_id in engineer_ids}
+        tickets = {}
+        for ticket_id, assigned_to, priority, severity in open_tickets:
+            if assigned_to not in loads:
+                continue
+            weight = ticket_weight(priority, severity)
+            tickets[ticket_id] = (assigned_to, weight)
+            loads[assigned_to] += weight
+
+        heap = [(load, engineer_id) for engineer_id, load in loads.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._loads = loads
+            self._tickets = tickets
+            self._heap = heap
+            self.rebuilds += 1
+
+    def pick(self):
+        """The engineer with the lowest weighted load (lowest id on ties), or None if there are none."""
+        with self._lock:
+            while self._heap:
+                load, engineer_id = self._heap[0]
+                if self._loads.get(engineer_id) == load:
+                    self.picks += 1
+                    return engineer_id
+                heapq.heappop(self._heap)  # stale entry
+            return None
+
+    def assign(self, ticket_id: int, engineer_id: int, priority, severity):
+        with self._lock:
+            self._release(ticket_id)
+            if engineer_id not in self._loads:
+                return
+            weight = ticket_weight(priority, severity)
+            self._tickets[ticket_id] = (engineer_id, weight)
+            self._adjust(engineer_id, weight)
+
+    def release(self, ticket_id: int):
+        with self._lock:
+            self._release(ticket_id)
+
+    def transition(self, ticket_id: int, new_status):
+        """Called after a status change; tickets leaving the open statuses stop counting."""
+        if new_status not in OPEN_STATUSES:
+            self.release(ticket_id)
+
+    def add_engineer(self, engineer_id: int):
+        with self._lock:
+            if engineer_id not in self._loads:
+                self._loads[engineer_id] = 0
+                heapq.heappush(self._heap, (0, engineer_id))
+
+    def remove_engineer(self, engineer_id: int):
+        with self._lock:
+            self._loads.pop(engineer_id, None)
+            for ticket_id in [t for t, (e, _) in self._tickets.items() if e == engineer_id]:
+                del self._tickets[ticket_id]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "engineers": len(self._loads),
+                "open_tickets": len(self._tickets),
+                "heap_entries": len(self._heap),
+                "rebuilds": self.rebuilds,
+                "picks": self.picks,
+                "loads": {str(engineer_id): load for engineer_id, load in sorted(self._loads.items())}
+            }
+
+    def _release(self, ticket_id: int):
+        entry = self._tickets.pop(ticket_id, None)
+        if entry is not None:
+            engineer_id, weight = entry
+            if engineer_id in self._loads:
+                self._adjust(engineer_id, -weight)
+
+    def _adjust(self, engineer_id: int, delta: int):
+        self._loads[engineer_id] += delta
+        heapq.heappush(self._heap, (self._loads[engineer_id], engineer_id))
+        # ✅ Compact when stale entries dominate, so the heap stays O(engineers)
+        if len(self._heap) > 4 * len(self._loads) + 64:
+            self._heap = [(load, e) for e, load in self._loads.items()]
+            heapq.heapify(self._heap)
+
+
+workload_index = WorkloadIndex()
+
+
+# Track engineers joining, changing role or being removed through the ORM.
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+def _track_engineer(mapper, connection, target):
+    if target.role == UserRole.engineer:
+        workload_index.add_engineer(target.user_id)
+    else:
+        workload_index.remove_engineer(target.user_id)
+
+
+@event.listens_for(User, "after_delete")
+def _forget_engineer(mapper, connection, target):
+    workload_index.remove_engineer(target.user_id)
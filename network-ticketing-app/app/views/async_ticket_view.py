@@ -0,0 +1,752 @@
+from fastapi import APIRouter, Depends, Header
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.responses import JSONResponse
+from app.dependencies.auth import AuthMiddleware, security
+from app.services.async_ticket_service import AsyncTicketService
+from app.services.ticket_service import TicketService
+from app.schemas.ticket import (
+    TicketCreateRequest,
+    AssignTicketRequest,
+    UpdateStatusRequest,
+    ClassifyTicketRequest,
+    UpdateTicketRequest
+)
+from app.utils.role_guard import RoleGuard
+from app.utils.etag import ETag, VERSION_CONFLICT
+from app.utils.pagination import Pagination
+from app.database import get_async_db
+
+# Served instead of the matching ticket_view routes when TICKET_DB_MODE=async
+async_ticket_router = APIRouter()
+
+# 🎫 Create Ticket
+@async_ticket_router.post("/tickets")
+async def create_ticket(
+    ticket_data: TicketCreateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.create_ticket(user, ticket_data, db)
+    if err:
+        return JSONResponse(
+            status_code=403 if "Only users" in err else 500,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=201,
+        content={
+            "status": "success",
+            "message": "Ticket created successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "created_by": ticket.created_by,
+                "issue_description": ticket.issue_description,
+                "status": ticket.status.value if ticket.status else None,
+                "severity": ticket.severity.value if ticket.severity else None,
+                "priority": ticket.priority.value if ticket.priority else None,
+                "issue_category_id": ticket.issue_category_id,
+                "sla_id": ticket.sla_id,
+                "assigned_to": ticket.assigned_to,
+                "created_at": str(ticket.created_at),
+                "updated_at": str(ticket.updated_at),
+                "due_date": str(ticket.due_date) if ticket.due_date else None,
+                "address_id": ticket.address_id  
+            }
+        }
+    )
+
+
+
+# 🧮 Get Unclassified Tickets
+@async_ticket_router.get("/tickets/unclassified")
+async def get_unclassified_tickets(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.UNCLASSIFIED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = await AsyncTicketService.get_unclassified_tickets(user, db, page)
+    if err:
+        return JSONResponse(status_code=403, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "message": "Unclassified tickets fetched",
+            "data": [  # Simplified list
+                {
+                    "ticket_id": t.ticket_id,
+                    "issue_description": t.issue_description,
+                    "status": t.status.value if t.status else None,
+                    "created_by": t.created_by,
+                    "created_at": str(t.created_at)
+                } for t in result.items
+            ],
+            "next_cursor": result.next_cursor
+        }
+    )
+
+# 🛠️ Classify Ticket
+@async_ticket_router.patch("/tickets/{ticket_id}/classify")
+async def classify_ticket(
+    ticket_id: int,
+    payload: ClassifyTicketRequest,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.classify_ticket(user, ticket_id, payload, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(status_code=403, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket classified successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "severity": ticket.severity.value if ticket.severity else None,
+                "priority": ticket.priority.value if ticket.priority else None,
+                "sla_id": ticket.sla_id,
+                "due_date": str(ticket.due_date) if ticket.due_date else None
+            }
+        }
+    )
+
+# 👷 Assign Ticket
+@async_ticket_router.put("/tickets/{ticket_id}/assign")
+async def assign_ticket(
+    ticket_id: int,
+    payload: AssignTicketRequest,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.assign_ticket(user, ticket_id, payload, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(
+            status_code=403 if "Only admins" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket assigned successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "assigned_to": ticket.assigned_to,
+                "status": ticket.status.value if ticket.status else None
+            }
+        }
+    )
+
+# ⚖️ Auto-assign Ticket to the least-loaded engineer
+@async_ticket_router.put("/tickets/{ticket_id}/auto-assign")
+async def auto_assign_ticket(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.auto_assign_ticket(user, ticket_id, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(
+            status_code=503 if "No engineers" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket assigned successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "assigned_to": ticket.assigned_to,
+                "status": ticket.status.value if ticket.status else None
+            }
+        }
+    )
+
+# 📥 Claim the next ticket from the classified queue (engineers)
+@async_ticket_router.post("/tickets/next")
+async def claim_next_ticket(
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.claim_next_ticket(user, db)
+    if err:
+        if "Only engineers" in err:
+            status_code = 403
+        elif "No tickets" in err:
+            status_code = 404
+        else:
+            status_code = 400
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket claimed successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "assigned_to": ticket.assigned_to,
+                "status": ticket.status.value if ticket.status else None,
+                "priority": ticket.priority.value if ticket.priority else None,
+                "severity": ticket.severity.value if ticket.severity else None,
+                "due_date": str(ticket.due_date) if ticket.due_date else None
+            }
+        }
+    )
+
+# 🔄 Update Ticket Status
+@async_ticket_router.patch("/tickets/{ticket_id}/status")
+async def change_ticket_status(
+    ticket_id: int,
+    payload: UpdateStatusRequest,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.change_ticket_status(user, ticket_id, payload.status.value, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(status_code=403, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": f"Ticket status updated to '{ticket.status.value}'",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "status": ticket.status.value
+            }
+        }
+    )
+
+
+# 🔎 Full-text search over ticket descriptions, best match first (agents, managers, admins)
+@async_ticket_router.get("/tickets/search")
+async def search_tickets(
+    q: str = "",
+    limit: int = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    results, err = await AsyncTicketService.search_tickets(user, q, limit, db)
+    if err:
+        if "authorized" in err:
+            status_code = 403
+        elif err.startswith(("limit", "Search query")):
+            status_code = 400
+        else:
+            status_code = 500
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(status_code=200, content={"status": "success", "data": results})
+
+
+@async_ticket_router.get("/tickets/classified")
+async def get_classified_tickets(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # ✅ Authenticate user
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.CLASSIFIED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    # ✅ Fetch classified tickets
+    result, err = await AsyncTicketService.get_classified_tickets(user, db, page)
+    if err:
+        return JSONResponse(status_code=403 if "authorized" in err else 500, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
+
+
+@async_ticket_router.get("/tickets/assigned")
+async def get_assigned_tickets(
+    status: str = None,
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.ASSIGNED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = await AsyncTicketService.get_engineer_tickets(user, status, db, page)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "message": "Assigned tickets fetched",
+            "data": [
+                {
+                    "ticket_id": t.ticket_id,
+                    "issue_description": t.issue_description,
+                    "status": t.status.value if t.status else None,
+                    "severity": t.severity.value if t.severity else None,
+                    "priority": t.priority.value if t.priority else None,
+                    "sla_id": t.sla_id,
+                    "assigned_to": t.assigned_to,
+                    "created_at": str(t.created_at),
+                    "due_date": str(t.due_date) if t.due_date else None
+                } for t in result.items
+            ],
+            "next_cursor": result.next_cursor
+        }
+    )
+
+
+
+@async_ticket_router.put("/tickets/{ticket_id}/start")
+async def start_ticket_work(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.start_ticket_work(user, ticket_id, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(
+            status_code=403 if "not assigned" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket marked as in progress",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "status": ticket.status.value
+            }
+        }
+    )
+
+# for engineer
+
+@async_ticket_router.get("/tickets/{ticket_id}")
+async def get_ticket_details(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.get_ticket_details(user, ticket_id, db)
+    if err:
+        return JSONResponse(
+            status_code=403 if "not assigned" in err else 404,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers={"ETag": ETag.for_version(ticket.version)},
+        content={
+            "status": "success",
+            "message": "Ticket details fetched successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "status": ticket.status.value,
+                "assigned_to": ticket.assigned_to,
+                "created_by": ticket.created_by,
+                "issue_description": ticket.issue_description,
+                "severity": ticket.severity.value if ticket.severity else None,
+                "priority": ticket.priority.value if ticket.priority else None,
+                "issue_category_id": ticket.issue_category_id,
+                "sla_id": ticket.sla_id,
+                "created_at": str(ticket.created_at),
+                "updated_at": str(ticket.updated_at),
+                "due_date": str(ticket.due_date) if ticket.due_date else None
+            }
+        }
+    )
+
+
+# 🕒 Ticket timeline: action logs, assignments and feedback merged in time order
+@async_ticket_router.get("/tickets/{ticket_id}/timeline")
+async def get_ticket_timeline(
+    ticket_id: int,
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.TIMELINE_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = await AsyncTicketService.get_ticket_timeline(user, ticket_id, db, page)
+    if err:
+        if err == "Ticket not found":
+            status_code = 404
+        elif "not assigned" in err or "not authorized" in err:
+            status_code = 403
+        else:
+            status_code = 500
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
+
+
+
+# customer can edit the raised ticket
+@async_ticket_router.put("/{ticket_id}/edit")
+async def edit_ticket_by_customer(
+    ticket_id: int,
+    payload: UpdateTicketRequest,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = await AsyncTicketService.update_ticket_by_customer(ticket_id, payload, db, user, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(
+            status_code=403 if "Only customers" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket updated successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "issue_description": ticket.issue_description,
+                "issue_category_id": ticket.issue_category_id,
+                "address_id": ticket.address_id,
+                "updated_at": str(ticket.updated_at)
+            }
+        }
+    )
+
+
+
+# customers can delete their raised ticket
+@async_ticket_router.delete("/{ticket_id}/delete")
+async def delete_ticket_by_customer(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    success, err = await AsyncTicketService.delete_ticket_by_customer(ticket_id, db, user, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        status_code = 403 if "Only customers" in err or "unauthorized" in err else 400
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    if not success:
+        return JSONResponse(status_code=500, content={"status": "error", "message": "Unknown error during deletion"})
+
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "message": "Ticket deleted successfully"}
+    )
+
+
+
+# customer can view his own ticket
+@async_ticket_router.get("/ticket/{ticket_id}/summary")
+async def get_ticket_summary_for_customer(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    summary, err = await AsyncTicketService.get_ticket_summary_for_customer(ticket_id, user, db)
+    if err:
+        status_code = 403 if "unauthorized" in err else 404
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "status": "success",
+            "message": "Ticket summary fetched successfully",
+            "data": summary
+        }
+    )
+
+
+
+
+
+@async_ticket_router.get("/agent/all")
+async def get_all_tickets_for_agent(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # ✅ Authentication
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Role check
+    if not RoleGuard.has_role(user, ["agent"]):
+        return JSONResponse(status_code=403, content={"status": "error", "message": "Access denied"})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.ALL_TICKETS_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    # ✅ Fetch all tickets with users
+    result, err = await AsyncTicketService.get_all_tickets_with_users(db, page)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
+
+
+
+
+@async_ticket_router.patch("/agent/{ticket_id}/status")
+async def agent_update_ticket_status(
+    ticket_id: int,
+    payload: UpdateStatusRequest,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # ✅ Authentication
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    # ✅ Role validation
+    if not RoleGuard.has_role(user, ["agent"]):
+        return JSONResponse(
+            status_code=403,
+            content={"status": "error", "message": "Access denied: Only agents can update ticket status."}
+        )
+
+    # ✅ Service call
+    ticket, err = await AsyncTicketService.update_ticket_status_by_agent(
+        ticket_id, payload.status.value, db, expected_versions=expected_versions, actor_id=user.user_id
+    )
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    # ✅ Success
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": f"Ticket status updated to '{ticket.status.value}'",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "status": ticket.status.value
+            }
+        }
+    )
+
+
+
+
+
+
+# ♻️ Customer Reopen Ticket
+@async_ticket_router.patch("/tickets/{ticket_id}/reopen")
+async def reopen_ticket_by_customer(
+    ticket_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # ✅ Authenticate customer
+    user, err = await AuthMiddleware.get_current_user_async(credentials, db)
+    if err:
+        return JSONResponse(
+            status_code=401,
+            content={"status": "error", "message": err}
+        )
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    # ✅ Service call
+    ticket, err = await AsyncTicketService.reopen_ticket_by_customer(ticket_id, db, user, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        status_code = 403 if "Only customers" in err or "authorized" in err else 400
+        return JSONResponse(
+            status_code=status_code,
+            content={"status": "error", "message": err}
+        )
+
+    # ✅ Success
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket reopened successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "status": ticket.status.value if ticket.status else None,
+                "updated_at": str(ticket.updated_at)
+            }
+        }
+    )
+
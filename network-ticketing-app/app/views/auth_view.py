@@ -5,6 +5,7 @@ from app.schemas.user import UserCreate,LoginRequest
 from app.database import get_db
 from app.services.auth_service import AuthService
 from app.dependencies.auth import AuthMiddleware, security
+from app.utils.password_hasher import HASHER_BUSY
 from fastapi.responses import JSONResponse
 
 
@@ -12,10 +13,12 @@ from fastapi.responses import JSONResponse
 auth_router = APIRouter()
 
 @auth_router.post("/signup")
-def signup(user: UserCreate, db: Session = Depends(get_db)):
+async def signup(user: UserCreate, db: Session = Depends(get_db)):
     print("came here in signup!!!!!!!!!!!!!!!!!")
-    new_user, err = AuthService.signup(user, db)
+    new_user, err = await AuthService.signup(user, db)
 
+    if err == HASHER_BUSY:
+        return JSONResponse(status_code=503, headers={"Retry-After": "1"}, content={"status": "error", "message": err})
     if err == "Email already registered":
         return JSONResponse(status_code=409, content={"status": "error", "message": err})
     if err:
@@ -39,10 +42,12 @@ def signup(user: UserCreate, db: Session = Depends(get_db)):
 
 
 @auth_router.post("/login")
-def login(user: LoginRequest, db: Session = Depends(get_db)):
+async def login(user: LoginRequest, db: Session = Depends(get_db)):
     print("here!!!!!!!!!!!!!!!!!!!!!!!!!!!!!")
-    result, err = AuthService.login(user, db)
+    result, err = await AuthService.login(user, db)
 
+    if err == HASHER_BUSY:
+        return JSONResponse(status_code=503, headers={"Retry-After": "1"}, content={"status": "error", "message": err})
     if err == "Invalid email or password":
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
     if err:
@@ -70,6 +75,10 @@ def get_current_user(
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
 
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    user, err = AuthMiddleware.get_user_profile(user, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
@@ -153,7 +162,7 @@ def _get_current_user(
 
 
 @auth_router.post("/admin/signup")
-def admin_signup(
+async def admin_signup(
     user: UserCreate,
     db: Session = Depends(get_db),
     current_user=Depends(_get_current_user)
@@ -171,8 +180,10 @@ def admin_signup(
             content={"status": "error", "message": "Only admins can create new users"}
         )
 
-    new_user, err = AuthService.admin_signup(user, db)
+    new_user, err = await AuthService.admin_signup(user, db)
 
+    if err == HASHER_BUSY:
+        return JSONResponse(status_code=503, headers={"Retry-After": "1"}, content={"status": "error", "message": err})
     if err == "Email already registered":
         return JSONResponse(status_code=409, content={"status": "error", "message": err})
     if err:
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Header
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.dependencies.auth import AuthMiddleware
+from app.services.ticket_event_service import TicketEventService, SSE_MEDIA_TYPE
+from app.database import SessionLocal
+
+event_router = APIRouter()
+
+# EventSource cannot send headers, so the stream also accepts the access token as ?token=
+optional_security = HTTPBearer(auto_error=False)
+
+
+# 📡 Live ticket updates (Server-Sent Events)
+@event_router.get("/tickets")
+def ticket_events(
+    token: str = None,
+    last_event_id: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(optional_security)
+):
+    if credentials is None and token:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    if credentials is None:
+        return JSONResponse(status_code=401, content={"status": "error", "message": "Not authenticated"})
+
+    # ✅ Authentication on a session of its own, closed before streaming: a stream stays open for
+    # hours and would otherwise hold a pooled connection all that time
+    db = SessionLocal()
+    try:
+        user, err = AuthMiddleware.get_current_user(credentials, db)
+    finally:
+        db.close()
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    frames, err = TicketEventService.open_stream(user, last_event_id)
+    if err:
+        return JSONResponse(status_code=403, content={"status": "error", "message": err})
+
+    return StreamingResponse(
+        frames,
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.issue_category import IssueCategoryCreateRequest, IssueCategoryUpdateRequest
 from app.services.issue_category_service import IssueCategoryService
 from app.dependencies.auth import AuthMiddleware, security
 from app.utils.role_guard import RoleGuard
+from app.utils.etag import ETag
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.router import ticket_router
 
@@ -34,12 +35,20 @@ def create_category(
 
 
 @issue_category_router.get("/issue-categories")
-def list_categories(db: Session = Depends(get_db)):
-    response, err = IssueCategoryService.list_all(db)
+def list_categories(
+    db: Session = Depends(get_db),
+    if_none_match: str = Header(None)
+):
+    result, err = IssueCategoryService.list_all(db)
     if err:
         return JSONResponse(status_code=500, content={"status": "error", "message": err})
 
-    return JSONResponse(status_code=200, content={"status": "success", "data": response})
+    # ✅ no-cache: clients may keep the list but must revalidate it, which costs them a 304
+    headers = {"ETag": result["etag"], "Cache-Control": "no-cache"}
+    if ETag.none_match(if_none_match, result["etag"]):
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(status_code=200, headers=headers, content={"status": "success", "data": result["items"]})
 
 
 
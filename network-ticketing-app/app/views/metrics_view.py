@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials
+from app.database import get_db, engine, async_engine
+from app.dependencies.auth import AuthMiddleware, security
+from app.utils.password_hasher import PasswordHasher
+from app.utils.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool
+from app.utils.principal_cache import principal_cache
+from app.utils.role_guard import RoleGuard
+from app.utils.sla_cache import sla_cache
+from app.utils.category_catalog import category_catalog
+from app.utils.workload_index import workload_index
+from app.tasks.sla_breach_scheduler import sla_breach_scheduler
+from app.utils.ticket_events import ticket_event_bus
+from app.tasks.action_log_writer import action_log_writer
+from app.utils.ticket_search import ticket_search_index
+
+metrics_router = APIRouter()
+
+
+def db_pool_stats():
+    data = InstrumentedQueuePool.metrics.snapshot(engine.pool)
+    if async_engine is not None:
+        data["async_pool"] = InstrumentedAsyncQueuePool.metrics.snapshot(async_engine.sync_engine.pool)
+    return data
+
+
+# Component name -> zero-argument stats function; each is served at /metrics/<name>
+METRICS = {
+    "principal-cache": principal_cache.stats,               # 📊 principal cache hits and misses
+    "password-hasher": PasswordHasher.stats,                # 🔐 password hashing pool depth and rejections
+    "db-pool": db_pool_stats,                               # 🗄️ pool occupancy and wait/checkout/hold histograms
+    "sla-cache": sla_cache.stats,                           # ⏱️ SLA matrix loads, version checks, invalidations
+    "category-catalog": category_catalog.stats,             # 🗂️ issue category catalog loads and invalidations
+    "workload-index": workload_index.stats,                 # ⚖️ per-engineer open workload for auto-assignment
+    "sla-scheduler": sla_breach_scheduler.stats,            # ⏰ tracked tickets, next wake-up, events emitted
+    "ticket-events": ticket_event_bus.stats,                # 📡 live feed connections and dropped slow consumers
+    "action-log": action_log_writer.stats,                  # 📝 buffered action log records and failed flushes
+    "ticket-search": ticket_search_index.stats              # 🔎 search backend, indexed tickets, vocabulary size
+}
+
+
+def _admin_error(credentials, db):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    if not RoleGuard.has_role(user, ["admin"]):
+        return JSONResponse(status_code=403, content={"status": "error", "message": "Only admins can view metrics"})
+    return None
+
+
+# 📊 Every component's stats in one response (admin only)
+@metrics_router.get("")
+def all_metrics(
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    error = _admin_error(credentials, db)
+    if error:
+        return error
+
+    data = {name: stats() for name, stats in METRICS.items()}
+    return JSONResponse(status_code=200, content={"status": "success", "data": data})
+
+
+# 📊 One component's stats, e.g. /metrics/db-pool (admin only)
+@metrics_router.get("/{component}")
+def component_metrics(
+    component: str,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    error = _admin_error(credentials, db)
+    if error:
+        return error
+
+    stats = METRICS.get(component)
+    if stats is None:
+        return JSONResponse(status_code=404, content={"status": "error", "message": "Unknown metrics component"})
+
+    return JSONResponse(status_code=200, content={"status": "success", "data": stats()})
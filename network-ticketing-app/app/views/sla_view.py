@@ -7,6 +7,7 @@ from app.schemas.sla import SLACreateRequest, SLAUpdateRequest
 from app.services.sla_service import SLAService
 from app.dependencies.auth import AuthMiddleware
 from app.utils.role_guard import RoleGuard
+from app.utils.pagination import Pagination
 from fastapi import Query
 
 
@@ -107,6 +108,11 @@ def filter_slas(
 
 @sla_router.get("/agent/tickets/sla-status")
 def agent_sla_status(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    color: str = None,
+    remaining_lt: int = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -125,8 +131,16 @@ def agent_sla_status(
             content={"status": "error", "message": "Access denied"}
         )
 
-    # ✅ fetch SLA status of all tickets
-    data, err = SLAService.get_sla_status_for_agent(db)
+    # ✅ validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, SLAService.SLA_STATUS_SORTS)
+    if err:
+        return JSONResponse(
+            status_code=400, 
+            content={"status": "error", "message": err}
+        )
+
+    # ✅ fetch SLA status of the matching tickets
+    result, err = SLAService.get_sla_status_for_agent(db, page, color, remaining_lt)
     if err:
         return JSONResponse(
             status_code=400, 
@@ -135,5 +149,5 @@ def agent_sla_status(
 
     return JSONResponse(
         status_code=200, 
-        content={"status": "success", "data": data}
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
     )
@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.orm import Session
 from fastapi.security import HTTPAuthorizationCredentials
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from datetime import datetime
 from app.dependencies.auth import AuthMiddleware, security
 from app.services.ticket_service import TicketService
+from app.services.ticket_export_service import TicketExportService, EXPORT_MEDIA_TYPES
 from app.schemas.ticket import (
     TicketCreateRequest,
+    BulkTicketCreateRequest,
     AssignTicketRequest,
+    BulkAssignTicketsRequest,
     UpdateStatusRequest,
     ClassifyTicketRequest,
+    BulkClassifyTicketsRequest,
     UpdateTicketRequest
 )
 from app.utils.role_guard import RoleGuard
+from app.utils.etag import ETag, VERSION_CONFLICT
+from app.utils.pagination import Pagination
 from app.database import get_db
 
 ticket_router = APIRouter()
@@ -59,9 +66,49 @@ def create_ticket(
 
 
 
+# 📦 Bulk Create Tickets
+@ticket_router.post("/tickets/bulk")
+def bulk_create_tickets(
+    payload: BulkTicketCreateRequest,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    results, err = TicketService.bulk_create_tickets(user, payload.tickets, db)
+    if err:
+        return JSONResponse(
+            status_code=403 if "Only customers" in err else 400 if "tickets" in err else 500,
+            content={"status": "error", "message": err}
+        )
+
+    created = sum(1 for r in results if r["status"] == "created")
+    failed = len(results) - created
+
+    # ✅ 201 when every item was created, 207 for a partial batch, 400 when nothing was
+    return JSONResponse(
+        status_code=201 if not failed else 207 if created else 400,
+        content={
+            "status": "success" if not failed else "partial" if created else "error",
+            "message": f"{created} ticket(s) created, {failed} failed",
+            "data": {
+                "created": created,
+                "failed": failed,
+                "results": results
+            }
+        }
+    )
+
+
+
 # 🧮 Get Unclassified Tickets
 @ticket_router.get("/tickets/unclassified")
 def get_unclassified_tickets(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -69,7 +116,12 @@ def get_unclassified_tickets(
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    tickets, err = TicketService.get_unclassified_tickets(user, db)
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.UNCLASSIFIED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = TicketService.get_unclassified_tickets(user, db, page)
     if err:
         return JSONResponse(status_code=403, content={"status": "error", "message": err})
 
@@ -85,8 +137,9 @@ def get_unclassified_tickets(
                     "status": t.status.value if t.status else None,
                     "created_by": t.created_by,
                     "created_at": str(t.created_at)
-                } for t in tickets
-            ]
+                } for t in result.items
+            ],
+            "next_cursor": result.next_cursor
         }
     )
 
@@ -96,18 +149,26 @@ def classify_ticket(
     ticket_id: int,
     payload: ClassifyTicketRequest,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    ticket, err = TicketService.classify_ticket(user, ticket_id, payload, db)
+    expected_versions, err = ETag.parse_if_match(if_match)
     if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.classify_ticket(user, ticket_id, payload, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(status_code=403, content={"status": "error", "message": err})
 
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": "Ticket classified successfully",
@@ -127,14 +188,21 @@ def assign_ticket(
     ticket_id: int,
     payload: AssignTicketRequest,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    ticket, err = TicketService.assign_ticket(user, ticket_id, payload, db)
+    expected_versions, err = ETag.parse_if_match(if_match)
     if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.assign_ticket(user, ticket_id, payload, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(
             status_code=403 if "Only admins" in err else 400,
             content={"status": "error", "message": err}
@@ -142,6 +210,7 @@ def assign_ticket(
 
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": "Ticket assigned successfully",
@@ -153,24 +222,166 @@ def assign_ticket(
         }
     )
 
+# ⚖️ Auto-assign Ticket to the least-loaded engineer
+@ticket_router.put("/tickets/{ticket_id}/auto-assign")
+def auto_assign_ticket(
+    ticket_id: int,
+    db: Session = Depends(get_db),
+    if_match: str = Header(None),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.auto_assign_ticket(user, ticket_id, db, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
+        return JSONResponse(
+            status_code=503 if "No engineers" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket assigned successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "assigned_to": ticket.assigned_to,
+                "status": ticket.status.value if ticket.status else None
+            }
+        }
+    )
+
+# 📥 Claim the next ticket from the classified queue (engineers)
+@ticket_router.post("/tickets/next")
+def claim_next_ticket(
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.claim_next_ticket(user, db)
+    if err:
+        if "Only engineers" in err:
+            status_code = 403
+        elif "No tickets" in err:
+            status_code = 404
+        else:
+            status_code = 400
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        headers=ETag.headers(ticket.version),
+        content={
+            "status": "success",
+            "message": "Ticket claimed successfully",
+            "data": {
+                "ticket_id": ticket.ticket_id,
+                "assigned_to": ticket.assigned_to,
+                "status": ticket.status.value if ticket.status else None,
+                "priority": ticket.priority.value if ticket.priority else None,
+                "severity": ticket.severity.value if ticket.severity else None,
+                "due_date": str(ticket.due_date) if ticket.due_date else None
+            }
+        }
+    )
+
+# 🛠️ Bulk Classify Tickets
+@ticket_router.patch("/tickets/classify/bulk")
+def bulk_classify_tickets(
+    payload: BulkClassifyTicketsRequest,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    results, err = TicketService.bulk_classify_tickets(user, payload, db)
+    if err:
+        return JSONResponse(
+            status_code=403 if "Only authorized" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return _bulk_update_response(results, "classified")
+
+# 👷 Bulk Assign Tickets
+@ticket_router.put("/tickets/assign/bulk")
+def bulk_assign_tickets(
+    payload: BulkAssignTicketsRequest,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    results, err = TicketService.bulk_assign_tickets(user, payload, db)
+    if err:
+        return JSONResponse(
+            status_code=403 if "Customers" in err else 409 if "concurrently" in err else 400,
+            content={"status": "error", "message": err}
+        )
+
+    return _bulk_update_response(results, "assigned")
+
+def _bulk_update_response(results, done: str):
+    succeeded = sum(1 for r in results if r["status"] == done)
+    failed = len(results) - succeeded
+
+    # ✅ 200 when every ticket was updated, 207 for a partial batch, 400 when none were
+    return JSONResponse(
+        status_code=200 if not failed else 207 if succeeded else 400,
+        content={
+            "status": "success" if not failed else "partial" if succeeded else "error",
+            "message": f"{succeeded} ticket(s) {done}, {failed} failed",
+            "data": {
+                done: succeeded,
+                "failed": failed,
+                "results": results
+            }
+        }
+    )
+
 # 🔄 Update Ticket Status
 @ticket_router.patch("/tickets/{ticket_id}/status")
 def change_ticket_status(
     ticket_id: int,
     payload: UpdateStatusRequest,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    ticket, err = TicketService.change_ticket_status(user, ticket_id, payload.status.value, db)
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.change_ticket_status(user, ticket_id, payload.status.value, db, expected_versions=expected_versions)
     if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(status_code=403, content={"status": "error", "message": err})
 
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": f"Ticket status updated to '{ticket.status.value}'",
@@ -182,8 +393,36 @@ def change_ticket_status(
     )
 
 
+# 🔎 Full-text search over ticket descriptions, best match first (agents, managers, admins)
+@ticket_router.get("/tickets/search")
+def search_tickets(
+    q: str = "",
+    limit: int = None,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    results, err = TicketService.search_tickets(user, q, limit, db)
+    if err:
+        if "authorized" in err:
+            status_code = 403
+        elif err.startswith(("limit", "Search query")):
+            status_code = 400
+        else:
+            status_code = 500
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(status_code=200, content={"status": "success", "data": results})
+
+
 @ticket_router.get("/tickets/classified")
 def get_classified_tickets(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -192,17 +431,28 @@ def get_classified_tickets(
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.CLASSIFIED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
     # ✅ Fetch classified tickets
-    response, err = TicketService.get_classified_tickets(user, db)
+    result, err = TicketService.get_classified_tickets(user, db, page)
     if err:
         return JSONResponse(status_code=403 if "authorized" in err else 500, content={"status": "error", "message": err})
 
-    return JSONResponse(status_code=200, content={"status": "success", "data": response})
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
 
 
 @ticket_router.get("/tickets/assigned")
 def get_assigned_tickets(
     status: str = None,
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -210,7 +460,12 @@ def get_assigned_tickets(
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    tickets, err = TicketService.get_engineer_tickets(user, status, db)
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.ASSIGNED_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = TicketService.get_engineer_tickets(user, status, db, page)
     if err:
         return JSONResponse(status_code=400, content={"status": "error", "message": err})
 
@@ -230,8 +485,9 @@ def get_assigned_tickets(
                     "assigned_to": t.assigned_to,
                     "created_at": str(t.created_at),
                     "due_date": str(t.due_date) if t.due_date else None
-                } for t in tickets
-            ]
+                } for t in result.items
+            ],
+            "next_cursor": result.next_cursor
         }
     )
 
@@ -241,14 +497,21 @@ def get_assigned_tickets(
 def start_ticket_work(
     ticket_id: int,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    ticket, err = TicketService.start_ticket_work(user, ticket_id, db)
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.start_ticket_work(user, ticket_id, db, expected_versions=expected_versions)
     if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(
             status_code=403 if "not assigned" in err else 400,
             content={"status": "error", "message": err}
@@ -256,6 +519,7 @@ def start_ticket_work(
 
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": "Ticket marked as in progress",
@@ -287,6 +551,7 @@ def get_ticket_details(
 
     return JSONResponse(
         status_code=200,
+        headers={"ETag": ETag.for_version(ticket.version)},
         content={
             "status": "success",
             "message": "Ticket details fetched successfully",
@@ -308,6 +573,40 @@ def get_ticket_details(
     )
 
 
+# 🕒 Ticket timeline: action logs, assignments and feedback merged in time order
+@ticket_router.get("/tickets/{ticket_id}/timeline")
+def get_ticket_timeline(
+    ticket_id: int,
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.TIMELINE_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    result, err = TicketService.get_ticket_timeline(user, ticket_id, db, page)
+    if err:
+        if err == "Ticket not found":
+            status_code = 404
+        elif "not assigned" in err or "not authorized" in err:
+            status_code = 403
+        else:
+            status_code = 500
+        return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
+
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
+
 
 # customer can edit the raised ticket
 @ticket_router.put("/{ticket_id}/edit")
@@ -315,14 +614,21 @@ def edit_ticket_by_customer(
     ticket_id: int,
     payload: UpdateTicketRequest,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    ticket, err = TicketService.update_ticket_by_customer(ticket_id, payload, db, user)
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    ticket, err = TicketService.update_ticket_by_customer(ticket_id, payload, db, user, expected_versions=expected_versions)
     if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(
             status_code=403 if "Only customers" in err else 400,
             content={"status": "error", "message": err}
@@ -330,6 +636,7 @@ def edit_ticket_by_customer(
 
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": "Ticket updated successfully",
@@ -350,14 +657,21 @@ def edit_ticket_by_customer(
 def delete_ticket_by_customer(
     ticket_id: int,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     user, err = AuthMiddleware.get_current_user(credentials, db)
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
-    success, err = TicketService.delete_ticket_by_customer(ticket_id, db, user)
+    expected_versions, err = ETag.parse_if_match(if_match)
     if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    success, err = TicketService.delete_ticket_by_customer(ticket_id, db, user, expected_versions=expected_versions)
+    if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         status_code = 403 if "Only customers" in err or "unauthorized" in err else 400
         return JSONResponse(status_code=status_code, content={"status": "error", "message": err})
 
@@ -404,6 +718,9 @@ def get_ticket_summary_for_customer(
 
 @ticket_router.get("/agent/all")
 def get_all_tickets_for_agent(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -416,14 +733,50 @@ def get_all_tickets_for_agent(
     if not RoleGuard.has_role(user, ["agent"]):
         return JSONResponse(status_code=403, content={"status": "error", "message": "Access denied"})
 
+    # ✅ Validate paging params
+    page, err = Pagination.parse(limit, cursor, sort, TicketService.ALL_TICKETS_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
     # ✅ Fetch all tickets with users
-    data, err = TicketService.get_all_tickets_with_users(db)
+    result, err = TicketService.get_all_tickets_with_users(db, page)
     if err:
         return JSONResponse(status_code=400, content={"status": "error", "message": err})
 
-    return JSONResponse(status_code=200, content={"status": "success", "data": data})
+    return JSONResponse(
+        status_code=200,
+        content={"status": "success", "data": result.items, "next_cursor": result.next_cursor}
+    )
+
+
+
+
+# 📤 Export tickets as NDJSON or CSV, streamed row batch by row batch
+@ticket_router.get("/agent/export")
+def export_tickets(
+    format: str = "ndjson",
+    status: str = None,
+    created_from: datetime = None,
+    created_to: datetime = None,
+    category_id: int = None,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    # ✅ Authentication
+    user, err = AuthMiddleware.get_current_user(credentials, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
+    # ✅ Validate filters and start the query
+    chunks, err = TicketExportService.open_export(user, format, status, created_from, created_to, category_id)
+    if err:
+        return JSONResponse(status_code=403 if "authorized" in err else 400, content={"status": "error", "message": err})
 
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tickets.{format}"'}
+    )
 
 
 @ticket_router.patch("/agent/{ticket_id}/status")
@@ -431,6 +784,7 @@ def agent_update_ticket_status(
     ticket_id: int,
     payload: UpdateStatusRequest,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # ✅ Authentication
@@ -438,6 +792,10 @@ def agent_update_ticket_status(
     if err:
         return JSONResponse(status_code=401, content={"status": "error", "message": err})
 
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
     # ✅ Role validation
     if not RoleGuard.has_role(user, ["agent"]):
         return JSONResponse(
@@ -446,13 +804,18 @@ def agent_update_ticket_status(
         )
 
     # ✅ Service call
-    ticket, err = TicketService.update_ticket_status_by_agent(ticket_id, payload.status.value, db)
+    ticket, err = TicketService.update_ticket_status_by_agent(
+        ticket_id, payload.status.value, db, expected_versions=expected_versions, actor_id=user.user_id
+    )
     if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         return JSONResponse(status_code=400, content={"status": "error", "message": err})
 
     # ✅ Success
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": f"Ticket status updated to '{ticket.status.value}'",
@@ -473,6 +836,7 @@ def agent_update_ticket_status(
 def reopen_ticket_by_customer(
     ticket_id: int,
     db: Session = Depends(get_db),
+    if_match: str = Header(None),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
     # ✅ Authenticate customer
@@ -483,9 +847,15 @@ def reopen_ticket_by_customer(
             content={"status": "error", "message": err}
         )
 
+    expected_versions, err = ETag.parse_if_match(if_match)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
     # ✅ Service call
-    ticket, err = TicketService.reopen_ticket_by_customer(ticket_id, db, user)
+    ticket, err = TicketService.reopen_ticket_by_customer(ticket_id, db, user, expected_versions=expected_versions)
     if err:
+        if err == VERSION_CONFLICT:
+            return JSONResponse(status_code=412, content={"status": "error", "message": err})
         status_code = 403 if "Only customers" in err or "authorized" in err else 400
         return JSONResponse(
             status_code=status_code,
@@ -495,6 +865,7 @@ def reopen_ticket_by_customer(
     # ✅ Success
     return JSONResponse(
         status_code=200,
+        headers=ETag.headers(ticket.version),
         content={
             "status": "success",
             "message": "Ticket reopened successfully",
@@ -8,6 +8,7 @@ from app.services.user_service import UserService
 from app.services.address_service import AddressService
 from app.services.ticket_service import TicketService  # ← make sure this exists
 from app.utils.role_guard import RoleGuard
+from app.utils.pagination import Pagination
 from app.database import get_db
 
 user_router = APIRouter()
@@ -15,6 +16,9 @@ user_router = APIRouter()
 # 🧑‍💼 Admin: Get all users
 @user_router.get("/users")
 def get_all_users(
+    limit: int = None,
+    cursor: str = None,
+    sort: str = None,
     db: Session = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ):
@@ -25,9 +29,14 @@ def get_all_users(
     if not RoleGuard.has_role(user, ["admin", "agent", "manager"]):
         return JSONResponse(status_code=403, content={"status": "error", "message": "Access denied"})
 
-    users, err = UserRepository.get_all_users(db)
+    page, err = Pagination.parse(limit, cursor, sort, UserService.USER_SORTS)
+    if err:
+        return JSONResponse(status_code=400, content={"status": "error", "message": err})
+
+    users, err = UserRepository.get_all_users(db, page)
     if err:
         return JSONResponse(status_code=500, content={"status": "error", "message": err})
+    result = Pagination.page_of(users, page, "user_id")
 
     serialized_users = [
         {
@@ -37,7 +46,7 @@ def get_all_users(
             "role": u.role.value if hasattr(u.role, "value") else u.role,
             "created_at": str(u.created_at)
         }
-        for u in users
+        for u in result.items
     ]
 
     return JSONResponse(
@@ -45,7 +54,8 @@ def get_all_users(
         content={
             "status": "success",
             "message": "Users fetched successfully",
-            "data": serialized_users
+            "data": serialized_users,
+            "next_cursor": result.next_cursor
         }
     )
 
@@ -67,6 +77,10 @@ def get_customer_dashboard(
     if not RoleGuard.has_role(user, ["customer"]):
         return JSONResponse(status_code=403, content={"status": "error", "message": "Access denied"})
 
+    user, err = AuthMiddleware.get_user_profile(user, db)
+    if err:
+        return JSONResponse(status_code=401, content={"status": "error", "message": err})
+
     profile = {
         "name": user.name,
         "email": user.email,
@@ -0,0 +1,286 @@
+"""EXPLAIN every hot repository query against a seeded database and fail on full scans.
+
+Usage:
+    python check_query_plans.py              # seeds a throwaway in-memory SQLite database
+    python check_query_plans.py --url URL    # explains against an existing (already populated) database
+
+Exits with status 1 if any query reads tickets, address, feedback or users with a plain
+table scan, or sorts rows instead of reading them in index order. Walking an index in
+order (SQLite "SCAN ... USING INDEX", or a plain SCAN of the rowid when the query orders by
+the primary key) is accepted, since those reads follow the index and stop early once
+callers page with a LIMIT. Every keyset pagination sort order is checked
+for both the first page and a page resumed from a cursor.
+
+Also fails when the tickets table carries an index that TICKET_INDEXES does not justify, or
+one that none of the checked queries reads: every index there is paid for on each write.
+"""
+import argparse
+import re
+import sys
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.models.user import User, UserRole
+from app.models.address import Address
+from app.models.issue_category import IssueCategory
+from app.models.sla import SLA, Severity as SLASeverity, Priority as SLAPriority
+from app.models.ticket import Ticket, TicketStatus, Severity, Priority
+from app.models.feedback import Feedback
+from app.models.assignment import Assignment
+from app.models.ticket_action_log import TicketActionLog, TicketStatus as ActionLogStatus
+from app.models.refresh_token import RefreshToken
+from app.repositories.ticket_repository import TicketRepository
+from app.repositories.sla_repository import SLARepository
+from app.repositories.address_repository import AddressRepository
+from app.repositories.feedback_repository import FeedbackRepository
+from app.repositories.user_repository import UserRepository
+from app.services.ticket_service import TicketService
+from app.services.sla_service import SLAService
+from app.services.user_service import UserService
+from app.utils.pagination import PageRequest
+from app.utils.sla_thresholds import SLAThresholds, SLA_COLORS
+from app.utils.ticket_search import TicketSearchIndex
+
+CHECKED_TABLES = {"tickets", "address", "feedback", "users", "assignments", "ticket_action_logs"}
+
+# Why each index on tickets exists; main() fails on an index missing here or one no plan below uses
+TICKET_INDEXES = {
+    "ix_tickets_created_by_created_at": "a customer's own tickets (list_by_user); backs the created_by FK",
+    "ix_tickets_due_date_ticket_id_sla_critical_at_sla_warning_at":
+        "SLA dashboard order, remaining_lt and color ranges, color checked in the index; /tickets/agent/all?sort=due_date",
+    "ix_tickets_created_at": "/tickets/agent/all?sort=created_at",
+    "ix_tickets_sla_id_created_at": "/tickets/tickets/unclassified (sla_id IS NULL by created_at); backs the sla_id FK",
+    "ix_tickets_status_assigned_to_created_at": "/tickets/tickets/classified (status = new, unassigned, by created_at)",
+    "ix_tickets_assigned_to_created_at": "/tickets/tickets/assigned?sort=created_at; backs the assigned_to FK",
+    "ix_tickets_assigned_to_due_date": "/tickets/tickets/assigned?sort=due_date",
+    "ix_tickets_status_assigned_to_priority_due_date": "/tickets/tickets/next claim queue, one priority at a time by due_date",
+    "ix_tickets_issue_description_fulltext": "/tickets/tickets/search on MySQL (not created elsewhere)",
+}
+
+
+def seed(db, ticket_count=2000):
+    users = [
+        User(name=f"user{i}", email=f"user{i}@example.com", role=role, password_hash="x", created_at=datetime.utcnow())
+        for i, role in enumerate([UserRole.customer] * 20 + [UserRole.engineer] * 5 + [UserRole.agent])
+    ]
+    db.add_all(users)
+    db.add(IssueCategory(category_name="Connectivity"))
+    db.add(SLA(severity=SLASeverity.high, priority=SLAPriority.high, time_limit_hr=4))
+    db.flush()
+    customers = [u for u in users if u.role == UserRole.customer]
+    engineers = [u for u in users if u.role == UserRole.engineer]
+    addresses = [
+        Address(user_id=u.user_id, street="1 Main St", city="City", state="State", postal_code="12345", country="IN")
+        for u in customers
+    ]
+    db.add_all(addresses)
+    db.flush()
+
+    statuses = list(TicketStatus)
+    now = datetime.utcnow()
+    for i in range(ticket_count):
+        customer = customers[i % len(customers)]
+        classified = i % 3 != 0
+        status = statuses[i % len(statuses)] if classified else TicketStatus.new
+        created_at = now - timedelta(minutes=i)
+        due_date = created_at + timedelta(hours=4) if classified else None
+        warning_at, critical_at = SLAThresholds.compute(created_at, due_date) if classified else (None, None)
+        db.add(Ticket(
+            created_by=customer.user_id,
+            issue_description=f"Ticket {i}",
+            status=status,
+            severity=Severity.high if classified else None,
+            priority=Priority.high if classified else None,
+            issue_category_id=1,
+            sla_id=1 if classified else None,
+            assigned_to=engineers[i % len(engineers)].user_id if classified and status != TicketStatus.new else None,
+            address_id=addresses[i % len(addresses)].address_id,
+            created_at=created_at,
+            updated_at=now,
+            due_date=due_date,
+            sla_warning_at=warning_at,
+            sla_critical_at=critical_at
+        ))
+    db.flush()
+    db.add(Feedback(ticket_id=1, rating=5, comment="ok", feedback_time=now))
+    db.flush()
+    for i in range(ticket_count):
+        ticket_id = i + 1
+        db.add(TicketActionLog(
+            ticket_id=ticket_id, updated_by=customers[i % len(customers)].user_id, status=ActionLogStatus.new,
+            action_note="Ticket created", action_time=now - timedelta(minutes=i)
+        ))
+        if i % 3 != 0:
+            db.add(Assignment(
+                ticket_id=ticket_id, assigned_to=engineers[i % len(engineers)].user_id,
+                assigned_by=users[-1].user_id, assigned_at=now - timedelta(minutes=i)
+            ))
+    db.commit()
+
+
+def repository_queries(db):
+    """The access paths the indexes are meant to serve."""
+    return [
+        ("TicketRepository.get_tickets_by_assignee", lambda: TicketRepository.get_tickets_by_assignee(21, "assigned", db)),
+        ("TicketRepository.list_by_user", lambda: TicketRepository.list_by_user(1, db)),
+        ("TicketRepository.get_classified_tickets", lambda: TicketRepository.get_classified_tickets(db)),
+        ("TicketRepository.get_tickets_without_sla", lambda: TicketRepository.get_tickets_without_sla(db)),
+        ("SLARepository.get_tickets_with_sla_for_agent", lambda: SLARepository.get_tickets_with_sla_for_agent(datetime.utcnow(), db)),
+        ("AddressRepository.list_by_user", lambda: AddressRepository.list_by_user(1, db)),
+        ("FeedbackRepository.get_feedback_by_ticket", lambda: FeedbackRepository.get_feedback_by_ticket(1, db)),
+        ("TicketRepository.get_sla_clocks", lambda: TicketRepository.get_sla_clocks([1, 2, 3], db)),
+    ] + claim_queries(db) + search_queries(db) + sla_filter_queries(db) + paged_queries(db)
+
+
+def claim_queries(db):
+    """Each priority's claim candidates, as the compare-and-set fallback and (where supported) SKIP LOCKED read them."""
+    modes = [False]
+    if TicketRepository.claim_uses_skip_locked(db.get_bind().dialect):
+        modes.append(True)
+    return [
+        (f"TicketRepository.claim_candidates_statement priority={priority.name}{' skip_locked' if skip_locked else ''}",
+         lambda priority=priority, skip_locked=skip_locked: db.execute(
+             TicketRepository.claim_candidates_statement(priority, 8, skip_locked)
+         ).all())
+        for priority in TicketRepository.CLAIM_PRIORITY_ORDER
+        for skip_locked in modes
+    ]
+
+
+def search_queries(db):
+    """Ticket search, when the database answers it (MySQL FULLTEXT); otherwise it never reaches SQL."""
+    if not TicketSearchIndex.uses_fulltext(db.get_bind().dialect):
+        return []
+    return [("TicketRepository.search_tickets", lambda: TicketRepository.search_tickets(["ticket"], 20, db))]
+
+
+def sla_filter_queries(db):
+    """The SLA status endpoint's ?color= and ?remaining_lt= filters, alone and paged."""
+    filters = [(f"color={color}", {"color": color}) for color in SLA_COLORS] + [
+        ("remaining_lt=3600", {"remaining_lt": 3600}),
+        ("color=red remaining_lt=3600", {"color": "red", "remaining_lt": 3600}),
+    ]
+    queries = []
+    for label, kwargs in filters:
+        name = f"SLARepository.get_tickets_with_sla_for_agent {label}"
+        queries.append((name, lambda kwargs=kwargs: SLARepository.get_tickets_with_sla_for_agent(datetime.utcnow(), db, **kwargs)))
+        queries.append((f"{name} sort=due_date", lambda kwargs=kwargs: SLARepository.get_tickets_with_sla_for_agent(
+            datetime.utcnow(), db, page=PageRequest("due_date", 50), **kwargs
+        )))
+    return queries
+
+
+def paged_queries(db):
+    """Each list endpoint's repository query, once per allowed sort, on the first page and after a cursor."""
+    endpoints = [
+        ("TicketRepository.get_all_with_users", TicketService.ALL_TICKETS_SORTS,
+         lambda page: TicketRepository.get_all_with_users(db, page)),
+        ("TicketRepository.get_tickets_without_sla", TicketService.UNCLASSIFIED_SORTS,
+         lambda page: TicketRepository.get_tickets_without_sla(db, page)),
+        ("TicketRepository.get_classified_tickets", TicketService.CLASSIFIED_SORTS,
+         lambda page: TicketRepository.get_classified_tickets(db, page)),
+        ("TicketRepository.get_tickets_by_assignee", TicketService.ASSIGNED_SORTS,
+         lambda page: TicketRepository.get_tickets_by_assignee(21, None, db, page)),
+        ("SLARepository.get_tickets_with_sla_for_agent", SLAService.SLA_STATUS_SORTS,
+         lambda page: SLARepository.get_tickets_with_sla_for_agent(datetime.utcnow(), db, page=page)),
+        ("TicketRepository.get_ticket_timeline", TicketService.TIMELINE_SORTS,
+         lambda page: TicketRepository.get_ticket_timeline(1, page, db)),
+        ("UserRepository.get_all_users", UserService.USER_SORTS,
+         lambda page: UserRepository.get_all_users(db, page)),
+    ]
+    queries = []
+    for name, sorts, run in endpoints:
+        for sort in sorts:
+            key = sort.lstrip("-")
+            after = (100, 100) if key.endswith("_id") else (datetime(2025, 6, 1), 100)
+            queries.append((f"{name} sort={sort}", lambda run=run, sort=sort: run(PageRequest(sort, 50))))
+            queries.append((f"{name} sort={sort} +cursor", lambda run=run, sort=sort, after=after: run(PageRequest(sort, 50, after))))
+    return queries
+
+
+def plan_problems(conn, statement, parameters):
+    """Return the checked tables the plan reads without an index, whether it sorts rows itself, and the indexes it reads."""
+    if conn.dialect.name == "sqlite":
+        plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+        scans, sorts, indexes = [], False, set()
+        for row in plan:
+            detail = row[-1]
+            if detail.startswith("SCAN ") and "USING" not in detail:
+                scans.append(detail.split()[1])
+            if detail.startswith("USE TEMP B-TREE FOR") and "ORDER BY" in detail:
+                sorts = True
+            indexes.update(re.findall(r"USING (?:COVERING )?INDEX (\w+)", detail))
+        if "ORDER BY" in statement and not sorts:
+            scans = []  # rowid order, i.e. walking the primary key
+        return [t for t in scans if t in CHECKED_TABLES], sorts, indexes
+
+    plan = conn.exec_driver_sql("EXPLAIN " + statement, parameters).mappings().fetchall()
+    scans = [row["table"] for row in plan if row["type"] == "ALL" and row["table"] in CHECKED_TABLES]
+    # Sorting a UNION's result is expected: each branch is index-ordered and LIMITed (ticket timeline)
+    sorts = any("filesort" in (row["Extra"] or "") and not (row["table"] or "").startswith("<union") for row in plan)
+    return scans, sorts, {row["key"] for row in plan if row["key"]}
+
+
+def unjustified_indexes(engine, used):
+    """Indexes on tickets with no TICKET_INDEXES entry, or that no checked query read."""
+    problems = []
+    for index in inspect(engine).get_indexes("tickets"):
+        name = index["name"]
+        if name not in TICKET_INDEXES:
+            problems.append(f"{name}: not listed in TICKET_INDEXES")
+        elif name not in used:
+            problems.append(f"{name}: no checked query reads it ({TICKET_INDEXES[name]})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="database to explain against instead of a seeded SQLite database")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url or "sqlite://")
+    SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    if not args.url:
+        Base.metadata.create_all(bind=engine)
+        with SessionLocal() as db:
+            seed(db)
+
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    failures = 0
+    used = set()
+    with SessionLocal() as db:
+        for name, run in repository_queries(db):
+            captured.clear()
+            run()
+            statements = list(captured)
+            with engine.connect() as conn:
+                for statement, parameters in statements:
+                    scans, sorts, indexes = plan_problems(conn, statement, parameters)
+                    used |= indexes
+                    if scans:
+                        failures += 1
+                        print(f"FAIL  {name}: full scan of {', '.join(scans)}")
+                    elif sorts:
+                        failures += 1
+                        print(f"FAIL  {name}: sorts rows instead of reading an index in order")
+                    else:
+                        print(f"ok    {name}")
+
+    for problem in unjustified_indexes(engine, used):
+        failures += 1
+        print(f"FAIL  index {problem}")
+
+    if failures:
+        print(f"\n{failures} check{'' if failures == 1 else 's'} failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import os
+import tempfile
+
+# ✅ Configuration is read at import time, so it is set before anything under app/ is imported.
+# Both stacks share one SQLite file: blocking sessions through pysqlite, AsyncSession through aiosqlite.
+_DB_FILE = os.path.join(tempfile.mkdtemp(prefix="tickets-"), "tickets.db")
+for _key, _value in dict(
+    DB_USER="test", DB_PASSWORD="test", DB_HOST="localhost", DB_PORT="3306", DB_NAME="tickets",
+    SECRET_KEY="test-secret-key-test-secret-key-0000", ALGORITHM="HS256", ACCESS_TOKEN_EXPIRE_MINUTES="15"
+).items():
+    os.environ.setdefault(_key, _value)
+os.environ["TICKET_DB_MODE"] = "async"
+os.environ["ASYNC_DB_URL"] = "sqlite+aiosqlite:///" + _DB_FILE
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, event
+
+import app.database as database
+
+database.engine = create_engine("sqlite:///" + _DB_FILE, connect_args={"check_same_thread": False})
+database.SessionLocal.configure(bind=database.engine)
+
+
+def _enforce_foreign_keys(dbapi_connection, connection_record):
+    # ✅ SQLite ignores foreign keys unless asked; MySQL always enforces them
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+for _engine in (database.engine, database.async_engine.sync_engine):
+    event.listen(_engine, "connect", _enforce_foreign_keys)
+
+import app.main as main
+from app.views.auth_view import auth_router
+from app.views.ticket_view import ticket_router
+from app.models.user import User, UserRole
+from app.models.ticket import Ticket
+from app.models.assignment import Assignment
+from app.models.feedback import Feedback
+from app.models.ticket_action_log import TicketActionLog
+from passlib.hash import bcrypt
+
+PASSWORD = "pass1"
+USERS = {
+    "admin": "admin",
+    "agent": "agent",
+    "eng": "engineer",
+    "eng2": "engineer",
+    "cust": "customer",
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """The application as deployed in async mode; routes it has no async twin for fall through to sync."""
+    with TestClient(main.app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def sync_client(client):
+    """The sync ticket routes on their own, served from the same database as `client`."""
+    sync_app = FastAPI()
+    sync_app.include_router(auth_router, prefix="/auth")
+    sync_app.include_router(ticket_router, prefix="/tickets")
+    return TestClient(sync_app)
+
+
+@pytest.fixture(params=["async", "sync"])
+def api(request, client, sync_client):
+    return client if request.param == "async" else sync_client
+
+
+@pytest.fixture(scope="session")
+def seed(client):
+    """Users plus one category, SLA and customer address; returns their ids and bearer headers per user."""
+    db = database.SessionLocal()
+    try:
+        users = [
+            User(
+                name=name, email=f"{name}@example.com", role=UserRole(role),
+                password_hash=bcrypt.hash(PASSWORD), contact_number="1234567890", location="here"
+            )
+            for name, role in USERS.items()
+        ]
+        db.add_all(users)
+        db.commit()
+        ids = {user.name: user.user_id for user in users}
+    finally:
+        db.close()
+
+    headers = {}
+    for name in USERS:
+        r = client.post("/auth/login", json={"email": f"{name}@example.com", "password": PASSWORD})
+        assert r.status_code == 200, r.text
+        headers[name] = {"Authorization": "Bearer " + r.json()["access_token"]}
+
+    # ✅ Created through the API so the category catalog and SLA cache see them
+    r = client.post("/issue/category/issue-categories", json={"category_name": "network"}, headers=headers["admin"])
+    assert r.status_code == 201, r.text
+    ids["category"] = r.json()["data"]["category_id"]
+    r = client.post("/sla/slas", json={"severity": "High", "priority": "High", "time_limit_hr": 4}, headers=headers["admin"])
+    assert r.status_code == 201, r.text
+    ids["sla"] = r.json()["data"]["sla_id"]
+    r = client.post(
+        "/address/me/addresses",
+        json={"street": "1 main st", "city": "city", "state": "state", "postal_code": "12345", "country": "in"},
+        headers=headers["cust"],
+    )
+    assert r.status_code == 201, r.text
+    ids["address"] = r.json()["data"]["address_id"]
+    return {"ids": ids, "headers": headers}
+
+
+@pytest.fixture
+def new_ticket(seed):
+    """Raises a ticket as the seeded customer through the given client and returns its id."""
+    def create(api, description="router keeps dropping the connection"):
+        r = api.post(
+            "/tickets/tickets",
+            json={
+                "issue_description": description,
+                "issue_category_id": seed["ids"]["category"],
+                "address_id": seed["ids"]["address"],
+            },
+            headers=seed["headers"]["cust"],
+        )
+        assert r.status_code == 201, r.text
+        return r.json()["data"]["ticket_id"]
+    return create
+
+
+@pytest.fixture
+def no_tickets(seed):
+    """Starts from an empty ticket table, so the test sees exactly the tickets it raises."""
+    db = database.SessionLocal()
+    try:
+        for model in (TicketActionLog, Assignment, Feedback, Ticket):
+            db.execute(delete(model))
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+import app.database as database
+
+LIST_ENDPOINTS = [
+    ("agent", "/tickets/agent/all"),
+    ("agent", "/tickets/tickets/unclassified"),
+    ("agent", "/tickets/tickets/classified"),
+    ("eng2", "/tickets/tickets/assigned"),
+]
+
+
+@contextmanager
+def count_selects():
+    """Counts SELECTs issued on either engine; writes from the background action-log writer are left out."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append(statement)
+
+    engines = [database.engine, database.async_engine.sync_engine]
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def raise_tickets(api, seed, new_ticket, per_list):
+    """Adds per_list tickets to every list: left new, classified only, and classified + assigned to eng2."""
+    headers, ids = seed["headers"], seed["ids"]
+    for n in range(per_list):
+        new_ticket(api, f"outage report {n}")
+        for assign in (False, True):
+            ticket_id = new_ticket(api, f"outage report {n}")
+            r = api.patch(
+                f"/tickets/tickets/{ticket_id}/classify",
+                json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+                headers=headers["agent"],
+            )
+            assert r.status_code == 200, r.text
+            if assign:
+                r = api.put(
+                    f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng2"]}, headers=headers["agent"]
+                )
+                assert r.status_code == 200, r.text
+
+
+def list_and_count(api, seed, role, path):
+    with count_selects() as statements:
+        r = api.get(path, params={"limit": 200}, headers=seed["headers"][role])
+    assert r.status_code == 200, r.text
+    return len(r.json()["data"]), len(statements)
+
+
+@pytest.mark.parametrize("role,path", LIST_ENDPOINTS)
+def test_list_query_count_does_not_grow_with_rows(api, seed, new_ticket, no_tickets, role, path):
+    raise_tickets(api, seed, new_ticket, 1)
+    # ✅ Warms the principal and SLA caches so both measured calls see the same cache state
+    list_and_count(api, seed, role, path)
+    rows_at_1, queries_at_1 = list_and_count(api, seed, role, path)
+
+    raise_tickets(api, seed, new_ticket, 19)
+    rows_at_20, queries_at_20 = list_and_count(api, seed, role, path)
+
+    assert (rows_at_1, rows_at_20) == ((3, 60) if path.endswith("/agent/all") else (1, 20))
+    assert queries_at_20 == queries_at_1
+    assert queries_at_1 <= 3
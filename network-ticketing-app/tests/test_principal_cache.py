@@ -0,0 +1,40 @@
+import app.database as database
+from app.models.user import User, UserRole
+from app.utils.principal import Principal
+from app.utils.principal_cache import principal_cache
+
+
+def test_changed_user_is_dropped_at_commit_not_flush(seed):
+    db = database.SessionLocal()
+    try:
+        user = db.get(User, seed["ids"]["eng2"])
+        principal_cache.put(user.email, Principal.from_user(user))
+
+        user.location = "elsewhere"
+        db.flush()
+        # ✅ A request reading the still-committed row between flush and commit caches it again
+        stale = Principal.from_user(user)
+        principal_cache.put(user.email, stale)
+        assert principal_cache.get(user.email) is stale
+
+        db.commit()
+        assert principal_cache.get(user.email) is None
+    finally:
+        db.close()
+
+
+def test_rolled_back_change_keeps_the_entry(seed):
+    db = database.SessionLocal()
+    try:
+        user = db.get(User, seed["ids"]["eng2"])
+        principal = Principal.from_user(user)
+        principal_cache.put(user.email, principal)
+
+        user.role = UserRole.customer
+        db.flush()
+        db.rollback()
+
+        db.commit()
+        assert principal_cache.get(user.email) is principal
+    finally:
+        db.close()
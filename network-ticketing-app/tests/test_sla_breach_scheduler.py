@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+import app.database as database
+from app.models.ticket import Ticket, TicketStatus
+from app.tasks.sla_breach_scheduler import SLABreachScheduler
+
+
+def store(ticket_id, **values):
+    db = database.SessionLocal()
+    try:
+        db.execute(update(Ticket).where(Ticket.ticket_id == ticket_id).values(**values))
+        db.commit()
+    finally:
+        db.close()
+
+
+def overdue_ticket(client, new_ticket):
+    """A ticket whose stored deadline passed a minute ago, tracked by a scheduler that is not running."""
+    ticket_id = new_ticket(client)
+    due = datetime.utcnow().replace(microsecond=0) - timedelta(minutes=1)
+    store(ticket_id, status=TicketStatus.assigned, due_date=due)
+    scheduler = SLABreachScheduler()
+    scheduler.track(ticket_id, TicketStatus.assigned, due - timedelta(hours=2), due - timedelta(hours=1), due)
+    return ticket_id, due, scheduler
+
+
+def test_due_event_is_emitted_when_the_stored_clock_agrees(client, seed, new_ticket):
+    ticket_id, due, scheduler = overdue_ticket(client, new_ticket)
+
+    events = scheduler.confirm(scheduler.due_events(datetime.utcnow()))
+
+    assert [(e.ticket_id, e.kind) for e in events] == [(ticket_id, "breach")]
+    assert scheduler.stale_dropped == 0
+
+
+def test_event_for_a_ticket_closed_elsewhere_is_dropped(client, seed, new_ticket):
+    ticket_id, due, scheduler = overdue_ticket(client, new_ticket)
+    store(ticket_id, status=TicketStatus.closed)
+
+    assert scheduler.confirm(scheduler.due_events(datetime.utcnow())) == []
+    assert scheduler.stale_dropped == 1
+    assert scheduler.stats()["tracked_tickets"] == 0
+
+
+def test_event_for_a_ticket_reclassified_elsewhere_is_rescheduled(client, seed, new_ticket):
+    ticket_id, due, scheduler = overdue_ticket(client, new_ticket)
+    later = due + timedelta(hours=3)
+    store(ticket_id, due_date=later, sla_warning_at=later - timedelta(hours=2), sla_critical_at=later - timedelta(hours=1))
+
+    assert scheduler.confirm(scheduler.due_events(datetime.utcnow())) == []
+    assert scheduler.stale_dropped == 1
+    assert scheduler.next_fire_at() == later - timedelta(hours=2)
+
+
+def test_event_for_a_deleted_ticket_is_dropped(client, seed, new_ticket):
+    scheduler = SLABreachScheduler()
+    past = datetime.utcnow() - timedelta(minutes=1)
+    scheduler.track(10**9, TicketStatus.new, None, None, past)
+
+    assert scheduler.confirm(scheduler.due_events(datetime.utcnow())) == []
+    assert scheduler.stale_dropped == 1
+    assert scheduler.stats()["tracked_tickets"] == 0
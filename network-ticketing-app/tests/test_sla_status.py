@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+import app.database as database
+from app.models.ticket import Ticket
+from app.utils.sla_thresholds import SLAThresholds
+
+# The SLA routes have no async twin, so only the deployed app serves them
+SLA_STATUS = "/sla/agent/tickets/sla-status"
+
+# name -> (hours since created, hours until due); thresholds fall at 60% and 90% of the window
+CLOCKS = {
+    "breached": (10, -1),
+    "red": (10, 0.5),
+    "yellow": (7, 3),
+    "green": (1, 9),
+    "fresh": (0, 20),
+}
+
+
+@pytest.fixture
+def dashboard(client, seed, new_ticket, no_tickets):
+    """One classified ticket per entry in CLOCKS, with its SLA clock moved to match; returns name -> ticket_id."""
+    ids = seed["ids"]
+    tickets = {}
+    for name in CLOCKS:
+        ticket_id = new_ticket(client, f"{name} ticket")
+        r = client.patch(
+            f"/tickets/tickets/{ticket_id}/classify",
+            json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+            headers=seed["headers"]["agent"],
+        )
+        assert r.status_code == 200, r.text
+        tickets[name] = ticket_id
+
+    now = datetime.utcnow().replace(microsecond=0)
+    db = database.SessionLocal()
+    try:
+        for name, (age, left) in CLOCKS.items():
+            created_at, due_date = now - timedelta(hours=age), now + timedelta(hours=left)
+            warning_at, critical_at = SLAThresholds.compute(created_at, due_date)
+            db.execute(update(Ticket).where(Ticket.ticket_id == tickets[name]).values(
+                created_at=created_at, due_date=due_date, sla_warning_at=warning_at, sla_critical_at=critical_at
+            ))
+        db.commit()
+    finally:
+        db.close()
+    return tickets
+
+
+def status(client, seed, **params):
+    r = client.get(SLA_STATUS, params=params, headers=seed["headers"]["agent"])
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def names(dashboard, rows):
+    by_id = {ticket_id: name for name, ticket_id in dashboard.items()}
+    return [by_id[row["ticket_id"]] for row in rows]
+
+
+def test_color_filters(client, seed, dashboard):
+    for color, expected in (("red", ["breached", "red"]), ("yellow", ["yellow"]), ("green", ["green", "fresh"])):
+        rows = status(client, seed, color=color, limit=50)["data"]
+        assert names(dashboard, rows) == expected
+        assert {row["sla_status_color"] for row in rows} == {color}
+
+
+def test_remaining_lt_filter(client, seed, dashboard):
+    rows = status(client, seed, remaining_lt=4 * 3600, limit=50)["data"]
+    assert names(dashboard, rows) == ["breached", "red", "yellow"]
+    assert rows[0]["remaining_seconds"] == 0
+
+    rows = status(client, seed, remaining_lt=4 * 3600, color="yellow", limit=50)["data"]
+    assert names(dashboard, rows) == ["yellow"]
+
+
+@pytest.mark.parametrize("sort", ["due_date", "-due_date"])
+@pytest.mark.parametrize("color", [None, "green"])
+def test_cursor_pages_through_every_ticket_once(client, seed, dashboard, sort, color):
+    filters = {"sort": sort, **({"color": color} if color else {})}
+    everything = names(dashboard, status(client, seed, limit=50, **filters)["data"])
+
+    paged, cursor = [], None
+    while True:
+        body = status(client, seed, limit=1, **filters, **({"cursor": cursor} if cursor else {}))
+        paged += names(dashboard, body["data"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    order = list(CLOCKS) if sort == "due_date" else list(reversed(CLOCKS))
+    assert paged == everything == [name for name in order if color is None or name in ("green", "fresh")]
+
+
+def test_unknown_color_is_rejected(client, seed):
+    r = client.get(SLA_STATUS, params={"color": "blue"}, headers=seed["headers"]["agent"])
+    assert r.status_code == 400
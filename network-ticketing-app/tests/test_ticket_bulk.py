@@ -0,0 +1,118 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def foreign_address(client, seed):
+    """An address that exists but belongs to another user than the seeded customer."""
+    r = client.post(
+        "/address/admin/addresses",
+        json={
+            "user_id": seed["ids"]["eng"], "street": "2 side st", "city": "city", "state": "state",
+            "postal_code": "54321", "country": "in"
+        },
+        headers=seed["headers"]["admin"],
+    )
+    assert r.status_code == 201, r.text
+    return r.json()["data"]["address_id"]
+
+
+def ticket(seed, description, address_id=None):
+    return {
+        "issue_description": description,
+        "issue_category_id": seed["ids"]["category"],
+        "address_id": address_id or seed["ids"]["address"],
+    }
+
+
+def test_bulk_create_reports_each_item_in_order(api, seed, foreign_address):
+    headers = seed["headers"]
+    same = ticket(seed, "fibre cut on the street")
+    items = [same, same, ticket(seed, "wrong address", foreign_address), same, ticket(seed, "modem overheats")]
+
+    r = api.post("/tickets/tickets/bulk", json={"tickets": items}, headers=headers["cust"])
+    assert r.status_code == 207, r.text
+    data = r.json()["data"]
+    assert (data["created"], data["failed"]) == (4, 1)
+    results = data["results"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["status"] for result in results] == ["created", "created", "error", "created", "created"]
+    assert results[2]["message"] == "Chosen address does not belong to the user"
+
+    # ✅ Identical items still get their own rows, each matched back to its own position
+    ticket_ids = [result["ticket_id"] for result in results if result["status"] == "created"]
+    assert len(set(ticket_ids)) == 4
+    for result, item in zip(results, items):
+        if result["status"] != "created":
+            continue
+        r = api.get(f"/tickets/tickets/{result['ticket_id']}", headers=headers["agent"])
+        assert r.status_code == 200, r.text
+        assert r.json()["data"]["issue_description"] == item["issue_description"]
+
+
+def test_bulk_create_status_follows_the_outcome(api, seed, foreign_address):
+    headers = seed["headers"]
+    r = api.post("/tickets/tickets/bulk", json={"tickets": [ticket(seed, "all good")]}, headers=headers["cust"])
+    assert r.status_code == 201, r.text
+
+    r = api.post(
+        "/tickets/tickets/bulk", json={"tickets": [ticket(seed, "nope", foreign_address)]}, headers=headers["cust"]
+    )
+    assert r.status_code == 400
+    assert r.json()["data"]["created"] == 0
+
+    r = api.post("/tickets/tickets/bulk", json={"tickets": [ticket(seed, "agent")]}, headers=headers["agent"])
+    assert r.status_code == 403
+
+
+def test_bulk_classify_and_assign_skip_what_cannot_be_updated(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ready = new_ticket(api)
+    unclassified = new_ticket(api)
+    taken = new_ticket(api)
+    missing = 999999
+    classify = {"severity": "High", "priority": "High", "sla_id": ids["sla"]}
+
+    r = api.patch(
+        "/tickets/tickets/classify/bulk",
+        json={"ticket_ids": [ready, taken, missing, ready], **classify},
+        headers=headers["agent"],
+    )
+    assert r.status_code == 207, r.text
+    results = r.json()["data"]["results"]
+    assert [(result["ticket_id"], result["status"]) for result in results] == [
+        (ready, "classified"), (taken, "classified"), (missing, "error")
+    ]
+    r = api.put(f"/tickets/tickets/{taken}/assign", json={"assigned_to": ids["eng2"]}, headers=headers["agent"])
+    assert r.status_code == 200, r.text
+
+    r = api.put(
+        "/tickets/tickets/assign/bulk",
+        json={"ticket_ids": [ready, unclassified, taken, missing], "assigned_to": ids["eng"]},
+        headers=headers["agent"],
+    )
+    assert r.status_code == 207, r.text
+    data = r.json()["data"]
+    assert (data["assigned"], data["failed"]) == (1, 3)
+    assert [(result["ticket_id"], result["status"]) for result in data["results"]] == [
+        (ready, "assigned"), (unclassified, "error"), (taken, "error"), (missing, "error")
+    ]
+    messages = [result.get("message") for result in data["results"]]
+    assert messages[1] == "Ticket must be classified (severity, priority, SLA) before assignment"
+    assert messages[2] == "Ticket with status 'assigned' cannot be assigned"
+    assert messages[3] == "Ticket not found"
+
+    owners = {
+        ticket_id: api.get(f"/tickets/tickets/{ticket_id}", headers=headers["agent"]).json()["data"]["assigned_to"]
+        for ticket_id in (ready, unclassified, taken)
+    }
+    assert owners == {ready: ids["eng"], unclassified: None, taken: ids["eng2"]}
+
+
+def test_bulk_update_with_nothing_updatable_is_rejected(api, seed):
+    r = api.put(
+        "/tickets/tickets/assign/bulk",
+        json={"ticket_ids": [999998, 999999], "assigned_to": seed["ids"]["eng"]},
+        headers=seed["headers"]["agent"],
+    )
+    assert r.status_code == 400
+    assert r.json()["data"]["failed"] == 2
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+import app.database as database
+from app.models.ticket import Ticket, Priority
+from app.models.user import User
+from app.repositories.ticket_repository import TicketRepository
+from app.services.async_ticket_service import AsyncTicketService
+from app.services.ticket_service import TicketService
+
+PRIORITY_RANK = {Priority.high: 0, Priority.medium: 1, Priority.low: 2}
+
+
+def classified_tickets(api, seed, new_ticket, priorities):
+    """Raises and classifies one ticket per priority; due dates run opposite to creation order."""
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_ids = []
+    for priority in priorities:
+        ticket_id = new_ticket(api)
+        r = api.patch(
+            f"/tickets/tickets/{ticket_id}/classify",
+            json={"severity": "High", "priority": priority, "sla_id": ids["sla"]},
+            headers=headers["agent"],
+        )
+        assert r.status_code == 200, r.text
+        ticket_ids.append(ticket_id)
+
+    now = datetime.utcnow().replace(microsecond=0)
+    db = database.SessionLocal()
+    try:
+        for n, ticket_id in enumerate(ticket_ids):
+            db.execute(
+                update(Ticket).where(Ticket.ticket_id == ticket_id)
+                .values(due_date=now + timedelta(hours=len(ticket_ids) - n))
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+    finally:
+        db.close()
+    return ticket_ids
+
+
+def claim_order(ticket_ids):
+    db = database.SessionLocal()
+    try:
+        rows = db.execute(
+            select(Ticket.ticket_id, Ticket.priority, Ticket.due_date).where(Ticket.ticket_id.in_(ticket_ids))
+        ).all()
+    finally:
+        db.close()
+    return [row.ticket_id for row in sorted(rows, key=lambda r: (PRIORITY_RANK[r.priority], r.due_date, r.ticket_id))]
+
+
+def test_claims_follow_priority_then_due_date(api, seed, new_ticket, no_tickets):
+    ticket_ids = classified_tickets(api, seed, new_ticket, ["Low", "High", "Medium", "High", "Low", "Medium"])
+
+    claimed = []
+    while True:
+        r = api.post("/tickets/tickets/next", headers=seed["headers"]["eng"])
+        if r.status_code == 404:
+            break
+        assert r.status_code == 200, r.text
+        claimed.append(r.json()["data"]["ticket_id"])
+
+    assert claimed == claim_order(ticket_ids)
+
+
+def test_concurrent_sync_claims_never_share_a_ticket(client, seed, new_ticket, no_tickets):
+    ticket_ids = classified_tickets(client, seed, new_ticket, ["High", "Medium", "Low"] * 8)
+    engineers = [seed["ids"]["eng"], seed["ids"]["eng2"]]
+    claims, errors = [], []
+
+    def claimer(engineer_id):
+        db = database.SessionLocal()
+        try:
+            user = db.get(User, engineer_id)
+            while True:
+                ticket, err = TicketService.claim_next_ticket(user, db)
+                if err == "No tickets waiting to be claimed":
+                    return
+                if err:
+                    errors.append(err)
+                    return
+                claims.append((ticket.ticket_id, engineer_id))
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=claimer, args=(engineers[n % 2],)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert_claimed_once(ticket_ids, claims)
+
+
+def test_concurrent_async_claims_never_share_a_ticket(client, seed, new_ticket, no_tickets):
+    ticket_ids = classified_tickets(client, seed, new_ticket, ["High", "Medium", "Low"] * 8)
+    engineers = [seed["ids"]["eng"], seed["ids"]["eng2"]]
+
+    async def claimer(engineer_id):
+        claims = []
+        async with database.AsyncSessionLocal() as db:
+            user = await db.get(User, engineer_id)
+            while True:
+                ticket, err = await AsyncTicketService.claim_next_ticket(user, db)
+                if err == "No tickets waiting to be claimed":
+                    return claims
+                assert err is None, err
+                claims.append((ticket.ticket_id, engineer_id))
+
+    async def run():
+        # ✅ Pooled aiosqlite connections belong to the app's event loop; this test runs its own
+        await database.async_engine.dispose()
+        results = await asyncio.gather(*(claimer(engineers[n % 2]) for n in range(8)))
+        await database.async_engine.dispose()
+        return [claim for claims in results for claim in claims]
+
+    assert_claimed_once(ticket_ids, asyncio.run(run()))
+
+
+def assert_claimed_once(ticket_ids, claims):
+    claimed_ids = [ticket_id for ticket_id, _ in claims]
+    assert sorted(claimed_ids) == sorted(ticket_ids)
+
+    db = database.SessionLocal()
+    try:
+        assignees = dict(db.execute(select(Ticket.ticket_id, Ticket.assigned_to).where(Ticket.ticket_id.in_(ticket_ids))).all())
+    finally:
+        db.close()
+    assert assignees == dict(claims)
+
+
+@pytest.mark.parametrize("priority", TicketRepository.CLAIM_PRIORITY_ORDER)
+def test_claim_candidates_read_one_priority_in_due_order(priority):
+    sql = str(TicketRepository.claim_candidates_statement(priority, 8, skip_locked=False).compile())
+    assert "CASE" not in sql
+    assert "ORDER BY tickets.due_date, tickets.ticket_id" in sql
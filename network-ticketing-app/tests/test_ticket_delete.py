@@ -0,0 +1,56 @@
+from sqlalchemy import func, select
+
+import app.database as database
+from app.models.assignment import Assignment
+from app.models.ticket import TicketStatus
+from app.models.ticket_action_log import TicketActionLog
+from app.tasks.action_log_writer import TicketActionLogWriter, action_log_writer
+
+
+def count_rows(model, ticket_id):
+    db = database.SessionLocal()
+    try:
+        return db.execute(select(func.count()).select_from(model).where(model.ticket_id == ticket_id)).scalar_one()
+    finally:
+        db.close()
+
+
+def test_delete_removes_action_logs_and_assignments(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    r = api.patch(
+        f"/tickets/tickets/{ticket_id}/classify",
+        json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+        headers=headers["agent"],
+    )
+    assert r.status_code == 200, r.text
+    r = api.put(f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng"]}, headers=headers["agent"])
+    assert r.status_code == 200, r.text
+    action_log_writer.flush()
+    assert count_rows(TicketActionLog, ticket_id) > 0
+    assert count_rows(Assignment, ticket_id) == 1
+
+    r = api.delete(f"/tickets/{ticket_id}/delete", headers=headers["cust"])
+    assert r.status_code == 200, r.text
+
+    assert count_rows(TicketActionLog, ticket_id) == 0
+    assert count_rows(Assignment, ticket_id) == 0
+
+
+def test_flush_rejects_rows_for_deleted_tickets(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    gone_id = new_ticket(api)
+    r = api.delete(f"/tickets/{gone_id}/delete", headers=headers["cust"])
+    assert r.status_code == 200, r.text
+
+    writer = TicketActionLogWriter()
+    writer.record(ticket_id, ids["agent"], TicketStatus.new, "before")
+    writer.record(gone_id, ids["agent"], TicketStatus.new, "logged after the delete")
+    writer.record(ticket_id, ids["agent"], TicketStatus.new, "after")
+
+    assert writer.flush() == 2
+    assert writer.flush() == 0
+    stats = writer.stats()
+    assert (stats["pending"], stats["written"], stats["rejected"], stats["failed_flushes"]) == (0, 2, 1, 0)
+    assert count_rows(TicketActionLog, gone_id) == 0
@@ -0,0 +1,36 @@
+from sqlalchemy import event
+
+import app.database as database
+from app.utils.ticket_events import ticket_event_bus
+
+
+def test_transition_publishes_owners_without_reading_the_ticket_back(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    api.patch(
+        f"/tickets/tickets/{ticket_id}/classify",
+        json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+        headers=headers["agent"],
+    )
+    api.put(f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng"]}, headers=headers["agent"])
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if "tickets" in statement and "ticket_action_logs" not in statement:
+            statements.append(statement.lstrip().split()[0].upper())
+
+    engines = [database.engine, database.async_engine.sync_engine]
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        r = api.put(f"/tickets/tickets/{ticket_id}/start", headers=headers["eng"])
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    assert r.status_code == 200, r.text
+
+    # ✅ SQLite has UPDATE ... RETURNING, so the transition is the only statement on tickets
+    assert statements == ["UPDATE"]
+    changed = [e for e in ticket_event_bus._buffer if e.kind == "status_changed" and e.ticket_id == ticket_id]
+    assert [(e.created_by, e.assigned_to, e.data["status"]) for e in changed] == [(ids["cust"], ids["eng"], "in_progress")]
@@ -0,0 +1,110 @@
+import pytest
+
+from app.database import async_engine
+from app.repositories.ticket_repository import TicketRepository
+
+
+def test_async_mode_uses_aiosqlite():
+    assert async_engine is not None
+    assert async_engine.dialect.driver == "aiosqlite"
+
+
+def test_create_and_read_ticket(api, seed, new_ticket):
+    ticket_id = new_ticket(api, "fibre link down since morning")
+
+    r = api.get(f"/tickets/tickets/{ticket_id}", headers=seed["headers"]["agent"])
+    assert r.status_code == 200, r.text
+    body = r.json()["data"]
+    assert body["issue_description"] == "fibre link down since morning"
+    assert body["status"] == "new"
+    assert r.headers["ETag"]
+
+
+def test_create_rejects_foreign_address(api, seed):
+    r = api.post(
+        "/tickets/tickets",
+        json={"issue_description": "x", "issue_category_id": seed["ids"]["category"], "address_id": 999999},
+        headers=seed["headers"]["cust"],
+    )
+    assert r.status_code == 500
+    assert r.json()["message"] == "Chosen address does not belong to the user"
+
+
+def test_classify_assign_start_resolve(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+
+    r = api.patch(
+        f"/tickets/tickets/{ticket_id}/classify",
+        json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+        headers=headers["agent"],
+    )
+    assert r.status_code == 200, r.text
+
+    r = api.put(f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng"]}, headers=headers["agent"])
+    assert r.status_code == 200, r.text
+
+    r = api.get("/tickets/tickets/assigned", headers=headers["eng"])
+    assert r.status_code == 200, r.text
+    assert ticket_id in [t["ticket_id"] for t in r.json()["data"]]
+
+    r = api.put(f"/tickets/tickets/{ticket_id}/start", headers=headers["eng2"])
+    assert r.status_code == 403
+
+    r = api.put(f"/tickets/tickets/{ticket_id}/start", headers=headers["eng"])
+    assert r.status_code == 200, r.text
+    assert r.json()["data"]["status"] == "in_progress"
+
+    r = api.patch(f"/tickets/tickets/{ticket_id}/status", json={"status": "resolved"}, headers=headers["eng"])
+    assert r.status_code == 200, r.text
+    assert r.json()["data"]["status"] == "resolved"
+
+
+def test_stale_if_match_is_rejected(api, seed, new_ticket):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    edit = {"issue_category_id": ids["category"], "address_id": ids["address"]}
+    etag = api.get(f"/tickets/tickets/{ticket_id}", headers=headers["agent"]).headers["ETag"]
+
+    r = api.put(f"/tickets/{ticket_id}/edit", json={**edit, "issue_description": "updated"}, headers={**headers["cust"], "If-Match": etag})
+    assert r.status_code == 200, r.text
+
+    r = api.put(f"/tickets/{ticket_id}/edit", json={**edit, "issue_description": "again"}, headers={**headers["cust"], "If-Match": etag})
+    assert r.status_code == 412
+
+
+def test_customer_deletes_own_ticket(api, seed, new_ticket):
+    headers = seed["headers"]
+    ticket_id = new_ticket(api)
+
+    r = api.delete(f"/tickets/{ticket_id}/delete", headers=headers["cust"])
+    assert r.status_code == 200, r.text
+
+    r = api.get(f"/tickets/tickets/{ticket_id}", headers=headers["agent"])
+    assert r.status_code == 404
+
+
+@pytest.mark.parametrize("returning", [True, False], ids=["returning", "read-back"])
+def test_transition_without_if_match_returns_current_etag(api, seed, new_ticket, monkeypatch, returning):
+    # read-back is the MySQL path, which has no UPDATE ... RETURNING
+    monkeypatch.setattr(TicketRepository, "returns_updated_rows", staticmethod(lambda dialect: returning))
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    api.patch(
+        f"/tickets/tickets/{ticket_id}/classify",
+        json={"severity": "High", "priority": "High", "sla_id": ids["sla"]},
+        headers=headers["agent"],
+    )
+    api.put(f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng"]}, headers=headers["agent"])
+
+    r = api.put(f"/tickets/tickets/{ticket_id}/start", headers=headers["eng"])
+    assert r.status_code == 200, r.text
+    etag = r.headers["ETag"]
+    assert etag == api.get(f"/tickets/tickets/{ticket_id}", headers=headers["agent"]).headers["ETag"]
+
+    # ✅ The returned ETag is immediately usable as the next If-Match
+    r = api.patch(
+        f"/tickets/tickets/{ticket_id}/status", json={"status": "resolved"}, headers={**headers["eng"], "If-Match": etag}
+    )
+    assert r.status_code == 200, r.text
+    assert r.headers["ETag"] != etag
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pytest
+
+SEARCH = "/tickets/tickets/search"
+
+
+@pytest.fixture
+def word():
+    """A word no other ticket holds, so each test only finds the tickets it raises."""
+    return "zq" + uuid4().hex[:10]
+
+
+def search(api, seed, q, **params):
+    r = api.get(SEARCH, params={"q": q, **params}, headers=seed["headers"]["agent"])
+    assert r.status_code == 200, r.text
+    return [hit["ticket_id"] for hit in r.json()["data"]]
+
+
+def test_best_match_comes_first(api, seed, new_ticket, word):
+    once = new_ticket(api, f"{word} fibre link flapping since the storm, customer reports slow speeds all evening")
+    thrice = new_ticket(api, f"{word} {word} {word} down")
+    new_ticket(api, "modem lights are off")
+
+    assert search(api, seed, word) == [thrice, once]
+
+
+def test_every_word_must_match_by_prefix(api, seed, new_ticket, word):
+    router = new_ticket(api, f"{word} router reboots every hour")
+    new_ticket(api, f"{word} billing address is wrong")
+    new_ticket(api, "router reboots every hour")
+
+    assert search(api, seed, f"{word} rout") == [router]
+    assert search(api, seed, f"{word} nonexistentword") == []
+
+
+def test_limit_caps_the_results(api, seed, new_ticket, word):
+    for n in range(3):
+        new_ticket(api, f"{word} outage {n}")
+
+    assert len(search(api, seed, word, limit=2)) == 2
+    r = api.get(SEARCH, params={"q": word, "limit": 0}, headers=seed["headers"]["agent"])
+    assert r.status_code == 400
+
+
+def test_edits_and_deletes_reach_the_index(api, seed, new_ticket, word):
+    headers, ids = seed["headers"], seed["ids"]
+    edited = new_ticket(api, "dns lookups time out")
+    deleted = new_ticket(api, f"{word} dns lookups time out")
+
+    r = api.put(
+        f"/tickets/{edited}/edit",
+        json={"issue_description": f"{word} dns lookups time out", "issue_category_id": ids["category"], "address_id": ids["address"]},
+        headers=headers["cust"],
+    )
+    assert r.status_code == 200, r.text
+    r = api.delete(f"/tickets/{deleted}/delete", headers=headers["cust"])
+    assert r.status_code == 200, r.text
+
+    assert search(api, seed, word) == [edited]
+
+
+@pytest.mark.parametrize("q", ["", "  ", "a !"])
+def test_query_without_words_is_rejected(api, seed, q):
+    r = api.get(SEARCH, params={"q": q}, headers=seed["headers"]["agent"])
+    assert r.status_code == 400
+
+
+def test_customers_cannot_search(api, seed):
+    r = api.get(SEARCH, params={"q": "router"}, headers=seed["headers"]["cust"])
+    assert r.status_code == 403
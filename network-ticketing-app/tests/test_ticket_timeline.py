@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import pytest
+
+import app.database as database
+from app.models.assignment import Assignment
+from app.models.feedback import Feedback
+from app.models.ticket_action_log import TicketActionLog, TicketStatus
+from app.tasks.action_log_writer import action_log_writer
+
+AT = datetime(2030, 1, 1, 12, 0, 0)
+
+
+def add_events_at_one_instant(seed, ticket_id):
+    """Two events from each source, interleaved by id, all stamped with the same time."""
+    ids = seed["ids"]
+    db = database.SessionLocal()
+    try:
+        for n in range(2):
+            db.add(TicketActionLog(
+                ticket_id=ticket_id, updated_by=ids["agent"], status=TicketStatus.new, action_note=f"log {n}", action_time=AT
+            ))
+            db.add(Assignment(ticket_id=ticket_id, assigned_to=ids[("eng", "eng2")[n]], assigned_by=ids["agent"], assigned_at=AT))
+            db.add(Feedback(ticket_id=ticket_id, rating=n + 1, comment=f"feedback {n}", feedback_time=AT))
+            db.flush()
+        db.commit()
+    finally:
+        db.close()
+
+
+def describe(event):
+    return (event["type"], event["at"], event.get("note"), event.get("assigned_to"), event.get("comment"))
+
+
+def read_pages(api, seed, ticket_id, limit, sort=None):
+    events, cursor = [], None
+    for _ in range(50):
+        params = {"limit": limit, **({"sort": sort} if sort else {}), **({"cursor": cursor} if cursor else {})}
+        r = api.get(f"/tickets/tickets/{ticket_id}/timeline", params=params, headers=seed["headers"]["agent"])
+        assert r.status_code == 200, r.text
+        body = r.json()
+        events += [describe(event) for event in body["data"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return events
+    pytest.fail("timeline paging did not terminate")
+
+
+@pytest.mark.parametrize("sort", [None, "-event_time"])
+def test_paging_one_event_at_a_time_skips_and_repeats_nothing(api, seed, new_ticket, sort):
+    ticket_id = new_ticket(api)
+    action_log_writer.flush()
+    add_events_at_one_instant(seed, ticket_id)
+
+    everything = read_pages(api, seed, ticket_id, 200, sort)
+    one_by_one = read_pages(api, seed, ticket_id, 1, sort)
+
+    assert one_by_one == everything
+    tied = [event for event in everything if event[1] == AT.isoformat()]
+    assert len(tied) == 6
+    assert len(set(tied)) == 6
+    times = [event[1] for event in everything]
+    assert times == sorted(times, reverse=sort is not None)
@@ -0,0 +1,45 @@
+import pytest
+
+from app.utils.workload_index import workload_index
+
+
+def load_of(engineer_id):
+    return workload_index.stats()["loads"][str(engineer_id)]
+
+
+def classify(api, seed, ticket_id, level):
+    r = api.patch(
+        f"/tickets/tickets/{ticket_id}/classify",
+        json={"severity": level, "priority": level, "sla_id": seed["ids"]["sla"]},
+        headers=seed["headers"]["agent"],
+    )
+    assert r.status_code == 200, r.text
+
+
+def bulk_classify(api, seed, ticket_id, level):
+    r = api.patch(
+        "/tickets/tickets/classify/bulk",
+        json={"ticket_ids": [ticket_id], "severity": level, "priority": level, "sla_id": seed["ids"]["sla"]},
+        headers=seed["headers"]["agent"],
+    )
+    assert r.status_code == 200, r.text
+
+
+@pytest.mark.parametrize("reclassify", [classify, bulk_classify], ids=["single", "bulk"])
+def test_reclassifying_an_assigned_ticket_reweighs_its_engineer(api, seed, new_ticket, reclassify):
+    headers, ids = seed["headers"], seed["ids"]
+    ticket_id = new_ticket(api)
+    classify(api, seed, ticket_id, "Low")
+    before = load_of(ids["eng"])
+    r = api.put(f"/tickets/tickets/{ticket_id}/assign", json={"assigned_to": ids["eng"]}, headers=headers["agent"])
+    assert r.status_code == 200, r.text
+    # Low priority + Low severity weigh 1 + 1
+    assert load_of(ids["eng"]) == before + 2
+
+    reclassify(api, seed, ticket_id, "High")
+    # High priority + High severity weigh 3 + 3
+    assert load_of(ids["eng"]) == before + 6
+
+    r = api.patch(f"/tickets/tickets/{ticket_id}/status", json={"status": "resolved"}, headers=headers["eng"])
+    assert r.status_code == 200, r.text
+    assert load_of(ids["eng"]) == before